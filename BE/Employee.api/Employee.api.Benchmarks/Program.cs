@@ -0,0 +1,6 @@
+using BenchmarkDotNet.Running;
+
+// dotnet run -c Release -- --filter *QueryBenchmarks*
+// dotnet run -c Release -- --filter *SortBenchmarks*   (no database needed)
+// dotnet run -c Release -- --filter *SerializationBenchmarks*   (no database needed)
+BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(args);
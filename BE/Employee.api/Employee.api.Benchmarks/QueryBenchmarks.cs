@@ -0,0 +1,96 @@
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using Employee.api.Helpers;
+using Employee.api.Model;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using System.Linq.Dynamic.Core;
+
+namespace Employee.api.Benchmarks
+{
+    /// <summary>
+    /// One "request" per invocation: get a context, run the query, dispose the context.
+    /// Baseline = what the API did before (new context per request, LINQ translated every time);
+    /// the other method in each category is the pooled context + compiled query now used by the controllers.
+    /// Needs a populated database: set EMPLOYEE_BENCH_DB to its connection string.
+    /// </summary>
+    [MemoryDiagnoser]
+    [CategoriesColumn]
+    [GroupBenchmarksBy(BenchmarkLogicalGroupRule.ByCategory)]
+    public class QueryBenchmarks
+    {
+        private DbContextOptions<EmployeeDbContext> _options = null!;
+        private PooledDbContextFactory<EmployeeDbContext> _pool = null!;
+        private int _employeeId;
+        private string _email = string.Empty;
+        private readonly QueryParameters _page = new() { PageNumber = 3, PageSize = 10, SortBy = "name", SortOrder = "asc" };
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var connectionString = Environment.GetEnvironmentVariable("EMPLOYEE_BENCH_DB")
+                ?? "Server=localhost;Database=employeeManagerDb;Trusted_Connection=True;TrustServerCertificate=True";
+            _options = new DbContextOptionsBuilder<EmployeeDbContext>().UseSqlServer(connectionString).Options;
+            _pool = new PooledDbContextFactory<EmployeeDbContext>(_options);
+
+            using var context = new EmployeeDbContext(_options);
+            var sample = context.Employees.AsNoTracking().OrderBy(e => e.EmployeeId).First();
+            _employeeId = sample.EmployeeId;
+            _email = sample.Email;
+        }
+
+        [Benchmark(Baseline = true), BenchmarkCategory("GetById")]
+        public async Task<Model.Employee?> GetById_NewContext_Linq()
+        {
+            await using var context = new EmployeeDbContext(_options);
+            return await context.Employees.AsNoTracking().FirstOrDefaultAsync(e => e.EmployeeId == _employeeId);
+        }
+
+        [Benchmark, BenchmarkCategory("GetById")]
+        public async Task<Model.Employee?> GetById_Pooled_Compiled()
+        {
+            await using var context = _pool.CreateDbContext();
+            return await CompiledQueries.EmployeeById(context, _employeeId);
+        }
+
+        [Benchmark(Baseline = true), BenchmarkCategory("Login")]
+        public async Task<Model.Employee?> LoginLookup_NewContext_Linq()
+        {
+            await using var context = new EmployeeDbContext(_options);
+            return await context.Employees.FirstOrDefaultAsync(e => e.Email == _email);
+        }
+
+        [Benchmark, BenchmarkCategory("Login")]
+        public async Task<Model.Employee?> LoginLookup_Pooled_Compiled()
+        {
+            await using var context = _pool.CreateDbContext();
+            return await CompiledQueries.EmployeeByEmail(context, _email);
+        }
+
+        [Benchmark(Baseline = true), BenchmarkCategory("ListPage")]
+        public async Task<Helpers.PagedResult<EmployeeListItem>> ListPage_NewContext_DynamicLinq()
+        {
+            await using var context = new EmployeeDbContext(_options);
+            var rows = from e in context.Employees.AsNoTracking().OrderBy(_page.SortBy!)
+                       join des in context.Designations on e.DesignationId equals des.DesignationId
+                       join dep in context.Departments on des.DepartmentId equals dep.DepartmentId
+                       select new EmployeeListItem
+                       {
+                           EmployeeId = e.EmployeeId, Name = e.Name, Email = e.Email, ContactNo = e.ContactNo,
+                           City = e.City, State = e.State, Pincode = e.Pincode,
+                           DesignationId = e.DesignationId, DesignationName = des.DesignationName,
+                           DepartmentId = dep.DepartmentId, DepartmentName = dep.DepartmentName, CreateDate = e.CreateDate
+                       };
+            return await rows.ToPagedResultAsync(_page);
+        }
+
+        [Benchmark, BenchmarkCategory("ListPage")]
+        public async Task<Helpers.PagedResult<EmployeeListItem>> ListPage_Pooled_Compiled()
+        {
+            await using var context = _pool.CreateDbContext();
+            var totalCount = await CompiledQueries.EmployeeCount(context);
+            var skip = (_page.PageNumber - 1) * _page.PageSize;
+            return await CompiledQueries.EmployeePageByName(context, skip, _page.PageSize).ToPagedResultAsync(totalCount, _page);
+        }
+    }
+}
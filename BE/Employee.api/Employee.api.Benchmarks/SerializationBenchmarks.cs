@@ -0,0 +1,104 @@
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using Employee.api.Helpers;
+using Employee.api.Model;
+using System.IO.Compression;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
+
+namespace Employee.api.Benchmarks
+{
+    /// <summary>
+    /// CPU and allocations for writing the list responses, and what compression does to their size.
+    /// Baseline = the JSON options the API had before (camelCase, reflection metadata, nulls written);
+    /// the other serialisation method uses the Program.cs options (source-generated context, nulls skipped).
+    /// Payload sizes are printed once in the setup output. Runs without a database.
+    /// </summary>
+    [MemoryDiagnoser]
+    [CategoriesColumn]
+    [GroupBenchmarksBy(BenchmarkLogicalGroupRule.ByCategory)]
+    public class SerializationBenchmarks
+    {
+        private readonly JsonSerializerOptions _reflectionOptions = new()
+        {
+            PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+            TypeInfoResolver = new DefaultJsonTypeInfoResolver()
+        };
+
+        private readonly JsonSerializerOptions _generatedOptions = new()
+        {
+            PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+            TypeInfoResolver = JsonTypeInfoResolver.Combine(ApiJsonSerializerContext.Default, new DefaultJsonTypeInfoResolver())
+        };
+
+        private ApiResponse _employeePage = null!;
+        private ApiResponse _departmentPage = null!;
+        private byte[] _employeePageBytes = Array.Empty<byte>();
+
+        [Params(10, 50)]
+        public int PageSize { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var employees = Enumerable.Range(1, PageSize).Select(i => new EmployeeListItem
+            {
+                EmployeeId = i,
+                Name = $"Nguyễn Văn {i}",
+                Email = $"nguyenvan{i}@example.com",
+                ContactNo = $"09{i:D8}",
+                City = i % 2 == 0 ? "Hồ Chí Minh" : "Hà Nội",
+                State = i % 2 == 0 ? "HCM" : "HN",
+                Pincode = "700000",
+                DesignationId = i % 5 + 1,
+                DesignationName = "Developer",
+                DepartmentId = i % 3 + 1,
+                DepartmentName = "IT",
+                CreateDate = new DateTime(2025, 1, 1).AddDays(i)
+            }).ToList();
+            var departments = Enumerable.Range(1, PageSize)
+                .Select(i => new Department { DepartmentId = i, DepartmentName = $"Phòng ban {i}", IsActive = i % 4 != 0 })
+                .ToList();
+
+            _employeePage = new ApiResponse(200, new PagedResult<EmployeeListItem>(employees, 1000, 1, PageSize));
+            _departmentPage = new ApiResponse(200, new PagedResult<Department>(departments, 1000, 1, PageSize));
+            _employeePageBytes = JsonSerializer.SerializeToUtf8Bytes(_employeePage, _generatedOptions);
+
+            Console.WriteLine($"// Employee page ({PageSize} rows): reflection {JsonSerializer.SerializeToUtf8Bytes(_employeePage, _reflectionOptions).Length} B, " +
+                $"generated {_employeePageBytes.Length} B, brotli {Brotli().Length} B, gzip {Gzip().Length} B");
+            Console.WriteLine($"// Department page ({PageSize} rows): reflection {JsonSerializer.SerializeToUtf8Bytes(_departmentPage, _reflectionOptions).Length} B, " +
+                $"generated {JsonSerializer.SerializeToUtf8Bytes(_departmentPage, _generatedOptions).Length} B");
+        }
+
+        [Benchmark(Baseline = true), BenchmarkCategory("EmployeePage")]
+        public byte[] EmployeePage_Reflection() => JsonSerializer.SerializeToUtf8Bytes(_employeePage, _reflectionOptions);
+
+        [Benchmark, BenchmarkCategory("EmployeePage")]
+        public byte[] EmployeePage_SourceGenerated() => JsonSerializer.SerializeToUtf8Bytes(_employeePage, _generatedOptions);
+
+        [Benchmark(Baseline = true), BenchmarkCategory("DepartmentPage")]
+        public byte[] DepartmentPage_Reflection() => JsonSerializer.SerializeToUtf8Bytes(_departmentPage, _reflectionOptions);
+
+        [Benchmark, BenchmarkCategory("DepartmentPage")]
+        public byte[] DepartmentPage_SourceGenerated() => JsonSerializer.SerializeToUtf8Bytes(_departmentPage, _generatedOptions);
+
+        // Extra CPU the server spends per response at the configured level (Fastest)
+        [Benchmark(Baseline = true), BenchmarkCategory("Compress")]
+        public byte[] Gzip() => Compress(stream => new GZipStream(stream, CompressionLevel.Fastest));
+
+        [Benchmark, BenchmarkCategory("Compress")]
+        public byte[] Brotli() => Compress(stream => new BrotliStream(stream, CompressionLevel.Fastest));
+
+        private byte[] Compress(Func<Stream, Stream> wrap)
+        {
+            using var output = new MemoryStream();
+            using (var compressor = wrap(output))
+            {
+                compressor.Write(_employeePageBytes);
+            }
+            return output.ToArray();
+        }
+    }
+}
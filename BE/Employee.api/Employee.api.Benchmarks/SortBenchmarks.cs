@@ -0,0 +1,67 @@
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using Employee.api.Helpers;
+using Employee.api.Model;
+using Microsoft.EntityFrameworkCore;
+using System.Linq.Dynamic.Core;
+
+namespace Employee.api.Benchmarks
+{
+    /// <summary>
+    /// Cost of turning sortBy/sortOrder into an ordered query, with no database round trip.
+    /// Baseline = System.Linq.Dynamic.Core parsing the sort string (what the controllers did before);
+    /// the other method is <see cref="SortRegistries.Employees"/>. "Build" only composes the IQueryable,
+    /// "Translate" also generates the SQL. Runs without a database; the connection string is never opened.
+    /// </summary>
+    [MemoryDiagnoser]
+    [CategoriesColumn]
+    [GroupBenchmarksBy(BenchmarkLogicalGroupRule.ByCategory)]
+    public class SortBenchmarks
+    {
+        private EmployeeDbContext _context = null!;
+        private IQueryable<EmployeeListItem> _rows = null!;
+        private string _dynamicOrdering = string.Empty;
+
+        [Params("name", "departmentName,name:desc", "city:desc,state,createDate:desc")]
+        public string SortBy { get; set; } = string.Empty;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var options = new DbContextOptionsBuilder<EmployeeDbContext>()
+                .UseSqlServer("Server=localhost;Database=employeeManagerDb;Trusted_Connection=True;TrustServerCertificate=True")
+                .Options;
+            _context = new EmployeeDbContext(options);
+            _rows = from e in _context.Employees.AsNoTracking()
+                    join des in _context.Designations on e.DesignationId equals des.DesignationId
+                    join dep in _context.Departments on des.DepartmentId equals dep.DepartmentId
+                    select new EmployeeListItem
+                    {
+                        EmployeeId = e.EmployeeId, Name = e.Name, Email = e.Email, ContactNo = e.ContactNo,
+                        City = e.City, State = e.State, Pincode = e.Pincode,
+                        DesignationId = e.DesignationId, DesignationName = des.DesignationName,
+                        DepartmentId = dep.DepartmentId, DepartmentName = dep.DepartmentName, CreateDate = e.CreateDate
+                    };
+
+            // Same ordering in Dynamic LINQ syntax, tie-breaker included so both sides produce identical SQL
+            var terms = SortRegistries.Employees.Parse(SortBy, "asc");
+            _dynamicOrdering = string.Join(", ", terms.Select(t => $"{t.Column} {(t.Descending ? "descending" : "ascending")}"))
+                + $", {SortRegistries.Employees.KeyName} {(terms[0].Descending ? "descending" : "ascending")}";
+        }
+
+        [GlobalCleanup]
+        public void Cleanup() => _context.Dispose();
+
+        [Benchmark(Baseline = true), BenchmarkCategory("Build")]
+        public IQueryable<EmployeeListItem> Build_DynamicLinq() => _rows.OrderBy(_dynamicOrdering);
+
+        [Benchmark, BenchmarkCategory("Build")]
+        public IQueryable<EmployeeListItem> Build_SortRegistry() => SortRegistries.Employees.Apply(_rows, SortBy, "asc");
+
+        [Benchmark(Baseline = true), BenchmarkCategory("Translate")]
+        public string Translate_DynamicLinq() => _rows.OrderBy(_dynamicOrdering).Take(10).ToQueryString();
+
+        [Benchmark, BenchmarkCategory("Translate")]
+        public string Translate_SortRegistry() => SortRegistries.Employees.Apply(_rows, SortBy, "asc").Take(10).ToQueryString();
+    }
+}
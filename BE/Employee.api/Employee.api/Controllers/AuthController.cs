@@ -1,5 +1,6 @@
 using Employee.api.Helpers;
 using Employee.api.Model;
+using Employee.api.Services;
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.EntityFrameworkCore;
 using Microsoft.IdentityModel.Tokens;
@@ -15,11 +16,16 @@ namespace Employee.api.Controllers
     {
         private readonly EmployeeDbContext _context;
         private readonly IConfiguration _configuration;
+        private readonly PasswordHashingQueue _passwordHashing;
+        private readonly ILogger<AuthController> _logger;
 
-        public AuthController(EmployeeDbContext context, IConfiguration configuration)
+        public AuthController(EmployeeDbContext context, IConfiguration configuration, PasswordHashingQueue passwordHashing,
+            ILogger<AuthController> logger)
         {
             _context = context;
             _configuration = configuration;
+            _passwordHashing = passwordHashing;
+            _logger = logger;
         }
 
         [HttpPost("login")]
@@ -27,16 +33,31 @@ namespace Employee.api.Controllers
         {
             try
             {
-                var employee = await _context.Employees.FirstOrDefaultAsync(e => e.Email == request.email);
+                var employee = await CompiledQueries.EmployeeByEmail(_context, request.email);
 
-                if (employee == null || !BCrypt.Net.BCrypt.Verify(request.password, employee.Password))
+                var verification = employee == null
+                    ? PasswordVerification.Failed
+                    : await _passwordHashing.VerifyAsync(request.password, employee.Password);
+
+                if (employee == null || verification == PasswordVerification.Failed)
                 {
                     return Unauthorized(new ApiResponse(401, null, "Invalid credentials.", ErrorCodes.Validation));
                 }
 
+                // Work factor was raised since this hash was made: upgrade it now that we have the plain password
+                if (verification == PasswordVerification.SuccessRehashNeeded)
+                {
+                    await TryRehashAsync(employee, request.password);
+                }
+
                 var token = GenerateJwtToken(employee);
                 
-                return Ok(new ApiResponse(200, new { Token = token }, "Login successful."));
+                return Ok(new ApiResponse(200, new LoginResponse { Token = token }, "Login successful."));
+            }
+            catch (PasswordQueueFullException)
+            {
+                Response.Headers.RetryAfter = "1";
+                return StatusCode(503, new ApiResponse(503, null, ErrorMessages.ServerBusy, ErrorCodes.ServerBusy));
             }
             catch (Exception)
             {
@@ -44,6 +65,25 @@ namespace Employee.api.Controllers
             }
         }
 
+        private async Task TryRehashAsync(Model.Employee employee, string password)
+        {
+            try
+            {
+                employee.Password = await _passwordHashing.HashAsync(password);
+                await _context.SaveChangesAsync();
+            }
+            catch (PasswordQueueFullException)
+            {
+                // Not worth failing the login over; the next login retries the upgrade
+            }
+            catch (DbUpdateException ex)
+            {
+                // Same here (includes concurrency conflicts): the password was verified, keep the old hash
+                _logger.LogWarning(ex, "Could not save the upgraded password hash for employee {EmployeeId}", employee.EmployeeId);
+                _context.ChangeTracker.Clear();
+            }
+        }
+
         private string GenerateJwtToken(Model.Employee employee)
         {
             var jwtKey = _configuration["Jwt:Key"] ?? throw new InvalidOperationException("JWT Key not found");
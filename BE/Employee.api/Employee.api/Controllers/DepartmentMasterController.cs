@@ -1,9 +1,9 @@
 ﻿using Employee.api.Helpers;
 using Employee.api.Model;
+using Employee.api.Services;
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.EntityFrameworkCore;
 using System.Linq;
-using System.Linq.Dynamic.Core;
 
 namespace Employee.api.Controllers
 {
@@ -12,41 +12,32 @@ namespace Employee.api.Controllers
     public class DepartmentMasterController : ControllerBase
     {
         private readonly EmployeeDbContext _context;
-        public DepartmentMasterController(EmployeeDbContext context)
+        private readonly MasterDataCache _cache;
+
+        public DepartmentMasterController(EmployeeDbContext context, MasterDataCache cache)
         {
             _context = context;
+            _cache = cache;
         }
 
         [HttpGet]
+        [ConditionalGet(CacheTable = MasterDataCache.Departments)]
         public async Task<IActionResult> GetAll([FromQuery] QueryParameters queryParameters)
         {
             try
             {
-                IQueryable<Department> departments = _context.Departments;
-
-                // Filtering
-                if (!string.IsNullOrEmpty(queryParameters.Filter))
+                // Unknown sort columns are rejected before the cache is consulted
+                try
                 {
-                    departments = departments.Where(d => d.DepartmentName.Contains(queryParameters.Filter));
+                    SortRegistries.Departments.Parse(queryParameters.SortBy, queryParameters.SortOrder);
                 }
-
-                // Sorting
-                if (!string.IsNullOrEmpty(queryParameters.SortBy))
+                catch (SortColumnException ex)
                 {
-                    if (string.Equals(queryParameters.SortOrder, "desc", StringComparison.OrdinalIgnoreCase))
-                    {
-                        departments = departments.OrderBy($"{queryParameters.SortBy} descending");
-                    }
-                    else
-                    {
-                        departments = departments.OrderBy(queryParameters.SortBy);
-                    }
+                    return BadRequest(new ApiResponse(400, null, ex.Message, ErrorCodes.Validation));
                 }
 
-                // Paging
-                var pagedDepartments = await departments.Skip((queryParameters.PageNumber - 1) * queryParameters.PageSize)
-                                     .Take(queryParameters.PageSize)
-                                     .ToListAsync();
+                var cacheKey = $"all:{queryParameters.Filter}|{queryParameters.SortBy}|{queryParameters.SortOrder}|{queryParameters.PageNumber}|{queryParameters.PageSize}";
+                var pagedDepartments = await _cache.GetOrCreateAsync(MasterDataCache.Departments, cacheKey, () => QueryDepartmentsAsync(queryParameters));
 
                 return Ok(new ApiResponse(200, pagedDepartments));
             }
@@ -56,12 +47,59 @@ namespace Employee.api.Controllers
             }
         }
 
+        private async Task<Helpers.PagedResult<Department>?> QueryDepartmentsAsync(QueryParameters queryParameters)
+        {
+            IQueryable<Department> departments = _context.Departments.AsNoTracking();
+
+            // Filtering
+            if (!string.IsNullOrEmpty(queryParameters.Filter))
+            {
+                // Prefix match so the name index can be used
+                var pattern = SearchExtensions.ToLikePrefix(queryParameters.Filter);
+                departments = departments.Where(d => EF.Functions.Like(d.DepartmentName, pattern, "\\"));
+            }
+
+            // Sorting: whitelisted columns, departmentId appended as the tie-breaker
+            departments = SortRegistries.Departments.Apply(departments, queryParameters.SortBy, queryParameters.SortOrder);
+
+            // Paging (separate COUNT query for the total)
+            return await departments.ToPagedResultAsync(queryParameters);
+        }
+
+        /// <summary>
+        /// Every department ordered by name, for dropdowns. Not paged (the table is small); cached until the next write.
+        /// </summary>
+        [HttpGet("lookup")]
+        [ConditionalGet(CacheTable = MasterDataCache.Departments)]
+        public async Task<IActionResult> Lookup()
+        {
+            try
+            {
+                var departments = await _cache.GetOrCreateAsync(MasterDataCache.Departments, "lookup", QueryLookupAsync);
+                return Ok(new ApiResponse(200, departments));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        private async Task<List<Department>?> QueryLookupAsync()
+        {
+            return await _context.Departments.AsNoTracking()
+                .OrderBy(d => d.DepartmentName)
+                .ThenBy(d => d.DepartmentId)
+                .ToListAsync();
+        }
+
         [HttpGet("{id}")]
+        [ConditionalGet(CacheTable = MasterDataCache.Departments)]
         public async Task<IActionResult> GetById(int id)
         {
             try
             {
-                var department = await _context.Departments.FindAsync(id);
+                var department = await _cache.GetOrCreateAsync(MasterDataCache.Departments, $"id:{id}",
+                    () => CompiledQueries.DepartmentById(_context, id));
                 if (department == null)
                 {
                     return NotFound(new ApiResponse(404, null, ErrorMessages.NotFound, ErrorCodes.NotFound));
@@ -81,6 +119,7 @@ namespace Employee.api.Controllers
             {
                 _context.Departments.Add(department);
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Departments);
                 var response = new ApiResponse(201, department);
                 return CreatedAtAction(nameof(GetById), new { id = department.DepartmentId }, response);
             }
@@ -103,6 +142,10 @@ namespace Employee.api.Controllers
             try
             {
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Departments);
+                // Designation and employee list rows carry the department name
+                _cache.Invalidate(MasterDataCache.Designations);
+                _cache.Invalidate(MasterDataCache.Employees);
             }
             catch (DbUpdateConcurrencyException)
             {
@@ -136,6 +179,7 @@ namespace Employee.api.Controllers
 
                 _context.Departments.Remove(department);
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Departments);
 
                 return Ok(new ApiResponse(200, null, "Department deleted successfully."));
             }
@@ -144,5 +188,67 @@ namespace Employee.api.Controllers
                 return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
             }
         }
+
+        /// <summary>
+        /// Deletes many departments in one transaction. Ids still referenced by designations are skipped and reported as in use.
+        /// </summary>
+        [HttpPost("delete-many")]
+        public async Task<IActionResult> DeleteMany([FromBody] BatchDeleteRequest request)
+        {
+            try
+            {
+                var ids = request.Ids.Distinct().ToList();
+
+                await using var transaction = await _context.Database.BeginTransactionAsync();
+                var found = await _context.Departments.Where(d => ids.Contains(d.DepartmentId)).Select(d => d.DepartmentId).ToListAsync();
+                var inUse = await _context.Designations.Where(des => found.Contains(des.DepartmentId)).Select(des => des.DepartmentId).Distinct().ToListAsync();
+                var deletable = found.Except(inUse).ToList();
+                await _context.Departments.Where(d => deletable.Contains(d.DepartmentId)).ExecuteDeleteAsync();
+                await transaction.CommitAsync();
+
+                if (deletable.Count > 0)
+                {
+                    _cache.Invalidate(MasterDataCache.Departments);
+                }
+
+                var failures = inUse.ToDictionary(id => id, id => new BatchItemResult { Id = id, Status = BatchItemStatus.InUse, Message = "Department still has designations." });
+                var result = BatchResult.Create(ids, deletable.ToHashSet(), BatchItemStatus.Deleted, failures);
+                return Ok(new ApiResponse(200, result));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        /// <summary>
+        /// Sets isActive on many departments with one UPDATE.
+        /// </summary>
+        [HttpPatch("update-many")]
+        public async Task<IActionResult> UpdateMany([FromBody] BatchUpdateRequest<DepartmentPatch> request)
+        {
+            try
+            {
+                var ids = request.Ids.Distinct().ToList();
+                var isActive = request.Patch.IsActive!.Value;
+
+                await using var transaction = await _context.Database.BeginTransactionAsync();
+                var found = await _context.Departments.Where(d => ids.Contains(d.DepartmentId)).Select(d => d.DepartmentId).ToListAsync();
+                await _context.Departments.Where(d => found.Contains(d.DepartmentId)).ExecuteUpdateAsync(s => s.SetProperty(d => d.IsActive, isActive));
+                await transaction.CommitAsync();
+
+                if (found.Count > 0)
+                {
+                    _cache.Invalidate(MasterDataCache.Departments);
+                }
+
+                var result = BatchResult.Create(ids, found.ToHashSet(), BatchItemStatus.Updated, new Dictionary<int, BatchItemResult>());
+                return Ok(new ApiResponse(200, result));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
     }
 }
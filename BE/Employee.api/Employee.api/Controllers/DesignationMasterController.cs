@@ -1,9 +1,9 @@
 using Employee.api.Helpers;
 using Employee.api.Model;
+using Employee.api.Services;
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.EntityFrameworkCore;
 using System.Linq;
-using System.Linq.Dynamic.Core;
 
 namespace Employee.api.Controllers
 {
@@ -12,41 +12,32 @@ namespace Employee.api.Controllers
     public class DesignationMasterController : ControllerBase
     {
         private readonly EmployeeDbContext _context;
-        public DesignationMasterController(EmployeeDbContext context)
+        private readonly MasterDataCache _cache;
+
+        public DesignationMasterController(EmployeeDbContext context, MasterDataCache cache)
         {
             _context = context;
+            _cache = cache;
         }
 
         [HttpGet]
+        [ConditionalGet(CacheTable = MasterDataCache.Designations)]
         public async Task<IActionResult> GetAll([FromQuery] QueryParameters queryParameters)
         {
             try
             {
-                IQueryable<Designation> designations = _context.Designations;
-
-                // Filtering
-                if (!string.IsNullOrEmpty(queryParameters.Filter))
+                // Unknown sort columns are rejected before the cache is consulted
+                try
                 {
-                    designations = designations.Where(d => d.DesignationName.Contains(queryParameters.Filter));
+                    SortRegistries.Designations.Parse(queryParameters.SortBy, queryParameters.SortOrder);
                 }
-
-                // Sorting
-                if (!string.IsNullOrEmpty(queryParameters.SortBy))
+                catch (SortColumnException ex)
                 {
-                    if (string.Equals(queryParameters.SortOrder, "desc", StringComparison.OrdinalIgnoreCase))
-                    {
-                        designations = designations.OrderBy($"{queryParameters.SortBy} descending");
-                    }
-                    else
-                    {
-                        designations = designations.OrderBy(queryParameters.SortBy);
-                    }
+                    return BadRequest(new ApiResponse(400, null, ex.Message, ErrorCodes.Validation));
                 }
 
-                // Paging
-                var pagedDesignations = await designations.Skip((queryParameters.PageNumber - 1) * queryParameters.PageSize)
-                                     .Take(queryParameters.PageSize)
-                                     .ToListAsync();
+                var cacheKey = $"all:{queryParameters.Filter}|{queryParameters.SortBy}|{queryParameters.SortOrder}|{queryParameters.PageNumber}|{queryParameters.PageSize}";
+                var pagedDesignations = await _cache.GetOrCreateAsync(MasterDataCache.Designations, cacheKey, () => QueryDesignationsAsync(queryParameters));
 
                 return Ok(new ApiResponse(200, pagedDesignations));
             }
@@ -56,13 +47,64 @@ namespace Employee.api.Controllers
             }
         }
 
+        private async Task<Helpers.PagedResult<DesignationListItem>?> QueryDesignationsAsync(QueryParameters queryParameters)
+        {
+            IQueryable<Designation> designations = _context.Designations.AsNoTracking();
+
+            // Filtering
+            if (!string.IsNullOrEmpty(queryParameters.Filter))
+            {
+                // Prefix match so the name index can be used
+                var pattern = SearchExtensions.ToLikePrefix(queryParameters.Filter);
+                designations = designations.Where(d => EF.Functions.Like(d.DesignationName, pattern, "\\"));
+            }
+
+            // Department name joined in the same query, so the list needs no department lookup
+            var rows = designations.Select(DesignationListItem.FromDesignation);
+
+            // Sorting: whitelisted columns, designationId appended as the tie-breaker
+            rows = SortRegistries.Designations.Apply(rows, queryParameters.SortBy, queryParameters.SortOrder);
+
+            // Paging (separate COUNT query for the total)
+            return await rows.ToPagedResultAsync(queryParameters);
+        }
+
+
+        /// <summary>
+        /// Every designation (department name joined) ordered by name, for dropdowns. Not paged; cached until the next write.
+        /// </summary>
+        [HttpGet("lookup")]
+        [ConditionalGet(CacheTable = MasterDataCache.Designations)]
+        public async Task<IActionResult> Lookup()
+        {
+            try
+            {
+                var designations = await _cache.GetOrCreateAsync(MasterDataCache.Designations, "lookup", QueryLookupAsync);
+                return Ok(new ApiResponse(200, designations));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        private async Task<List<DesignationListItem>?> QueryLookupAsync()
+        {
+            return await _context.Designations.AsNoTracking()
+                .Select(DesignationListItem.FromDesignation)
+                .OrderBy(d => d.DesignationName)
+                .ThenBy(d => d.DesignationId)
+                .ToListAsync();
+        }
 
         [HttpGet("{id}")]
+        [ConditionalGet(CacheTable = MasterDataCache.Designations)]
         public async Task<IActionResult> GetById(int id)
         {
             try
             {
-                var designation = await _context.Designations.FindAsync(id);
+                var designation = await _cache.GetOrCreateAsync(MasterDataCache.Designations, $"id:{id}",
+                    () => CompiledQueries.DesignationById(_context, id));
                 if (designation == null)
                 {
                     return NotFound(new ApiResponse(404, null, ErrorMessages.NotFound, ErrorCodes.NotFound));
@@ -82,6 +124,7 @@ namespace Employee.api.Controllers
             {
                 _context.Designations.Add(designation);
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Designations);
                 var response = new ApiResponse(201, designation);
                 return CreatedAtAction(nameof(GetById), new { id = designation.DesignationId }, response);
             }
@@ -104,6 +147,9 @@ namespace Employee.api.Controllers
             try
             {
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Designations);
+                // Employee list rows carry the designation and department names
+                _cache.Invalidate(MasterDataCache.Employees);
             }
             catch (DbUpdateConcurrencyException)
             {
@@ -137,6 +183,7 @@ namespace Employee.api.Controllers
 
                 _context.Designations.Remove(designation);
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Designations);
 
                 return Ok(new ApiResponse(200, null, "Designation deleted successfully."));
             }
@@ -145,5 +192,73 @@ namespace Employee.api.Controllers
                 return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
             }
         }
+
+        /// <summary>
+        /// Deletes many designations in one transaction. Ids still referenced by employees are skipped and reported as in use.
+        /// </summary>
+        [HttpPost("delete-many")]
+        public async Task<IActionResult> DeleteMany([FromBody] BatchDeleteRequest request)
+        {
+            try
+            {
+                var ids = request.Ids.Distinct().ToList();
+
+                await using var transaction = await _context.Database.BeginTransactionAsync();
+                var found = await _context.Designations.Where(d => ids.Contains(d.DesignationId)).Select(d => d.DesignationId).ToListAsync();
+                var inUse = await _context.Employees.Where(e => found.Contains(e.DesignationId)).Select(e => e.DesignationId).Distinct().ToListAsync();
+                var deletable = found.Except(inUse).ToList();
+                await _context.Designations.Where(d => deletable.Contains(d.DesignationId)).ExecuteDeleteAsync();
+                await transaction.CommitAsync();
+
+                if (deletable.Count > 0)
+                {
+                    _cache.Invalidate(MasterDataCache.Designations);
+                }
+
+                var failures = inUse.ToDictionary(id => id, id => new BatchItemResult { Id = id, Status = BatchItemStatus.InUse, Message = "Designation is still assigned to employees." });
+                var result = BatchResult.Create(ids, deletable.ToHashSet(), BatchItemStatus.Deleted, failures);
+                return Ok(new ApiResponse(200, result));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        /// <summary>
+        /// Sets departmentId on many designations with one UPDATE.
+        /// </summary>
+        [HttpPatch("update-many")]
+        public async Task<IActionResult> UpdateMany([FromBody] BatchUpdateRequest<DesignationPatch> request)
+        {
+            try
+            {
+                var ids = request.Ids.Distinct().ToList();
+                var departmentId = request.Patch.DepartmentId!.Value;
+
+                if (!await _context.Departments.AnyAsync(d => d.DepartmentId == departmentId))
+                {
+                    return BadRequest(new ApiResponse(400, null, $"Department {departmentId} does not exist.", ErrorCodes.Validation));
+                }
+
+                await using var transaction = await _context.Database.BeginTransactionAsync();
+                var found = await _context.Designations.Where(d => ids.Contains(d.DesignationId)).Select(d => d.DesignationId).ToListAsync();
+                await _context.Designations.Where(d => found.Contains(d.DesignationId)).ExecuteUpdateAsync(s => s.SetProperty(d => d.DepartmentId, departmentId));
+                await transaction.CommitAsync();
+
+                if (found.Count > 0)
+                {
+                    _cache.Invalidate(MasterDataCache.Designations);
+                    _cache.Invalidate(MasterDataCache.Employees);
+                }
+
+                var result = BatchResult.Create(ids, found.ToHashSet(), BatchItemStatus.Updated, new Dictionary<int, BatchItemResult>());
+                return Ok(new ApiResponse(200, result));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
     }
 }
@@ -1,9 +1,9 @@
 using Employee.api.Helpers;
 using Employee.api.Model;
+using Employee.api.Services;
+using Microsoft.AspNetCore.Http.Features;
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.EntityFrameworkCore;
-using System.Linq.Dynamic.Core;
-using BCrypt.Net;
 using Emp = Employee.api.Model.Employee;
 using System.Linq;
 
@@ -14,41 +14,84 @@ namespace Employee.api.Controllers
     public class EmployeeMasterController : ControllerBase
     {
         private readonly EmployeeDbContext _context;
-        public EmployeeMasterController(EmployeeDbContext context)
+        private readonly IConfiguration _configuration;
+        private readonly PasswordHashingQueue _passwordHashing;
+        private readonly EmployeeImporter _importer;
+        private readonly MasterDataCache _cache;
+
+        public EmployeeMasterController(EmployeeDbContext context, IConfiguration configuration, PasswordHashingQueue passwordHashing,
+            EmployeeImporter importer, MasterDataCache cache)
         {
             _context = context;
+            _configuration = configuration;
+            _passwordHashing = passwordHashing;
+            _importer = importer;
+            _cache = cache;
         }
 
         [HttpGet]
+        [ConditionalGet(CacheTable = MasterDataCache.Employees)]
         public async Task<IActionResult> GetAll([FromQuery] QueryParameters queryParameters)
         {
             try
             {
-                IQueryable<Emp> employees = _context.Employees;
+                IQueryable<Emp> employees = _context.Employees.AsNoTracking();
 
-                // Filtering
-                if (!string.IsNullOrEmpty(queryParameters.Filter))
+                // Filtering: name/email/city/contactNo search
+                if (!SearchExtensions.TryResolveMode(queryParameters.SearchMode, _configuration, out var searchMode))
+                {
+                    return BadRequest(new ApiResponse(400, null, $"Unknown search mode '{queryParameters.SearchMode}'.", ErrorCodes.Validation));
+                }
+                if (!string.IsNullOrWhiteSpace(queryParameters.Filter))
                 {
-                    employees = employees.Where(e => e.Name.Contains(queryParameters.Filter));
+                    employees = employees.Search(queryParameters.Filter, searchMode);
                 }
 
-                // Sorting
-                if (!string.IsNullOrEmpty(queryParameters.SortBy))
+                // Keyset paging (opt-in): sorts and seeks past the cursor, no OFFSET and no COUNT
+                if (queryParameters.UsesKeyset)
                 {
-                    if (string.Equals(queryParameters.SortOrder, "desc", StringComparison.OrdinalIgnoreCase))
+                    try
                     {
-                        employees = employees.OrderBy($"{queryParameters.SortBy} descending");
+                        var keysetPage = await ToListItems(employees)
+                            .ToKeysetPageAsync(queryParameters, SortRegistries.Employees);
+                        return Ok(new ApiResponse(200, keysetPage));
                     }
-                    else
+                    catch (KeysetCursorException ex)
                     {
-                        employees = employees.OrderBy(queryParameters.SortBy);
+                        return BadRequest(new ApiResponse(400, null, ex.Message, ErrorCodes.Validation));
                     }
                 }
 
-                // Paging
-                var pagedEmployees = await employees.Skip((queryParameters.PageNumber - 1) * queryParameters.PageSize)
-                                     .Take(queryParameters.PageSize)
-                                     .ToListAsync();
+                // Unfiltered list in a common order: precompiled count + page queries
+                var compiledPage = string.IsNullOrWhiteSpace(queryParameters.Filter)
+                    ? CompiledQueries.EmployeePageFor(queryParameters.SortBy, queryParameters.SortOrder)
+                    : null;
+                if (compiledPage != null)
+                {
+                    var totalCount = await CompiledQueries.EmployeeCount(_context);
+                    var skip = (queryParameters.PageNumber - 1) * queryParameters.PageSize;
+                    var page = await compiledPage(_context, skip, queryParameters.PageSize).ToPagedResultAsync(totalCount, queryParameters);
+                    return Ok(new ApiResponse(200, page));
+                }
+
+                // Sorting: whitelisted columns only, employeeId appended as the tie-breaker
+                IReadOnlyList<SortTerm> sortTerms;
+                try
+                {
+                    sortTerms = SortRegistries.Employees.Parse(queryParameters.SortBy, queryParameters.SortOrder);
+                }
+                catch (SortColumnException ex)
+                {
+                    return BadRequest(new ApiResponse(400, null, ex.Message, ErrorCodes.Validation));
+                }
+
+                var descending = string.Equals(queryParameters.SortOrder, "desc", StringComparison.OrdinalIgnoreCase);
+                var rows = sortTerms.Count == 0 && !string.IsNullOrWhiteSpace(queryParameters.Filter)
+                    ? ToListItems(employees.OrderByRank(queryParameters.Filter)) // No explicit sort: best matches first
+                    : SortRegistries.Employees.Apply(ToListItems(employees), sortTerms, descending);
+
+                // Paging (separate COUNT query for the total)
+                var pagedEmployees = await rows.ToPagedResultAsync(queryParameters);
 
                 return Ok(new ApiResponse(200, pagedEmployees));
             }
@@ -60,15 +103,18 @@ namespace Employee.api.Controllers
 
 
         [HttpGet("{id}")]
+        [ConditionalGet(CacheTable = MasterDataCache.Employees)]
         public async Task<IActionResult> GetById(int id)
         {
             try
             {
-                var employee = await _context.Employees.FindAsync(id);
+                var employee = await CompiledQueries.EmployeeById(_context, id);
                 if (employee == null)
                 {
                     return NotFound(new ApiResponse(404, null, ErrorMessages.NotFound, ErrorCodes.NotFound));
                 }
+
+                employee.Password = string.Empty; // Don't return the hash
                 return Ok(new ApiResponse(200, employee));
             }
             catch (Exception)
@@ -77,24 +123,129 @@ namespace Employee.api.Controllers
             }
         }
 
+        /// <summary>
+        /// Streams every employee matching <paramref name="filter"/> as CSV or NDJSON, ordered by id.
+        /// Rows go to the response as the reader produces them; nothing is collected in a list.
+        /// </summary>
+        [HttpGet("export")]
+        public async Task<IActionResult> Export([FromQuery] string format = "csv", [FromQuery] string? filter = null,
+            [FromQuery] string? searchMode = null, CancellationToken cancellationToken = default)
+        {
+            if (!EmployeeExporter.TryGetContentType(format, out var contentType))
+            {
+                return BadRequest(new ApiResponse(400, null, $"Unknown export format '{format}'. Use csv or ndjson.", ErrorCodes.Validation));
+            }
+            if (!SearchExtensions.TryResolveMode(searchMode, _configuration, out var mode))
+            {
+                return BadRequest(new ApiResponse(400, null, $"Unknown search mode '{searchMode}'.", ErrorCodes.Validation));
+            }
+
+            IQueryable<Emp> employees = _context.Employees.AsNoTracking();
+            if (!string.IsNullOrWhiteSpace(filter))
+            {
+                employees = employees.Search(filter, mode);
+            }
+            var rows = ToListItems(employees).OrderBy(e => e.EmployeeId).AsAsyncEnumerable();
+
+            try
+            {
+                var extension = format.ToLowerInvariant();
+                Response.ContentType = contentType;
+                Response.Headers.ContentDisposition = $"attachment; filename=\"employees-{DateTime.UtcNow:yyyyMMdd-HHmmss}.{extension}\"";
+                // Send each flush straight to the client instead of letting a middleware buffer the whole file
+                HttpContext.Features.Get<IHttpResponseBodyFeature>()?.DisableBuffering();
+
+                if (extension == "csv")
+                {
+                    await EmployeeExporter.WriteCsvAsync(rows, Response.Body, cancellationToken);
+                }
+                else
+                {
+                    await EmployeeExporter.WriteNdjsonAsync(rows, Response.Body, cancellationToken);
+                }
+                return new EmptyResult();
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                return new EmptyResult(); // Client went away
+            }
+            catch (Exception)
+            {
+                if (Response.HasStarted)
+                {
+                    // Too late for a 500: drop the connection so the download fails instead of looking complete
+                    HttpContext.Abort();
+                    return new EmptyResult();
+                }
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        /// <summary>
+        /// Projects the list columns in SQL (designation/department names through the navigations, no password or address).
+        /// </summary>
+        private static IQueryable<EmployeeListItem> ToListItems(IQueryable<Emp> employees)
+        {
+            return employees.Select(EmployeeListItem.FromEmployee);
+        }
+
         [HttpPost]
         public async Task<IActionResult> Post([FromBody] Emp employee)
         {
             try
             {
                 employee.CreateDate = DateTime.UtcNow;
-                employee.Password = BCrypt.Net.BCrypt.HashPassword(employee.Password);
+                employee.Password = await _passwordHashing.HashAsync(employee.Password);
                 _context.Employees.Add(employee);
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Employees);
                 
                 employee.Password = string.Empty; // Don't return the hash
                 var response = new ApiResponse(201, employee);
                 return CreatedAtAction(nameof(GetById), new { id = employee.EmployeeId }, response);
             }
+            catch (PasswordQueueFullException)
+            {
+                return ServerBusy();
+            }
+            catch (DbUpdateException ex) when (ex.IsUniqueViolation())
+            {
+                return DuplicateEmail();
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        /// <summary>
+        /// Bulk import from a text/csv (header row required) or application/x-ndjson body.
+        /// The body is streamed row by row; the response lists every row that was not imported.
+        /// </summary>
+        [HttpPost("import")]
+        [RequestSizeLimit(200_000_000)]
+        public async Task<IActionResult> Import(CancellationToken cancellationToken)
+        {
+            var contentType = Request.ContentType;
+            if (!EmployeeImporter.IsCsv(contentType) && !EmployeeImporter.IsNdjson(contentType))
+            {
+                return StatusCode(415, new ApiResponse(415, null, "Send the rows as text/csv or application/x-ndjson.", ErrorCodes.Validation));
+            }
+
+            try
+            {
+                var report = await _importer.ImportAsync(Request.Body, contentType!, cancellationToken);
+                return Ok(new ApiResponse(200, report));
+            }
             catch (Exception)
             {
                 return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
             }
+            finally
+            {
+                // Batches commit one by one, so even a failed import may have added rows
+                _cache.Invalidate(MasterDataCache.Employees);
+            }
         }
 
         [HttpPut("{id}")]
@@ -105,7 +256,7 @@ namespace Employee.api.Controllers
                 return BadRequest(new ApiResponse(400, null, "Employee ID mismatch"));
             }
             
-            var existingEmployee = await _context.Employees.AsNoTracking().FirstOrDefaultAsync(e => e.EmployeeId == id);
+            var existingEmployee = await CompiledQueries.EmployeeById(_context, id);
             if (existingEmployee == null)
             {
                 return NotFound(new ApiResponse(404, null, ErrorMessages.NotFound, ErrorCodes.NotFound));
@@ -116,7 +267,14 @@ namespace Employee.api.Controllers
             // If a new password is provided, hash it. Otherwise, keep the existing one.
             if (!string.IsNullOrEmpty(employee.Password))
             {
-                employee.Password = BCrypt.Net.BCrypt.HashPassword(employee.Password);
+                try
+                {
+                    employee.Password = await _passwordHashing.HashAsync(employee.Password);
+                }
+                catch (PasswordQueueFullException)
+                {
+                    return ServerBusy();
+                }
             }
             else
             {
@@ -128,6 +286,7 @@ namespace Employee.api.Controllers
             try
             {
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Employees);
             }
             catch (DbUpdateConcurrencyException)
             {
@@ -140,6 +299,10 @@ namespace Employee.api.Controllers
                     throw;
                 }
             }
+            catch (DbUpdateException ex) when (ex.IsUniqueViolation())
+            {
+                return DuplicateEmail();
+            }
             catch (Exception)
             {
                 return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
@@ -162,6 +325,7 @@ namespace Employee.api.Controllers
 
                 _context.Employees.Remove(employee);
                 await _context.SaveChangesAsync();
+                _cache.Invalidate(MasterDataCache.Employees);
 
                 return Ok(new ApiResponse(200, null, "Employee deleted successfully."));
             }
@@ -170,5 +334,89 @@ namespace Employee.api.Controllers
                 return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
             }
         }
+
+        /// <summary>
+        /// Deletes many employees with one DELETE ... WHERE employeeId IN (...) and reports each id.
+        /// </summary>
+        [HttpPost("delete-many")]
+        public async Task<IActionResult> DeleteMany([FromBody] BatchDeleteRequest request)
+        {
+            try
+            {
+                var ids = request.Ids.Distinct().ToList();
+
+                await using var transaction = await _context.Database.BeginTransactionAsync();
+                var found = await _context.Employees.Where(e => ids.Contains(e.EmployeeId)).Select(e => e.EmployeeId).ToListAsync();
+                await _context.Employees.Where(e => found.Contains(e.EmployeeId)).ExecuteDeleteAsync();
+                await transaction.CommitAsync();
+
+                if (found.Count > 0)
+                {
+                    _cache.Invalidate(MasterDataCache.Employees);
+                }
+
+                var result = BatchResult.Create(ids, found.ToHashSet(), BatchItemStatus.Deleted, new Dictionary<int, BatchItemResult>());
+                return Ok(new ApiResponse(200, result));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        /// <summary>
+        /// Applies the same partial patch (designation, city, state) to many employees with one UPDATE.
+        /// </summary>
+        [HttpPatch("update-many")]
+        public async Task<IActionResult> UpdateMany([FromBody] BatchUpdateRequest<EmployeePatch> request)
+        {
+            try
+            {
+                var ids = request.Ids.Distinct().ToList();
+                var designationId = request.Patch.DesignationId;
+                var city = request.Patch.City;
+                var state = request.Patch.State;
+                var now = DateTime.UtcNow;
+
+                if (designationId != null && !await _context.Designations.AnyAsync(d => d.DesignationId == designationId))
+                {
+                    return BadRequest(new ApiResponse(400, null, $"Designation {designationId} does not exist.", ErrorCodes.Validation));
+                }
+
+                await using var transaction = await _context.Database.BeginTransactionAsync();
+                var found = await _context.Employees.Where(e => ids.Contains(e.EmployeeId)).Select(e => e.EmployeeId).ToListAsync();
+                // Unset patch fields write the column back to itself
+                await _context.Employees.Where(e => found.Contains(e.EmployeeId)).ExecuteUpdateAsync(s => s
+                    .SetProperty(e => e.DesignationId, e => designationId ?? e.DesignationId)
+                    .SetProperty(e => e.City, e => city ?? e.City)
+                    .SetProperty(e => e.State, e => state ?? e.State)
+                    .SetProperty(e => e.ModifiedDate, now));
+                await transaction.CommitAsync();
+
+                if (found.Count > 0)
+                {
+                    _cache.Invalidate(MasterDataCache.Employees);
+                }
+
+                var result = BatchResult.Create(ids, found.ToHashSet(), BatchItemStatus.Updated, new Dictionary<int, BatchItemResult>());
+                return Ok(new ApiResponse(200, result));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        private IActionResult ServerBusy()
+        {
+            Response.Headers.RetryAfter = "1";
+            return StatusCode(503, new ApiResponse(503, null, ErrorMessages.ServerBusy, ErrorCodes.ServerBusy));
+        }
+
+        // UX_employeeTbl_email (database/migrations/003) rejected the write
+        private IActionResult DuplicateEmail()
+        {
+            return Conflict(new ApiResponse(409, null, ErrorMessages.DuplicateEmail, ErrorCodes.Conflict));
+        }
     }
 }
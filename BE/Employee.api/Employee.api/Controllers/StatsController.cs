@@ -0,0 +1,135 @@
+using Employee.api.Helpers;
+using Employee.api.Model;
+using Employee.api.Services;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Caching.Memory;
+
+namespace Employee.api.Controllers
+{
+    [Route("api/[controller]")]
+    [ApiController]
+    public class StatsController : ControllerBase
+    {
+        private const string CacheKey = "stats:dashboard";
+        private const int RecentHireDays = 30;
+        private const int RecentHireLimit = 5;
+
+        private readonly EmployeeDbContext _context;
+        private readonly IMemoryCache _cache;
+        private readonly PasswordHashingQueue _passwordHashing;
+        private readonly MasterDataCache _masterDataCache;
+        private readonly TimeSpan _cacheDuration;
+
+        public StatsController(EmployeeDbContext context, IMemoryCache cache, PasswordHashingQueue passwordHashing,
+            MasterDataCache masterDataCache, IConfiguration configuration)
+        {
+            _context = context;
+            _cache = cache;
+            _passwordHashing = passwordHashing;
+            _masterDataCache = masterDataCache;
+            _cacheDuration = TimeSpan.FromSeconds(configuration.GetValue("Stats:CacheSeconds", 30));
+        }
+
+        [HttpGet]
+        public async Task<IActionResult> Get()
+        {
+            try
+            {
+                var stats = await _cache.GetOrCreateAsync(CacheKey, entry =>
+                {
+                    entry.AbsoluteExpirationRelativeToNow = _cacheDuration;
+                    return BuildStatsAsync();
+                });
+
+                return Ok(new ApiResponse(200, stats));
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, new ApiResponse(500, null, ErrorMessages.InternalServerError, ErrorCodes.InternalServerError));
+            }
+        }
+
+        // Queue depth and BCrypt latency; the same numbers are published on the
+        // "Employee.api.PasswordHashing" meter for dotnet-counters
+        [HttpGet("password-hashing")]
+        public IActionResult GetPasswordHashing()
+        {
+            return Ok(new ApiResponse(200, _passwordHashing.GetStats()));
+        }
+
+        // Hit/miss/invalidation counts per master table (also on the "Employee.api.MasterDataCache" meter)
+        [HttpGet("cache")]
+        public IActionResult GetCache()
+        {
+            return Ok(new ApiResponse(200, _masterDataCache.GetStats()));
+        }
+
+        private async Task<DashboardStats> BuildStatsAsync()
+        {
+            // Master tables are small: load id/name pairs once and merge the aggregates in memory
+            var departments = await _context.Departments.AsNoTracking()
+                .Select(d => new { d.DepartmentId, d.DepartmentName, d.IsActive })
+                .ToListAsync();
+            var designations = await _context.Designations.AsNoTracking()
+                .Select(d => new { d.DesignationId, d.DesignationName, d.DepartmentId })
+                .ToListAsync();
+
+            // GROUP BY designationId
+            var perDesignation = await _context.Employees
+                .GroupBy(e => e.DesignationId)
+                .Select(g => new { DesignationId = g.Key, Count = g.Count() })
+                .ToDictionaryAsync(x => x.DesignationId, x => x.Count);
+
+            // JOIN designationTbl + GROUP BY departmentId
+            var perDepartment = await _context.Employees
+                .GroupBy(e => e.Designation!.DepartmentId)
+                .Select(g => new { DepartmentId = g.Key, Count = g.Count() })
+                .ToDictionaryAsync(x => x.DepartmentId, x => x.Count);
+
+            var since = DateTime.UtcNow.AddDays(-RecentHireDays);
+            var recentHireCount = await _context.Employees.CountAsync(e => e.CreateDate >= since);
+            var recentHires = await _context.Employees.AsNoTracking()
+                .Where(e => e.CreateDate >= since)
+                .OrderByDescending(e => e.CreateDate)
+                .Take(RecentHireLimit)
+                .Select(e => new RecentHire
+                {
+                    EmployeeId = e.EmployeeId,
+                    Name = e.Name,
+                    DesignationId = e.DesignationId,
+                    CreateDate = e.CreateDate
+                })
+                .ToListAsync();
+
+            return new DashboardStats
+            {
+                TotalEmployees = perDesignation.Values.Sum(),
+                TotalDepartments = departments.Count,
+                ActiveDepartments = departments.Count(d => d.IsActive),
+                RecentHireCount = recentHireCount,
+                RecentHireDays = RecentHireDays,
+                EmployeesPerDepartment = departments
+                    .Select(d => new DepartmentHeadcount
+                    {
+                        DepartmentId = d.DepartmentId,
+                        DepartmentName = d.DepartmentName,
+                        EmployeeCount = perDepartment.GetValueOrDefault(d.DepartmentId)
+                    })
+                    .OrderByDescending(d => d.EmployeeCount)
+                    .ToList(),
+                EmployeesPerDesignation = designations
+                    .Select(d => new DesignationHeadcount
+                    {
+                        DesignationId = d.DesignationId,
+                        DesignationName = d.DesignationName,
+                        DepartmentId = d.DepartmentId,
+                        EmployeeCount = perDesignation.GetValueOrDefault(d.DesignationId)
+                    })
+                    .OrderByDescending(d => d.EmployeeCount)
+                    .ToList(),
+                RecentHires = recentHires
+            };
+        }
+    }
+}
@@ -0,0 +1,41 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using Employee.api.Model;
+using Employee.api.Services;
+
+namespace Employee.api.Helpers
+{
+    /// <summary>
+    /// Compile-time System.Text.Json metadata for everything the API reads or writes, so requests and responses
+    /// skip reflection-based contract building. <see cref="ApiResponse.Data"/> is typed <c>object</c>: each runtime
+    /// type that can end up there is listed here. Anything missing falls back to the reflection resolver
+    /// (see Program.cs), so a forgotten type still serialises, only more slowly.
+    /// </summary>
+    [JsonSourceGenerationOptions(JsonSerializerDefaults.Web, DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull)]
+    [JsonSerializable(typeof(ApiResponse))]
+    [JsonSerializable(typeof(List<string>))]
+    [JsonSerializable(typeof(Model.Employee))]
+    [JsonSerializable(typeof(Department))]
+    [JsonSerializable(typeof(Designation))]
+    [JsonSerializable(typeof(EmployeeListItem))]
+    [JsonSerializable(typeof(PagedResult<EmployeeListItem>))]
+    [JsonSerializable(typeof(PagedResult<Department>))]
+    [JsonSerializable(typeof(PagedResult<DesignationListItem>))]
+    [JsonSerializable(typeof(List<Department>))]
+    [JsonSerializable(typeof(List<DesignationListItem>))]
+    [JsonSerializable(typeof(CursorPagedResult<EmployeeListItem>))]
+    [JsonSerializable(typeof(LoginRequest))]
+    [JsonSerializable(typeof(LoginResponse))]
+    [JsonSerializable(typeof(BatchDeleteRequest))]
+    [JsonSerializable(typeof(BatchUpdateRequest<EmployeePatch>))]
+    [JsonSerializable(typeof(BatchUpdateRequest<DepartmentPatch>))]
+    [JsonSerializable(typeof(BatchUpdateRequest<DesignationPatch>))]
+    [JsonSerializable(typeof(BatchResult))]
+    [JsonSerializable(typeof(ImportReport))]
+    [JsonSerializable(typeof(DashboardStats))]
+    [JsonSerializable(typeof(PasswordHashingStats))]
+    [JsonSerializable(typeof(List<MasterDataCacheStats>))]
+    public partial class ApiJsonSerializerContext : JsonSerializerContext
+    {
+    }
+}
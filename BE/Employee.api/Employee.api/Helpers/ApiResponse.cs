@@ -25,7 +25,10 @@ namespace Employee.api.Helpers
                 400 => "Bad Request",
                 401 => "Unauthorized",
                 404 => "Not Found",
+                409 => "Conflict",
+                415 => "Unsupported Media Type",
                 500 => "Internal Server Error",
+                503 => "Service Unavailable",
                 _ => null
             };
         }
@@ -0,0 +1,77 @@
+using System.Security.Cryptography;
+using System.Text.Json;
+using Employee.api.Services;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Mvc.Filters;
+using Microsoft.Extensions.Options;
+
+namespace Employee.api.Helpers
+{
+    /// <summary>
+    /// Strong ETag + If-None-Match handling for GET actions.
+    /// The ETag is a SHA-256 of the serialised 200 response, so identical data always gets the same tag.
+    /// With CacheTable set, the tag is also remembered per URL in <see cref="MasterDataCache"/> until the
+    /// table is written to, and a matching If-None-Match is answered with 304 before the action runs.
+    /// </summary>
+    [AttributeUsage(AttributeTargets.Method)]
+    public class ConditionalGetAttribute : Attribute, IAsyncActionFilter
+    {
+        public string? CacheTable { get; set; }
+
+        public async Task OnActionExecutionAsync(ActionExecutingContext context, ActionExecutionDelegate next)
+        {
+            var http = context.HttpContext;
+            var cache = CacheTable != null ? http.RequestServices.GetRequiredService<MasterDataCache>() : null;
+            var requestKey = $"{http.Request.Path}{http.Request.QueryString}";
+            var ifNoneMatch = http.Request.Headers.IfNoneMatch.ToString();
+
+            // Known tag, nothing written since: no query, no serialisation
+            if (cache != null && cache.TryGetETag(CacheTable!, requestKey, out var knownETag) && Matches(ifNoneMatch, knownETag!))
+            {
+                SetValidatorHeaders(http.Response, knownETag!);
+                context.Result = new StatusCodeResult(StatusCodes.Status304NotModified);
+                return;
+            }
+
+            var generation = cache?.CurrentGeneration(CacheTable!) ?? default;
+            var executed = await next();
+
+            if (executed.Exception != null || executed.Result is not ObjectResult result || result.Value == null
+                || (result.StatusCode ?? StatusCodes.Status200OK) != StatusCodes.Status200OK)
+            {
+                return;
+            }
+
+            var jsonOptions = http.RequestServices.GetRequiredService<IOptions<JsonOptions>>().Value.JsonSerializerOptions;
+            var body = JsonSerializer.SerializeToUtf8Bytes(result.Value, result.Value.GetType(), jsonOptions);
+            var etag = $"\"{Convert.ToHexString(SHA256.HashData(body), 0, 16)}\"";
+
+            cache?.SetETag(CacheTable!, requestKey, etag, generation);
+            SetValidatorHeaders(http.Response, etag);
+
+            // Reuse the bytes we just hashed instead of serialising the value a second time
+            executed.Result = Matches(ifNoneMatch, etag)
+                ? new StatusCodeResult(StatusCodes.Status304NotModified)
+                : new FileContentResult(body, "application/json; charset=utf-8");
+        }
+
+        private static void SetValidatorHeaders(HttpResponse response, string etag)
+        {
+            response.Headers.ETag = etag;
+            // Clients may keep the body but must revalidate before reusing it
+            response.Headers.CacheControl = "no-cache";
+        }
+
+        private static bool Matches(string ifNoneMatch, string etag)
+        {
+            if (string.IsNullOrEmpty(ifNoneMatch))
+            {
+                return false;
+            }
+
+            // If-None-Match uses weak comparison: W/"x" matches "x"
+            return ifNoneMatch.Split(',', StringSplitOptions.TrimEntries | StringSplitOptions.RemoveEmptyEntries)
+                .Any(candidate => candidate == "*" || (candidate.StartsWith("W/") ? candidate[2..] : candidate) == etag);
+        }
+    }
+}
@@ -0,0 +1,98 @@
+using System.Runtime.CompilerServices;
+using System.Text;
+
+namespace Employee.api.Helpers
+{
+    public static class Csv
+    {
+        private static readonly char[] CharsNeedingQuotes = { ',', '"', '\r', '\n' };
+
+        /// <summary>
+        /// Formats one record, quoting only the fields that need it. Readable back with <see cref="ReadRecordsAsync"/>.
+        /// </summary>
+        public static string FormatRecord(IEnumerable<string?> fields)
+        {
+            return string.Join(',', fields.Select(Escape));
+        }
+
+        public static string Escape(string? value)
+        {
+            if (string.IsNullOrEmpty(value))
+            {
+                return string.Empty;
+            }
+            return value.IndexOfAny(CharsNeedingQuotes) >= 0 ? $"\"{value.Replace("\"", "\"\"")}\"" : value;
+        }
+
+        /// <summary>
+        /// Reads RFC 4180 records one at a time, so only the current record is held in memory.
+        /// Quoted fields may contain commas, doubled quotes and line breaks. Blank lines are skipped.
+        /// </summary>
+        public static async IAsyncEnumerable<List<string>> ReadRecordsAsync(TextReader reader, [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            var fields = new List<string>();
+            var field = new StringBuilder();
+            var inQuotes = false;
+            string? line;
+
+            while ((line = await reader.ReadLineAsync(cancellationToken)) != null)
+            {
+                for (var i = 0; i < line.Length; i++)
+                {
+                    var c = line[i];
+                    if (inQuotes)
+                    {
+                        if (c != '"')
+                        {
+                            field.Append(c);
+                        }
+                        else if (i + 1 < line.Length && line[i + 1] == '"')
+                        {
+                            field.Append('"');
+                            i++;
+                        }
+                        else
+                        {
+                            inQuotes = false;
+                        }
+                    }
+                    else if (c == '"')
+                    {
+                        inQuotes = true;
+                    }
+                    else if (c == ',')
+                    {
+                        fields.Add(field.ToString());
+                        field.Clear();
+                    }
+                    else
+                    {
+                        field.Append(c);
+                    }
+                }
+
+                if (inQuotes)
+                {
+                    // Line break inside a quoted field
+                    field.Append('\n');
+                    continue;
+                }
+
+                fields.Add(field.ToString());
+                field.Clear();
+                if (fields.Count > 1 || fields[0].Length > 0)
+                {
+                    yield return fields;
+                }
+                fields = new List<string>();
+            }
+
+            if (inQuotes)
+            {
+                // Unterminated quote at end of input: return what we have, minus the line break added above
+                fields.Add(field.ToString(0, field.Length - 1));
+                yield return fields;
+            }
+        }
+    }
+}
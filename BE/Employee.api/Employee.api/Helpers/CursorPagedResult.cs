@@ -0,0 +1,17 @@
+namespace Employee.api.Helpers
+{
+    public class CursorPagedResult<T>
+    {
+        public IReadOnlyList<T> Items { get; }
+        public int PageSize { get; }
+        public string? NextCursor { get; }
+        public bool HasMore => NextCursor != null;
+
+        public CursorPagedResult(IReadOnlyList<T> items, int pageSize, string? nextCursor)
+        {
+            Items = items;
+            PageSize = pageSize;
+            NextCursor = nextCursor;
+        }
+    }
+}
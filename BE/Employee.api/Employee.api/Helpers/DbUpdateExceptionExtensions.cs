@@ -0,0 +1,16 @@
+using Microsoft.Data.SqlClient;
+using Microsoft.EntityFrameworkCore;
+
+namespace Employee.api.Helpers
+{
+    public static class DbUpdateExceptionExtensions
+    {
+        /// <summary>
+        /// True when SQL Server rejected the write because of a unique index or constraint (e.g. UX_employeeTbl_email).
+        /// </summary>
+        public static bool IsUniqueViolation(this DbUpdateException exception)
+        {
+            return exception.InnerException is SqlException { Number: 2601 or 2627 };
+        }
+    }
+}
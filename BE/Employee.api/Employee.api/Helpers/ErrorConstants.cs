@@ -5,12 +5,16 @@ namespace Employee.api.Helpers
         public const string ValidationError = "One or more validation errors occurred.";
         public const string NotFound = "The requested resource was not found.";
         public const string InternalServerError = "An internal server error has occurred.";
+        public const string ServerBusy = "The server is busy, please retry shortly.";
+        public const string DuplicateEmail = "An employee with this email already exists.";
     }
 
     public static class ErrorCodes
     {
         public const int Validation = 40001;
         public const int NotFound = 40401;
+        public const int Conflict = 40901;
         public const int InternalServerError = 50001;
+        public const int ServerBusy = 50301;
     }
 }
@@ -0,0 +1,178 @@
+using System.Linq.Expressions;
+using System.Reflection;
+using System.Text;
+using System.Text.Json;
+using Microsoft.EntityFrameworkCore;
+
+namespace Employee.api.Helpers
+{
+    public class KeysetCursorException : Exception
+    {
+        public KeysetCursorException(string message) : base(message) { }
+    }
+
+    public static class KeysetPagination
+    {
+        private sealed class CursorPayload
+        {
+            // Canonical sort, e.g. "DepartmentName:asc,Name:asc,EmployeeId:asc"
+            public string Sort { get; set; } = string.Empty;
+            // Last row's value for each column of Sort, key included
+            public JsonElement[]? Values { get; set; }
+        }
+
+        private sealed record SeekColumn(PropertyInfo Property, bool Descending);
+
+        // Holds a cursor value so EF Core sends it as a SQL parameter instead of inlining a literal
+        private sealed class ValueHolder
+        {
+            public object? Value;
+        }
+
+        /// <summary>
+        /// Seeks past the cursor with WHERE (c1, c2, ..., key) &gt; (last1, last2, ..., lastKey) instead of OFFSET,
+        /// so every page costs the same no matter how deep it is. Accepts the same sortBy as the registry (several
+        /// columns, per-column direction); the unique key breaks ties. Every registered column must be non-null.
+        /// </summary>
+        public static async Task<CursorPagedResult<T>> ToKeysetPageAsync<T>(this IQueryable<T> query, QueryParameters queryParameters,
+            SortRegistry<T> sortRegistry)
+        {
+            IReadOnlyList<SortTerm> terms;
+            try
+            {
+                terms = sortRegistry.Parse(queryParameters.SortBy, queryParameters.SortOrder);
+            }
+            catch (SortColumnException ex)
+            {
+                throw new KeysetCursorException(ex.Message);
+            }
+            var descending = string.Equals(queryParameters.SortOrder, "desc", StringComparison.OrdinalIgnoreCase);
+            var columns = SeekColumns<T>(sortRegistry, terms, descending);
+            var sort = string.Join(",", columns.Select(c => $"{c.Property.Name}:{(c.Descending ? "desc" : "asc")}"));
+
+            if (!string.IsNullOrEmpty(queryParameters.Cursor))
+            {
+                var cursor = Decode(queryParameters.Cursor);
+                if (!string.Equals(cursor.Sort, sort, StringComparison.OrdinalIgnoreCase))
+                {
+                    throw new KeysetCursorException("The cursor was issued for a different sort order.");
+                }
+                if (cursor.Values == null || cursor.Values.Length != columns.Count)
+                {
+                    throw new KeysetCursorException("The cursor is invalid.");
+                }
+                var lastValues = columns.Select((c, i) => ReadValue(cursor.Values[i], c.Property.PropertyType)).ToList();
+                query = query.Where(BuildSeekPredicate<T>(columns, lastValues));
+            }
+
+            // Same ORDER BY as the OFFSET path: the registry appends the key after the sort columns
+            query = sortRegistry.Apply(query, terms, descending);
+
+            // One extra row tells whether another page exists without a COUNT
+            var rows = await query.Take(queryParameters.PageSize + 1).ToListAsync();
+            string? nextCursor = null;
+            if (rows.Count > queryParameters.PageSize)
+            {
+                rows.RemoveAt(rows.Count - 1);
+                var last = rows[^1]!;
+                nextCursor = Encode(new CursorPayload
+                {
+                    Sort = sort,
+                    Values = columns.Select(c => JsonSerializer.SerializeToElement(c.Property.GetValue(last), c.Property.PropertyType)).ToArray()
+                });
+            }
+
+            return new CursorPagedResult<T>(rows, queryParameters.PageSize, nextCursor);
+        }
+
+        /// <summary>
+        /// The ORDER BY columns in order, mirroring <see cref="SortRegistry{T}.Apply(IQueryable{T}, IReadOnlyList{SortTerm}, bool)"/>.
+        /// </summary>
+        private static List<SeekColumn> SeekColumns<T>(SortRegistry<T> sortRegistry, IReadOnlyList<SortTerm> terms, bool descending)
+        {
+            var columns = terms.Select(t => new SeekColumn(typeof(T).GetProperty(t.Column)!, t.Descending)).ToList();
+            if (terms.All(t => t.Column != sortRegistry.KeyName))
+            {
+                var keyDescending = terms.Count > 0 ? terms[0].Descending : descending;
+                columns.Add(new SeekColumn(typeof(T).GetProperty(sortRegistry.KeyName)!, keyDescending));
+            }
+            return columns;
+        }
+
+        private static Expression<Func<T, bool>> BuildSeekPredicate<T>(IReadOnlyList<SeekColumn> columns, IReadOnlyList<object?> lastValues)
+        {
+            var entity = Expression.Parameter(typeof(T), "e");
+            var members = columns.Select(c => (Expression)Expression.Property(entity, c.Property)).ToList();
+            var values = columns.Select((c, i) => Parameter(lastValues[i], c.Property.PropertyType)).ToList();
+
+            // Built from the last column back: (c1 > v1) || (c1 == v1 && ((c2 > v2) || (c2 == v2 && ...)))
+            // Each column compares in its own direction, so mixed asc/desc sorts seek correctly
+            var last = columns.Count - 1;
+            var predicate = Beyond(members[last], values[last], columns[last].Descending);
+            for (var i = last - 1; i >= 0; i--)
+            {
+                predicate = Expression.OrElse(
+                    Beyond(members[i], values[i], columns[i].Descending),
+                    Expression.AndAlso(Expression.Equal(members[i], values[i]), predicate));
+            }
+
+            return Expression.Lambda<Func<T, bool>>(predicate, entity);
+        }
+
+        private static Expression Beyond(Expression member, Expression value, bool descending)
+        {
+            if (member.Type == typeof(string))
+            {
+                // string.Compare(a, b) > 0 translates to a > b in SQL
+                var compare = typeof(string).GetMethod(nameof(string.Compare), new[] { typeof(string), typeof(string) })!;
+                member = Expression.Call(compare, member, value);
+                value = Expression.Constant(0);
+            }
+            return descending ? Expression.LessThan(member, value) : Expression.GreaterThan(member, value);
+        }
+
+        private static Expression Parameter(object? value, Type type)
+        {
+            var holder = Expression.Constant(new ValueHolder { Value = value });
+            return Expression.Convert(Expression.Field(holder, nameof(ValueHolder.Value)), type);
+        }
+
+        private static object? ReadValue(JsonElement element, Type type)
+        {
+            if (element.ValueKind is JsonValueKind.Undefined or JsonValueKind.Null)
+            {
+                throw new KeysetCursorException("The cursor is invalid.");
+            }
+
+            try
+            {
+                return element.Deserialize(type) ?? throw new KeysetCursorException("The cursor is invalid.");
+            }
+            catch (Exception ex) when (ex is JsonException or InvalidOperationException or NotSupportedException)
+            {
+                throw new KeysetCursorException("The cursor is invalid.");
+            }
+        }
+
+        private static string Encode(CursorPayload payload)
+        {
+            var json = JsonSerializer.SerializeToUtf8Bytes(payload);
+            return Convert.ToBase64String(json).TrimEnd('=').Replace('+', '-').Replace('/', '_');
+        }
+
+        private static CursorPayload Decode(string cursor)
+        {
+            try
+            {
+                var base64 = cursor.Replace('-', '+').Replace('_', '/');
+                base64 += new string('=', (4 - base64.Length % 4) % 4);
+                return JsonSerializer.Deserialize<CursorPayload>(Convert.FromBase64String(base64))
+                    ?? throw new KeysetCursorException("The cursor is invalid.");
+            }
+            catch (Exception ex) when (ex is FormatException or JsonException)
+            {
+                throw new KeysetCursorException("The cursor is invalid.");
+            }
+        }
+    }
+}
@@ -0,0 +1,19 @@
+namespace Employee.api.Helpers
+{
+    public class PagedResult<T>
+    {
+        public IReadOnlyList<T> Items { get; }
+        public int TotalCount { get; }
+        public int PageNumber { get; }
+        public int PageSize { get; }
+        public int TotalPages => PageSize > 0 ? (int)Math.Ceiling(TotalCount / (double)PageSize) : 0;
+
+        public PagedResult(IReadOnlyList<T> items, int totalCount, int pageNumber, int pageSize)
+        {
+            Items = items;
+            TotalCount = totalCount;
+            PageNumber = pageNumber;
+            PageSize = pageSize;
+        }
+    }
+}
@@ -3,17 +3,29 @@ namespace Employee.api.Helpers
     public class QueryParameters
     {
         private const int MaxPageSize = 50;
-        public int PageNumber { get; set; } = 1;
+
+        private int _pageNumber = 1;
+        public int PageNumber
+        {
+            get => _pageNumber;
+            set => _pageNumber = (value < 1) ? 1 : value;
+        }
 
         private int _pageSize = 10;
         public int PageSize
         {
             get => _pageSize;
-            set => _pageSize = (value > MaxPageSize) ? MaxPageSize : value;
+            set => _pageSize = (value > MaxPageSize) ? MaxPageSize : (value < 1) ? 1 : value;
         }
 
         public string? SortBy { get; set; }
         public string? SortOrder { get; set; } // "asc" or "desc"
         public string? Filter { get; set; }
+        public string? SearchMode { get; set; } // "prefix" (default), "fulltext" or "contains"
+
+        // Keyset (seek) paging: opt in with Keyset=true for the first page, then pass back NextCursor
+        public bool Keyset { get; set; }
+        public string? Cursor { get; set; }
+        public bool UsesKeyset => Keyset || !string.IsNullOrEmpty(Cursor);
     }
 }
@@ -0,0 +1,35 @@
+using Microsoft.EntityFrameworkCore;
+
+namespace Employee.api.Helpers
+{
+    public static class QueryableExtensions
+    {
+        /// <summary>
+        /// Runs a COUNT over the filtered query, then fetches only the requested page.
+        /// </summary>
+        public static async Task<PagedResult<T>> ToPagedResultAsync<T>(this IQueryable<T> query, QueryParameters queryParameters)
+        {
+            var totalCount = await query.CountAsync();
+
+            var items = await query.Skip((queryParameters.PageNumber - 1) * queryParameters.PageSize)
+                                   .Take(queryParameters.PageSize)
+                                   .ToListAsync();
+
+            return new PagedResult<T>(items, totalCount, queryParameters.PageNumber, queryParameters.PageSize);
+        }
+
+        /// <summary>
+        /// Same page shape from an already paged sequence (e.g. a compiled query) and a separately counted total.
+        /// </summary>
+        public static async Task<PagedResult<T>> ToPagedResultAsync<T>(this IAsyncEnumerable<T> page, int totalCount, QueryParameters queryParameters)
+        {
+            var items = new List<T>(queryParameters.PageSize);
+            await foreach (var item in page)
+            {
+                items.Add(item);
+            }
+
+            return new PagedResult<T>(items, totalCount, queryParameters.PageNumber, queryParameters.PageSize);
+        }
+    }
+}
@@ -0,0 +1,97 @@
+using Microsoft.EntityFrameworkCore;
+using Emp = Employee.api.Model.Employee;
+
+namespace Employee.api.Helpers
+{
+    public enum SearchMode
+    {
+        // Legacy LIKE '%term%': always a full scan, kept for comparison
+        Contains,
+        // LIKE 'term%' on each indexed column: index seeks
+        Prefix,
+        // CONTAINS(col, '"term*"'): word-prefix matches, needs the full-text index from employeeManagerDb.sql
+        FullText
+    }
+
+    public static class SearchExtensions
+    {
+        public static bool TryResolveMode(string? requested, IConfiguration configuration, out SearchMode mode)
+        {
+            var value = string.IsNullOrEmpty(requested) ? configuration["Search:Mode"] : requested;
+            if (string.IsNullOrEmpty(value))
+            {
+                mode = SearchMode.Prefix;
+                return true;
+            }
+            return Enum.TryParse(value, ignoreCase: true, out mode) && Enum.IsDefined(mode);
+        }
+
+        /// <summary>
+        /// Filters employees whose name, email, city or contact number matches the term.
+        /// </summary>
+        public static IQueryable<Emp> Search(this IQueryable<Emp> employees, string term, SearchMode mode)
+        {
+            term = term.Trim();
+            switch (mode)
+            {
+                case SearchMode.FullText:
+                    var fullTextTerm = ToFullTextPrefix(term);
+                    return employees.Where(e => EF.Functions.Contains(e.Name, fullTextTerm)
+                                             || EF.Functions.Contains(e.Email, fullTextTerm)
+                                             || EF.Functions.Contains(e.City, fullTextTerm)
+                                             || EF.Functions.Contains(e.ContactNo, fullTextTerm));
+                case SearchMode.Contains:
+                    return employees.Where(e => e.Name.Contains(term) || e.Email.Contains(term)
+                                             || e.City.Contains(term) || e.ContactNo.Contains(term));
+                default:
+                    // Each OR branch is a seek on its own index (IX_employeeTbl_name/email/city/contactNo)
+                    var pattern = ToLikePrefix(term);
+                    return employees.Where(e => EF.Functions.Like(e.Name, pattern, "\\")
+                                             || EF.Functions.Like(e.Email, pattern, "\\")
+                                             || EF.Functions.Like(e.City, pattern, "\\")
+                                             || EF.Functions.Like(e.ContactNo, pattern, "\\"));
+            }
+        }
+
+        /// <summary>
+        /// Orders search results by relevance: exact name, then name prefix, email prefix, city/contact prefix.
+        /// </summary>
+        public static IQueryable<Emp> OrderByRank(this IQueryable<Emp> employees, string term)
+        {
+            term = term.Trim();
+            var pattern = ToLikePrefix(term);
+            return employees
+                .OrderByDescending(e => (e.Name == term ? 8 : 0)
+                                      + (EF.Functions.Like(e.Name, pattern, "\\") ? 4 : 0)
+                                      + (EF.Functions.Like(e.Email, pattern, "\\") ? 2 : 0)
+                                      + (EF.Functions.Like(e.City, pattern, "\\") || EF.Functions.Like(e.ContactNo, pattern, "\\") ? 1 : 0))
+                .ThenBy(e => e.Name)
+                .ThenBy(e => e.EmployeeId);
+        }
+
+        /// <summary>
+        /// 'abc' -> 'abc%', with LIKE wildcards in the term escaped so they match literally.
+        /// </summary>
+        public static string ToLikePrefix(string term)
+        {
+            return term.Trim()
+                       .Replace("\\", "\\\\")
+                       .Replace("%", "\\%")
+                       .Replace("_", "\\_")
+                       .Replace("[", "\\[") + "%";
+        }
+
+        /// <summary>
+        /// 'nguyen van' -> '"nguyen*" AND "van*"' for CONTAINS.
+        /// </summary>
+        public static string ToFullTextPrefix(string term)
+        {
+            var words = term.Split(' ', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries)
+                            .Select(w => w.Replace("\"", string.Empty))
+                            .Where(w => w.Length > 0)
+                            .Select(w => $"\"{w}*\"");
+            var condition = string.Join(" AND ", words);
+            return condition.Length > 0 ? condition : "\"\"";
+        }
+    }
+}
@@ -0,0 +1,67 @@
+using System.IO.Compression;
+using Microsoft.AspNetCore.ResponseCompression;
+using Microsoft.Extensions.Options;
+
+namespace Employee.api.Helpers
+{
+    public class ResponseCompressionSettings
+    {
+        // Responses with a known Content-Length below this are sent uncompressed: headers and CPU outweigh the saving
+        public int MinimumSizeBytes { get; set; } = 1024;
+
+        // Fastest suits per-request compression of dynamic JSON; Optimal Brotli costs several times the CPU
+        public CompressionLevel Level { get; set; } = CompressionLevel.Fastest;
+
+        // Never compressed: responses carrying secrets (JWT) are kept out of reach of BREACH-style attacks
+        public string[] ExcludedPaths { get; set; } = { "/api/Auth" };
+    }
+
+    /// <summary>
+    /// The default <see cref="ResponseCompressionProvider"/> plus a minimum size and excluded paths.
+    /// Streamed responses (no Content-Length, e.g. the export) are always compressed if the MIME type allows it.
+    /// </summary>
+    public sealed class SizeThresholdCompressionProvider : IResponseCompressionProvider
+    {
+        private readonly ResponseCompressionProvider _inner;
+        private readonly ResponseCompressionSettings _settings;
+
+        public SizeThresholdCompressionProvider(IServiceProvider services, IOptions<ResponseCompressionOptions> options, ResponseCompressionSettings settings)
+        {
+            _inner = new ResponseCompressionProvider(services, options);
+            _settings = settings;
+        }
+
+        public ICompressionProvider? GetCompressionProvider(HttpContext context) => _inner.GetCompressionProvider(context);
+
+        public bool CheckRequestAcceptsCompression(HttpContext context)
+        {
+            if (_settings.ExcludedPaths.Any(path => context.Request.Path.StartsWithSegments(path, StringComparison.OrdinalIgnoreCase)))
+            {
+                return false;
+            }
+            return _inner.CheckRequestAcceptsCompression(context);
+        }
+
+        public bool ShouldCompressResponse(HttpContext context)
+        {
+            var length = context.Response.ContentLength;
+            if (length.HasValue && length.Value < _settings.MinimumSizeBytes)
+            {
+                return false;
+            }
+            if (!_inner.ShouldCompressResponse(context))
+            {
+                return false;
+            }
+
+            // The compressed body is a different representation, so its ETag can only be weak.
+            // ConditionalGetAttribute compares weakly, so W/"x" still gets a 304.
+            var etag = context.Response.Headers.ETag.ToString();
+            if (etag.StartsWith('"'))
+            {
+                context.Response.Headers.ETag = $"W/{etag}";
+            }
+            return true;
+        }
+    }
+}
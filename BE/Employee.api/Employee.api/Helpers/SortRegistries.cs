@@ -0,0 +1,36 @@
+using Employee.api.Model;
+
+namespace Employee.api.Helpers
+{
+    /// <summary>
+    /// The columns each list endpoint accepts in <c>sortBy</c>. Anything else is a 400.
+    /// Keyset paging seeks on the same columns, so they must map to NOT NULL columns (no address/altContactNo).
+    /// </summary>
+    public static class SortRegistries
+    {
+        public static readonly SortRegistry<EmployeeListItem> Employees =
+            new SortRegistry<EmployeeListItem>(nameof(EmployeeListItem.EmployeeId), e => e.EmployeeId)
+                .Add(nameof(EmployeeListItem.Name), e => e.Name)
+                .Add(nameof(EmployeeListItem.Email), e => e.Email)
+                .Add(nameof(EmployeeListItem.ContactNo), e => e.ContactNo)
+                .Add(nameof(EmployeeListItem.City), e => e.City)
+                .Add(nameof(EmployeeListItem.State), e => e.State)
+                .Add(nameof(EmployeeListItem.Pincode), e => e.Pincode)
+                .Add(nameof(EmployeeListItem.DesignationId), e => e.DesignationId)
+                .Add(nameof(EmployeeListItem.DesignationName), e => e.DesignationName)
+                .Add(nameof(EmployeeListItem.DepartmentId), e => e.DepartmentId)
+                .Add(nameof(EmployeeListItem.DepartmentName), e => e.DepartmentName)
+                .Add(nameof(EmployeeListItem.CreateDate), e => e.CreateDate);
+
+        public static readonly SortRegistry<Department> Departments =
+            new SortRegistry<Department>(nameof(Department.DepartmentId), d => d.DepartmentId)
+                .Add(nameof(Department.DepartmentName), d => d.DepartmentName)
+                .Add(nameof(Department.IsActive), d => d.IsActive);
+
+        public static readonly SortRegistry<DesignationListItem> Designations =
+            new SortRegistry<DesignationListItem>(nameof(DesignationListItem.DesignationId), d => d.DesignationId)
+                .Add(nameof(DesignationListItem.DesignationName), d => d.DesignationName)
+                .Add(nameof(DesignationListItem.DepartmentId), d => d.DepartmentId)
+                .Add(nameof(DesignationListItem.DepartmentName), d => d.DepartmentName);
+    }
+}
@@ -0,0 +1,138 @@
+using System.Linq.Expressions;
+
+namespace Employee.api.Helpers
+{
+    public class SortColumnException : Exception
+    {
+        public SortColumnException(string message) : base(message) { }
+    }
+
+    public sealed record SortTerm(string Column, bool Descending);
+
+    /// <summary>
+    /// Whitelist of sortable columns for one row type, each mapped to a typed key selector built once at startup.
+    /// <c>sortBy</c> is a comma-separated list of columns, each optionally suffixed with <c>:asc</c> or <c>:desc</c>
+    /// (e.g. <c>departmentName,name:desc</c>); columns without a suffix use <c>sortOrder</c>. The primary key is always
+    /// appended as the last sort column so equal values come back in a stable order across pages.
+    /// </summary>
+    public sealed class SortRegistry<T>
+    {
+        public const int MaxColumns = 4;
+
+        private sealed class SortColumn
+        {
+            public required string Name { get; init; }
+            public required Func<IQueryable<T>, bool, IOrderedQueryable<T>> OrderBy { get; init; }
+            public required Func<IOrderedQueryable<T>, bool, IOrderedQueryable<T>> ThenBy { get; init; }
+        }
+
+        private readonly Dictionary<string, SortColumn> _columns = new(StringComparer.OrdinalIgnoreCase);
+        private readonly SortColumn _key;
+
+        public SortRegistry(string keyName, Expression<Func<T, int>> keySelector)
+        {
+            _key = CreateColumn(keyName, keySelector);
+            _columns.Add(keyName, _key);
+        }
+
+        public IReadOnlyCollection<string> Columns => _columns.Keys;
+
+        public string KeyName => _key.Name;
+
+        public SortRegistry<T> Add<TKey>(string name, Expression<Func<T, TKey>> selector)
+        {
+            _columns.Add(name, CreateColumn(name, selector));
+            return this;
+        }
+
+        public bool IsSortable(string column) => _columns.ContainsKey(column);
+
+        /// <summary>
+        /// Splits and validates <paramref name="sortBy"/>; throws <see cref="SortColumnException"/> for unknown columns.
+        /// Column names come back in their registered casing. Empty input gives an empty list.
+        /// </summary>
+        public IReadOnlyList<SortTerm> Parse(string? sortBy, string? sortOrder)
+        {
+            var terms = new List<SortTerm>();
+            if (string.IsNullOrWhiteSpace(sortBy))
+            {
+                return terms;
+            }
+
+            var defaultDescending = IsDescending(sortOrder);
+            foreach (var part in sortBy.Split(',', StringSplitOptions.TrimEntries | StringSplitOptions.RemoveEmptyEntries))
+            {
+                var name = part;
+                var descending = defaultDescending;
+                var colon = part.IndexOf(':');
+                if (colon >= 0)
+                {
+                    name = part[..colon].Trim();
+                    var direction = part[(colon + 1)..].Trim();
+                    if (!string.Equals(direction, "asc", StringComparison.OrdinalIgnoreCase) && !IsDescending(direction))
+                    {
+                        throw new SortColumnException($"Unknown sort direction '{direction}' for '{name}'. Use asc or desc.");
+                    }
+                    descending = IsDescending(direction);
+                }
+
+                if (!_columns.TryGetValue(name, out var column))
+                {
+                    throw new SortColumnException($"Cannot sort by '{name}'. Supported columns: {string.Join(", ", _columns.Keys)}.");
+                }
+                if (terms.Any(t => t.Column == column.Name))
+                {
+                    throw new SortColumnException($"'{column.Name}' appears more than once in sortBy.");
+                }
+                terms.Add(new SortTerm(column.Name, descending));
+            }
+
+            if (terms.Count > MaxColumns)
+            {
+                throw new SortColumnException($"At most {MaxColumns} sort columns are allowed.");
+            }
+            return terms;
+        }
+
+        /// <summary>
+        /// Orders by the parsed <paramref name="sortBy"/> columns, then by the key (in the first column's direction).
+        /// With no columns the query is ordered by the key alone.
+        /// </summary>
+        public IOrderedQueryable<T> Apply(IQueryable<T> query, string? sortBy, string? sortOrder)
+        {
+            return Apply(query, Parse(sortBy, sortOrder), IsDescending(sortOrder));
+        }
+
+        public IOrderedQueryable<T> Apply(IQueryable<T> query, IReadOnlyList<SortTerm> terms, bool keyDescending = false)
+        {
+            if (terms.Count == 0)
+            {
+                return _key.OrderBy(query, keyDescending);
+            }
+
+            var ordered = _columns[terms[0].Column].OrderBy(query, terms[0].Descending);
+            for (var i = 1; i < terms.Count; i++)
+            {
+                ordered = _columns[terms[i].Column].ThenBy(ordered, terms[i].Descending);
+            }
+
+            if (terms.All(t => t.Column != _key.Name))
+            {
+                ordered = _key.ThenBy(ordered, terms[0].Descending);
+            }
+            return ordered;
+        }
+
+        private static bool IsDescending(string? direction) => string.Equals(direction, "desc", StringComparison.OrdinalIgnoreCase);
+
+        private static SortColumn CreateColumn<TKey>(string name, Expression<Func<T, TKey>> selector)
+        {
+            return new SortColumn
+            {
+                Name = name,
+                OrderBy = (query, descending) => descending ? query.OrderByDescending(selector) : query.OrderBy(selector),
+                ThenBy = (query, descending) => descending ? query.ThenByDescending(selector) : query.ThenBy(selector)
+            };
+        }
+    }
+}
@@ -0,0 +1,82 @@
+using Employee.api.Helpers;
+
+namespace Employee.api.Model
+{
+    public class BatchDeleteRequest
+    {
+        public List<int> Ids { get; set; } = new();
+    }
+
+    public class BatchUpdateRequest<TPatch> where TPatch : new()
+    {
+        public List<int> Ids { get; set; } = new();
+        public TPatch Patch { get; set; } = new();
+    }
+
+    // Null fields are left unchanged
+    public class EmployeePatch
+    {
+        public int? DesignationId { get; set; }
+        public string? City { get; set; }
+        public string? State { get; set; }
+    }
+
+    public class DepartmentPatch
+    {
+        public bool? IsActive { get; set; }
+    }
+
+    public class DesignationPatch
+    {
+        public int? DepartmentId { get; set; }
+    }
+
+    public static class BatchItemStatus
+    {
+        public const string Deleted = "deleted";
+        public const string Updated = "updated";
+        public const string NotFound = "notFound";
+        public const string InUse = "inUse";
+    }
+
+    public class BatchItemResult
+    {
+        public int Id { get; set; }
+        public string Status { get; set; } = string.Empty;
+        public string? Message { get; set; }
+    }
+
+    public class BatchResult
+    {
+        public int Requested { get; set; }
+        public int Succeeded { get; set; }
+        public int Failed { get; set; }
+        public List<BatchItemResult> Results { get; set; } = new();
+
+        /// <summary>
+        /// One result per distinct id, in request order: <paramref name="successStatus"/> for ids in
+        /// <paramref name="succeeded"/>, the matching entry of <paramref name="failures"/> otherwise.
+        /// </summary>
+        public static BatchResult Create(IReadOnlyList<int> ids, ICollection<int> succeeded, string successStatus,
+            IReadOnlyDictionary<int, BatchItemResult> failures)
+        {
+            var result = new BatchResult { Requested = ids.Count };
+            foreach (var id in ids)
+            {
+                if (succeeded.Contains(id))
+                {
+                    result.Results.Add(new BatchItemResult { Id = id, Status = successStatus });
+                    result.Succeeded++;
+                }
+                else
+                {
+                    result.Results.Add(failures.TryGetValue(id, out var failure)
+                        ? failure
+                        : new BatchItemResult { Id = id, Status = BatchItemStatus.NotFound, Message = ErrorMessages.NotFound });
+                    result.Failed++;
+                }
+            }
+            return result;
+        }
+    }
+}
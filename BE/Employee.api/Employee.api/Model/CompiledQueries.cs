@@ -0,0 +1,80 @@
+using Microsoft.EntityFrameworkCore;
+
+namespace Employee.api.Model
+{
+    /// <summary>
+    /// Queries on the hot read paths, translated to SQL once at startup instead of on every request.
+    /// List pages use the same projection as the controller, <see cref="EmployeeListItem.FromEmployee"/>.
+    /// </summary>
+    public static class CompiledQueries
+    {
+        public static readonly Func<EmployeeDbContext, int, Task<Employee?>> EmployeeById =
+            EF.CompileAsyncQuery((EmployeeDbContext context, int id) =>
+                context.Employees.AsNoTracking().FirstOrDefault(e => e.EmployeeId == id));
+
+        // Tracked: a successful login may rehash the password and save it
+        public static readonly Func<EmployeeDbContext, string, Task<Employee?>> EmployeeByEmail =
+            EF.CompileAsyncQuery((EmployeeDbContext context, string email) =>
+                context.Employees.FirstOrDefault(e => e.Email == email));
+
+        public static readonly Func<EmployeeDbContext, int, Task<Department?>> DepartmentById =
+            EF.CompileAsyncQuery((EmployeeDbContext context, int id) =>
+                context.Departments.AsNoTracking().FirstOrDefault(d => d.DepartmentId == id));
+
+        public static readonly Func<EmployeeDbContext, int, Task<Designation?>> DesignationById =
+            EF.CompileAsyncQuery((EmployeeDbContext context, int id) =>
+                context.Designations.AsNoTracking().FirstOrDefault(d => d.DesignationId == id));
+
+        public static readonly Func<EmployeeDbContext, Task<int>> EmployeeCount =
+            EF.CompileAsyncQuery((EmployeeDbContext context) => context.Employees.Count());
+
+        // Unfiltered list pages in the orders the UI asks for; employeeId breaks ties so pages never overlap
+        public static readonly Func<EmployeeDbContext, int, int, IAsyncEnumerable<EmployeeListItem>> EmployeePageByName =
+            EF.CompileAsyncQuery((EmployeeDbContext context, int skip, int take) =>
+                context.Employees
+                    .OrderBy(e => e.Name)
+                    .ThenBy(e => e.EmployeeId)
+                    .Select(EmployeeListItem.FromEmployee)
+                    .Skip(skip).Take(take));
+
+        public static readonly Func<EmployeeDbContext, int, int, IAsyncEnumerable<EmployeeListItem>> EmployeePageByNameDescending =
+            EF.CompileAsyncQuery((EmployeeDbContext context, int skip, int take) =>
+                context.Employees
+                    .OrderByDescending(e => e.Name)
+                    .ThenByDescending(e => e.EmployeeId)
+                    .Select(EmployeeListItem.FromEmployee)
+                    .Skip(skip).Take(take));
+
+        public static readonly Func<EmployeeDbContext, int, int, IAsyncEnumerable<EmployeeListItem>> EmployeePageById =
+            EF.CompileAsyncQuery((EmployeeDbContext context, int skip, int take) =>
+                context.Employees
+                    .OrderBy(e => e.EmployeeId)
+                    .Select(EmployeeListItem.FromEmployee)
+                    .Skip(skip).Take(take));
+
+        public static readonly Func<EmployeeDbContext, int, int, IAsyncEnumerable<EmployeeListItem>> EmployeePageByIdDescending =
+            EF.CompileAsyncQuery((EmployeeDbContext context, int skip, int take) =>
+                context.Employees
+                    .OrderByDescending(e => e.EmployeeId)
+                    .Select(EmployeeListItem.FromEmployee)
+                    .Skip(skip).Take(take));
+
+        /// <summary>
+        /// Compiled page query for an unfiltered list sorted by nothing, employeeId or name; null for any other sort.
+        /// Same order as SortRegistries.Employees: with no sortBy, sortOrder applies to employeeId.
+        /// </summary>
+        public static Func<EmployeeDbContext, int, int, IAsyncEnumerable<EmployeeListItem>>? EmployeePageFor(string? sortBy, string? sortOrder)
+        {
+            var descending = string.Equals(sortOrder, "desc", StringComparison.OrdinalIgnoreCase);
+            if (string.IsNullOrEmpty(sortBy) || string.Equals(sortBy, nameof(Employee.EmployeeId), StringComparison.OrdinalIgnoreCase))
+            {
+                return descending ? EmployeePageByIdDescending : EmployeePageById;
+            }
+            if (string.Equals(sortBy, nameof(Employee.Name), StringComparison.OrdinalIgnoreCase))
+            {
+                return descending ? EmployeePageByNameDescending : EmployeePageByName;
+            }
+            return null;
+        }
+    }
+}
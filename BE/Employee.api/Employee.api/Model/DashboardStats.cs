@@ -0,0 +1,37 @@
+namespace Employee.api.Model
+{
+    public class DashboardStats
+    {
+        public int TotalEmployees { get; set; }
+        public int TotalDepartments { get; set; }
+        public int ActiveDepartments { get; set; }
+        public int RecentHireCount { get; set; }
+        public int RecentHireDays { get; set; }
+        public List<DepartmentHeadcount> EmployeesPerDepartment { get; set; } = new();
+        public List<DesignationHeadcount> EmployeesPerDesignation { get; set; } = new();
+        public List<RecentHire> RecentHires { get; set; } = new();
+    }
+
+    public class DepartmentHeadcount
+    {
+        public int DepartmentId { get; set; }
+        public string DepartmentName { get; set; } = string.Empty;
+        public int EmployeeCount { get; set; }
+    }
+
+    public class DesignationHeadcount
+    {
+        public int DesignationId { get; set; }
+        public string DesignationName { get; set; } = string.Empty;
+        public int DepartmentId { get; set; }
+        public int EmployeeCount { get; set; }
+    }
+
+    public class RecentHire
+    {
+        public int EmployeeId { get; set; }
+        public string Name { get; set; } = string.Empty;
+        public int DesignationId { get; set; }
+        public DateTime CreateDate { get; set; }
+    }
+}
@@ -1,5 +1,6 @@
 ﻿using System.ComponentModel.DataAnnotations;
 using System.ComponentModel.DataAnnotations.Schema;
+using System.Text.Json.Serialization;
 
 namespace Employee.api.Model
 {
@@ -12,6 +13,9 @@ namespace Employee.api.Model
         public int DesignationId { get; set; }
         [Column("departmentId")]
         public int DepartmentId { get; set; }
+        // Only for queries, see Employee.Designation
+        [JsonIgnore]
+        public Department? Department { get; set; }
         [Required, MaxLength(50)]
         [Column("designationName")]
         public string DesignationName { get; set; } = string.Empty;
@@ -0,0 +1,26 @@
+using System.Linq.Expressions;
+
+namespace Employee.api.Model
+{
+    /// <summary>
+    /// Row of the designation list, with the department name joined in SQL.
+    /// </summary>
+    public class DesignationListItem
+    {
+        public int DesignationId { get; set; }
+        public int DepartmentId { get; set; }
+        public string DesignationName { get; set; } = string.Empty;
+        public string DepartmentName { get; set; } = string.Empty;
+
+        /// <summary>
+        /// Designation -> list row; the department navigation becomes an INNER JOIN.
+        /// </summary>
+        public static readonly Expression<Func<Designation, DesignationListItem>> FromDesignation = d => new DesignationListItem
+        {
+            DesignationId = d.DesignationId,
+            DepartmentId = d.DepartmentId,
+            DesignationName = d.DesignationName,
+            DepartmentName = d.Department!.DepartmentName
+        };
+    }
+}
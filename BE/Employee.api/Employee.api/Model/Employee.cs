@@ -1,5 +1,6 @@
 ﻿using System.ComponentModel.DataAnnotations;
 using System.ComponentModel.DataAnnotations.Schema;
+using System.Text.Json.Serialization;
 
 namespace Employee.api.Model
 {
@@ -34,6 +35,9 @@ namespace Employee.api.Model
         public string Address { get; set; } = string.Empty;
         [Column("designationId")]
         public int DesignationId { get; set; } 
+        // Only for queries (e.Designation.DesignationName becomes a join); never loaded or serialized
+        [JsonIgnore]
+        public Designation? Designation { get; set; }
         [Column("createDate")]
         public DateTime CreateDate { get; set; }
         [Column("modifiedDate")] // Correcting typo but keeping DB column name
@@ -11,5 +11,22 @@ namespace Employee.api.Model
         public DbSet<Employee> Employees { get; set; }
         public DbSet<Department> Departments{ get; set; }
         public DbSet<Designation> Designations{ get; set; }
+
+        protected override void OnModelCreating(ModelBuilder modelBuilder)
+        {
+            // Employee -> Designation -> Department, same as the FKs in employeeManagerDb.sql:
+            // required (INNER JOIN) and no cascade delete
+            modelBuilder.Entity<Employee>()
+                .HasOne(e => e.Designation)
+                .WithMany()
+                .HasForeignKey(e => e.DesignationId)
+                .OnDelete(DeleteBehavior.Restrict);
+
+            modelBuilder.Entity<Designation>()
+                .HasOne(d => d.Department)
+                .WithMany()
+                .HasForeignKey(d => d.DepartmentId)
+                .OnDelete(DeleteBehavior.Restrict);
+        }
     }
 }
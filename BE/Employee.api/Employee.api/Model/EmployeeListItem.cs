@@ -0,0 +1,43 @@
+using System.Linq.Expressions;
+
+namespace Employee.api.Model
+{
+    /// <summary>
+    /// Row of the employee list. Selected directly in SQL, so the password hash and address are never read.
+    /// </summary>
+    public class EmployeeListItem
+    {
+        public int EmployeeId { get; set; }
+        public string Name { get; set; } = string.Empty;
+        public string Email { get; set; } = string.Empty;
+        public string ContactNo { get; set; } = string.Empty;
+        public string City { get; set; } = string.Empty;
+        public string State { get; set; } = string.Empty;
+        public string Pincode { get; set; } = string.Empty;
+        public int DesignationId { get; set; }
+        public string DesignationName { get; set; } = string.Empty;
+        public int DepartmentId { get; set; }
+        public string DepartmentName { get; set; } = string.Empty;
+        public DateTime CreateDate { get; set; }
+
+        /// <summary>
+        /// Employee -> list row. The designation/department navigations become INNER JOINs, so a page
+        /// (names included) is one SQL query. Shared by the controller and <see cref="CompiledQueries"/>.
+        /// </summary>
+        public static readonly Expression<Func<Employee, EmployeeListItem>> FromEmployee = e => new EmployeeListItem
+        {
+            EmployeeId = e.EmployeeId,
+            Name = e.Name,
+            Email = e.Email,
+            ContactNo = e.ContactNo,
+            City = e.City,
+            State = e.State,
+            Pincode = e.Pincode,
+            DesignationId = e.DesignationId,
+            DesignationName = e.Designation!.DesignationName,
+            DepartmentId = e.Designation.DepartmentId,
+            DepartmentName = e.Designation.Department!.DepartmentName,
+            CreateDate = e.CreateDate
+        };
+    }
+}
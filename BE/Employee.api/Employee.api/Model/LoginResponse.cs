@@ -0,0 +1,7 @@
+namespace Employee.api.Model
+{
+    public class LoginResponse
+    {
+        public string Token { get; set; } = string.Empty;
+    }
+}
@@ -1,13 +1,17 @@
 using Employee.api.Helpers;
 using Employee.api.Model;
+using Employee.api.Services;
 using FluentValidation;
 using FluentValidation.AspNetCore;
 using Microsoft.AspNetCore.Authentication.JwtBearer;
 using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.ResponseCompression;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection.Extensions;
 using Microsoft.IdentityModel.Tokens;
 using System.Text;
 using System.Text.Json;
+using System.Text.Json.Serialization;
 
 var MyAllowSpecificOrigins = "_myAllowSpecificOrigins";
 
@@ -20,7 +24,8 @@ builder.Services.AddCors(options =>
                       {
                           policy.WithOrigins("http://localhost:4200")
                                 .AllowAnyHeader()
-                                .AllowAnyMethod();
+                                .AllowAnyMethod()
+                                .WithExposedHeaders("ETag"); // read by the Angular ETag interceptor
                       });
 });
 
@@ -30,6 +35,10 @@ builder.Services.AddControllers()
     .AddJsonOptions(options =>
     {
         options.JsonSerializerOptions.PropertyNamingPolicy = JsonNamingPolicy.CamelCase;
+        // Null properties are left out of the body (e.g. errorCode on success, nextCursor on the last page)
+        options.JsonSerializerOptions.DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull;
+        // Source-generated metadata first; reflection only for types the context doesn't list
+        options.JsonSerializerOptions.TypeInfoResolverChain.Insert(0, ApiJsonSerializerContext.Default);
     });
 builder.Services.AddFluentValidationAutoValidation();
 builder.Services.AddValidatorsFromAssemblyContaining<Employee.api.Validators.DepartmentValidator>();
@@ -40,7 +49,8 @@ builder.Services.Configure<ApiBehaviorOptions>(options =>
     {
         var errors = context.ModelState.Values
             .SelectMany(v => v.Errors)
-            .Select(e => e.ErrorMessage);
+            .Select(e => e.ErrorMessage)
+            .ToList();
 
         var errorResponse = new ApiResponse(400, errors, ErrorMessages.ValidationError, ErrorCodes.Validation);
 
@@ -48,8 +58,37 @@ builder.Services.Configure<ApiBehaviorOptions>(options =>
     };
 });
 
-builder.Services.AddDbContext<EmployeeDbContext>(options =>
-    options.UseSqlServer(builder.Configuration.GetConnectionString("empCon")));
+// Pooled: contexts are reset and reused instead of being built for every request
+builder.Services.AddDbContextPool<EmployeeDbContext>(options =>
+    options.UseSqlServer(builder.Configuration.GetConnectionString("empCon")),
+    builder.Configuration.GetValue("Database:PoolSize", 1024));
+
+builder.Services.AddMemoryCache();
+
+// BCrypt runs on its own bounded worker queue instead of request threads
+builder.Services.AddSingleton(builder.Configuration.GetSection("PasswordHashing").Get<PasswordHashingOptions>() ?? new PasswordHashingOptions());
+builder.Services.AddSingleton<PasswordHashingQueue>();
+
+// Department/Designation reads, invalidated by their own Post/Put/Delete
+builder.Services.AddSingleton(builder.Configuration.GetSection("MasterDataCache").Get<MasterDataCacheOptions>() ?? new MasterDataCacheOptions());
+builder.Services.AddSingleton<MasterDataCache>();
+
+// Bulk CSV/NDJSON import (uses the DbContext, so one per request)
+builder.Services.AddScoped<EmployeeImporter>();
+
+// Brotli/gzip for JSON, CSV and NDJSON bodies above a minimum size
+var compressionSettings = builder.Configuration.GetSection("ResponseCompression").Get<ResponseCompressionSettings>() ?? new ResponseCompressionSettings();
+builder.Services.AddSingleton(compressionSettings);
+builder.Services.AddResponseCompression(options =>
+{
+    options.EnableForHttps = true;
+    options.Providers.Add<BrotliCompressionProvider>();
+    options.Providers.Add<GzipCompressionProvider>();
+    options.MimeTypes = ResponseCompressionDefaults.MimeTypes.Concat(new[] { "text/csv", "application/x-ndjson" });
+});
+builder.Services.Configure<BrotliCompressionProviderOptions>(options => options.Level = compressionSettings.Level);
+builder.Services.Configure<GzipCompressionProviderOptions>(options => options.Level = compressionSettings.Level);
+builder.Services.Replace(ServiceDescriptor.Singleton<IResponseCompressionProvider, SizeThresholdCompressionProvider>());
 
 // JWT Authentication
 builder.Services.AddAuthentication(JwtBearerDefaults.AuthenticationScheme)
@@ -74,6 +113,8 @@ builder.Services.AddSwaggerGen();
 var app = builder.Build();
 
 // Configure the HTTP request pipeline.
+app.UseResponseCompression(); // First, so every body written below goes through it
+
 if (app.Environment.IsDevelopment())
 {
     app.UseSwagger();
@@ -0,0 +1,74 @@
+using System.Globalization;
+using System.Text;
+using System.Text.Json;
+using Employee.api.Helpers;
+using Employee.api.Model;
+
+namespace Employee.api.Services
+{
+    /// <summary>
+    /// Writes employee list rows to a stream as they arrive from the database reader,
+    /// flushing every <see cref="FlushEvery"/> rows, so memory stays flat whatever the table size.
+    /// </summary>
+    public static class EmployeeExporter
+    {
+        public const int FlushEvery = 500;
+
+        private static readonly string[] CsvHeader =
+        {
+            "employeeId", "name", "email", "contactNo", "city", "state", "pincode",
+            "designationId", "designationName", "departmentId", "departmentName", "createDate"
+        };
+
+        // BOM so Excel opens the Vietnamese names as UTF-8
+        private static readonly Encoding CsvEncoding = new UTF8Encoding(encoderShouldEmitUTF8Identifier: true);
+        private static readonly Encoding NdjsonEncoding = new UTF8Encoding(encoderShouldEmitUTF8Identifier: false);
+
+        public static bool TryGetContentType(string format, out string contentType)
+        {
+            contentType = format.ToLowerInvariant() switch
+            {
+                "csv" => "text/csv; charset=utf-8",
+                "ndjson" => "application/x-ndjson",
+                _ => string.Empty
+            };
+            return contentType.Length > 0;
+        }
+
+        public static async Task<int> WriteCsvAsync(IAsyncEnumerable<EmployeeListItem> rows, Stream output, CancellationToken cancellationToken)
+        {
+            await using var writer = new StreamWriter(output, CsvEncoding, leaveOpen: true) { NewLine = "\r\n" };
+            await writer.WriteLineAsync(Csv.FormatRecord(CsvHeader));
+
+            return await WriteRowsAsync(rows, writer, row => Csv.FormatRecord(new[]
+            {
+                row.EmployeeId.ToString(CultureInfo.InvariantCulture), row.Name, row.Email, row.ContactNo, row.City, row.State, row.Pincode,
+                row.DesignationId.ToString(CultureInfo.InvariantCulture), row.DesignationName,
+                row.DepartmentId.ToString(CultureInfo.InvariantCulture), row.DepartmentName,
+                row.CreateDate.ToString("s", CultureInfo.InvariantCulture)
+            }), cancellationToken);
+        }
+
+        public static async Task<int> WriteNdjsonAsync(IAsyncEnumerable<EmployeeListItem> rows, Stream output, CancellationToken cancellationToken)
+        {
+            await using var writer = new StreamWriter(output, NdjsonEncoding, leaveOpen: true) { NewLine = "\n" };
+            return await WriteRowsAsync(rows, writer, row => JsonSerializer.Serialize(row, ApiJsonSerializerContext.Default.EmployeeListItem), cancellationToken);
+        }
+
+        private static async Task<int> WriteRowsAsync(IAsyncEnumerable<EmployeeListItem> rows, StreamWriter writer,
+            Func<EmployeeListItem, string> format, CancellationToken cancellationToken)
+        {
+            var count = 0;
+            await foreach (var row in rows.WithCancellation(cancellationToken))
+            {
+                await writer.WriteLineAsync(format(row));
+                if (++count % FlushEvery == 0)
+                {
+                    await writer.FlushAsync(cancellationToken);
+                }
+            }
+            await writer.FlushAsync(cancellationToken);
+            return count;
+        }
+    }
+}
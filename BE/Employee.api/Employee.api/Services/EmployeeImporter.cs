@@ -0,0 +1,297 @@
+using System.Diagnostics;
+using System.Runtime.CompilerServices;
+using System.Text.Json;
+using Employee.api.Helpers;
+using Employee.api.Model;
+using FluentValidation;
+using Microsoft.EntityFrameworkCore;
+using Emp = Employee.api.Model.Employee;
+
+namespace Employee.api.Services
+{
+    public class ImportRowError
+    {
+        public int Row { get; set; }
+        public string? Email { get; set; }
+        public List<string> Errors { get; set; } = new();
+    }
+
+    public class ImportReport
+    {
+        public int TotalRows { get; set; }
+        public int Imported { get; set; }
+        public int Failed { get; set; }
+        public long ElapsedMs { get; set; }
+        public double RowsPerSecond { get; set; }
+        // Capped at MaxReportedErrors; Failed has the full count
+        public List<ImportRowError> Errors { get; set; } = new();
+    }
+
+    /// <summary>
+    /// Streams employees out of a CSV or NDJSON request body and inserts them in batches.
+    /// Rows are validated with <see cref="Validators.EmployeeValidator"/>, passwords are hashed in parallel on the
+    /// <see cref="PasswordHashingQueue"/>, and each batch is one SaveChanges (one transaction). Only the current
+    /// batch (plus the set of emails seen so far) is held in memory. Duplicate emails, within the file or against
+    /// the table, are rejected per row before the insert; if a batch still fails it is retried row by row so
+    /// only the offending rows are reported, and the import carries on.
+    /// </summary>
+    public class EmployeeImporter
+    {
+        public const int BatchSize = 500;
+        public const int MaxReportedErrors = 1000;
+
+        private static readonly Dictionary<string, Action<Emp, string>> CsvColumns = new(StringComparer.OrdinalIgnoreCase)
+        {
+            ["name"] = (e, v) => e.Name = v,
+            ["contactNo"] = (e, v) => e.ContactNo = v,
+            ["email"] = (e, v) => e.Email = v,
+            ["city"] = (e, v) => e.City = v,
+            ["state"] = (e, v) => e.State = v,
+            ["pincode"] = (e, v) => e.Pincode = v,
+            ["altContactNo"] = (e, v) => e.AltContactNo = v,
+            ["address"] = (e, v) => e.Address = v,
+            ["designationId"] = (e, v) => e.DesignationId = int.TryParse(v, out var id) ? id : 0,
+            ["password"] = (e, v) => e.Password = v
+        };
+
+        private readonly EmployeeDbContext _context;
+        private readonly IValidator<Emp> _validator;
+        private readonly PasswordHashingQueue _passwordHashing;
+
+        private sealed record ParsedRow(int Row, Emp? Employee, string? Error);
+
+        public EmployeeImporter(EmployeeDbContext context, IValidator<Emp> validator, PasswordHashingQueue passwordHashing)
+        {
+            _context = context;
+            _validator = validator;
+            _passwordHashing = passwordHashing;
+        }
+
+        public static bool IsCsv(string? contentType) => contentType != null && contentType.Contains("csv", StringComparison.OrdinalIgnoreCase);
+
+        public static bool IsNdjson(string? contentType) => contentType != null
+            && (contentType.Contains("ndjson", StringComparison.OrdinalIgnoreCase) || contentType.Contains("jsonl", StringComparison.OrdinalIgnoreCase));
+
+        public async Task<ImportReport> ImportAsync(Stream body, string contentType, CancellationToken cancellationToken)
+        {
+            var stopwatch = Stopwatch.StartNew();
+            var report = new ImportReport();
+            var designationIds = (await _context.Designations.AsNoTracking().Select(d => d.DesignationId).ToListAsync(cancellationToken)).ToHashSet();
+
+            using var reader = new StreamReader(body);
+            var rows = IsCsv(contentType) ? ReadCsvAsync(reader, cancellationToken) : ReadNdjsonAsync(reader, cancellationToken);
+
+            // UX_employeeTbl_email is case-insensitive like the database collation
+            var seenEmails = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+            var batch = new List<(int Row, Emp Employee)>(BatchSize);
+            await foreach (var parsed in rows)
+            {
+                report.TotalRows++;
+                if (parsed.Employee != null)
+                {
+                    // Import only creates: ignore any id/dates in the file so the create-only rules (password) apply
+                    parsed.Employee.EmployeeId = 0;
+                    parsed.Employee.CreateDate = default;
+                    parsed.Employee.ModifiedDate = default;
+                }
+
+                var errors = parsed.Error != null ? new List<string> { parsed.Error } : await ValidateAsync(parsed.Employee!, designationIds, cancellationToken);
+                if (errors.Count == 0 && !seenEmails.Add(parsed.Employee!.Email))
+                {
+                    errors.Add("Email appears more than once in the file.");
+                }
+                if (errors.Count > 0)
+                {
+                    AddError(report, parsed.Row, parsed.Employee?.Email, errors);
+                    continue;
+                }
+
+                batch.Add((parsed.Row, parsed.Employee!));
+                if (batch.Count == BatchSize)
+                {
+                    await InsertBatchAsync(batch, report, cancellationToken);
+                    batch.Clear();
+                }
+            }
+            if (batch.Count > 0)
+            {
+                await InsertBatchAsync(batch, report, cancellationToken);
+            }
+
+            report.ElapsedMs = stopwatch.ElapsedMilliseconds;
+            report.RowsPerSecond = Math.Round(report.TotalRows / Math.Max(stopwatch.Elapsed.TotalSeconds, 0.001), 1);
+            return report;
+        }
+
+        private async Task<List<string>> ValidateAsync(Emp employee, HashSet<int> designationIds, CancellationToken cancellationToken)
+        {
+            var result = await _validator.ValidateAsync(employee, cancellationToken);
+            var errors = result.Errors.Select(e => e.ErrorMessage).ToList();
+            if (employee.DesignationId != 0 && !designationIds.Contains(employee.DesignationId))
+            {
+                errors.Add($"Designation {employee.DesignationId} does not exist.");
+            }
+            return errors;
+        }
+
+        private async Task InsertBatchAsync(List<(int Row, Emp Employee)> batch, ImportReport report, CancellationToken cancellationToken)
+        {
+            // One WHERE email IN (...) per batch, before paying for any hashing
+            var emails = batch.Select(b => b.Employee.Email).ToList();
+            var existing = (await _context.Employees.AsNoTracking()
+                .Where(e => emails.Contains(e.Email))
+                .Select(e => e.Email)
+                .ToListAsync(cancellationToken)).ToHashSet(StringComparer.OrdinalIgnoreCase);
+
+            var toInsert = new List<(int Row, Emp Employee)>(batch.Count);
+            foreach (var item in batch)
+            {
+                if (existing.Contains(item.Employee.Email))
+                {
+                    AddError(report, item.Row, item.Employee.Email, new List<string> { ErrorMessages.DuplicateEmail });
+                }
+                else
+                {
+                    toInsert.Add(item);
+                }
+            }
+
+            // Hash in parallel, but never more at once than there are workers so logins still get a slot quickly
+            var hashed = new List<(int Row, Emp Employee)>(toInsert.Count);
+            await Parallel.ForEachAsync(toInsert, new ParallelOptions { MaxDegreeOfParallelism = _passwordHashing.Workers, CancellationToken = cancellationToken },
+                async (item, _) =>
+                {
+                    try
+                    {
+                        item.Employee.Password = await _passwordHashing.HashAsync(item.Employee.Password);
+                        lock (hashed)
+                        {
+                            hashed.Add(item);
+                        }
+                    }
+                    catch (PasswordQueueFullException)
+                    {
+                        lock (report)
+                        {
+                            AddError(report, item.Row, item.Employee.Email, new List<string> { ErrorMessages.ServerBusy });
+                        }
+                    }
+                });
+
+            var now = DateTime.UtcNow;
+            foreach (var (_, employee) in hashed)
+            {
+                employee.EmployeeId = 0;
+                employee.CreateDate = now;
+                employee.ModifiedDate = now;
+            }
+
+            try
+            {
+                // One SaveChanges = one transaction; EF batches the INSERTs into a few round-trips
+                _context.Employees.AddRange(hashed.Select(h => h.Employee));
+                await _context.SaveChangesAsync(cancellationToken);
+                report.Imported += hashed.Count;
+            }
+            catch (DbUpdateException)
+            {
+                // The whole batch rolled back (e.g. an email inserted concurrently): retry alone to find the culprits
+                _context.ChangeTracker.Clear();
+                await InsertRowByRowAsync(hashed, report, cancellationToken);
+            }
+            finally
+            {
+                // Keep the change tracker (and memory) flat across batches
+                _context.ChangeTracker.Clear();
+            }
+        }
+
+        private async Task InsertRowByRowAsync(List<(int Row, Emp Employee)> hashed, ImportReport report, CancellationToken cancellationToken)
+        {
+            foreach (var (row, employee) in hashed.OrderBy(h => h.Row))
+            {
+                employee.EmployeeId = 0;
+                _context.Employees.Add(employee);
+                try
+                {
+                    await _context.SaveChangesAsync(cancellationToken);
+                    report.Imported++;
+                }
+                catch (DbUpdateException ex)
+                {
+                    var message = ex.IsUniqueViolation() ? ErrorMessages.DuplicateEmail : $"Insert failed: {ex.InnerException?.Message ?? ex.Message}";
+                    AddError(report, row, employee.Email, new List<string> { message });
+                }
+                finally
+                {
+                    _context.ChangeTracker.Clear();
+                }
+            }
+        }
+
+        private static void AddError(ImportReport report, int row, string? email, List<string> errors)
+        {
+            report.Failed++;
+            if (report.Errors.Count < MaxReportedErrors)
+            {
+                report.Errors.Add(new ImportRowError { Row = row, Email = email, Errors = errors });
+            }
+        }
+
+        private static async IAsyncEnumerable<ParsedRow> ReadNdjsonAsync(StreamReader reader, [EnumeratorCancellation] CancellationToken cancellationToken)
+        {
+            var row = 0;
+            string? line;
+            while ((line = await reader.ReadLineAsync(cancellationToken)) != null)
+            {
+                if (string.IsNullOrWhiteSpace(line))
+                {
+                    continue;
+                }
+
+                row++;
+                Emp? employee = null;
+                string? error = null;
+                try
+                {
+                    employee = JsonSerializer.Deserialize(line, ApiJsonSerializerContext.Default.Employee);
+                }
+                catch (JsonException ex)
+                {
+                    error = $"Invalid JSON: {ex.Message}";
+                }
+                yield return new ParsedRow(row, employee, employee == null ? error ?? "Empty row." : null);
+            }
+        }
+
+        private static async IAsyncEnumerable<ParsedRow> ReadCsvAsync(StreamReader reader, [EnumeratorCancellation] CancellationToken cancellationToken)
+        {
+            List<Action<Emp, string>?>? setters = null;
+            var row = 0;
+
+            await foreach (var record in Csv.ReadRecordsAsync(reader, cancellationToken))
+            {
+                // First record is the header: map columns by name, ignore unknown ones
+                if (setters == null)
+                {
+                    setters = record.Select(h => CsvColumns.GetValueOrDefault(h.Trim())).ToList();
+                    continue;
+                }
+
+                row++;
+                if (record.Count != setters.Count)
+                {
+                    yield return new ParsedRow(row, null, $"Expected {setters.Count} columns but found {record.Count}.");
+                    continue;
+                }
+
+                var employee = new Emp();
+                for (var i = 0; i < record.Count; i++)
+                {
+                    setters[i]?.Invoke(employee, record[i].Trim());
+                }
+                yield return new ParsedRow(row, employee, null);
+            }
+        }
+    }
+}
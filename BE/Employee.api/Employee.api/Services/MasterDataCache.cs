@@ -0,0 +1,149 @@
+using System.Collections.Concurrent;
+using System.Diagnostics.Metrics;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Primitives;
+
+namespace Employee.api.Services
+{
+    public class MasterDataCacheOptions
+    {
+        public int TtlSeconds { get; set; } = 300;
+
+        // Maximum number of cached responses across all tables; each entry counts as 1
+        public int SizeLimit { get; set; } = 1000;
+    }
+
+    public class MasterDataCacheStats
+    {
+        public string Table { get; set; } = string.Empty;
+        public long Hits { get; set; }
+        public long Misses { get; set; }
+        public long Invalidations { get; set; }
+        public double HitRatio => Hits + Misses == 0 ? 0 : Math.Round((double)Hits / (Hits + Misses), 3);
+    }
+
+    /// <summary>
+    /// In-process cache for Department/Designation reads. Entries expire after TtlSeconds, the cache
+    /// evicts once SizeLimit entries are stored, and every write to a table drops all of that table's entries.
+    /// Employees only get ETag entries (see <see cref="Helpers.ConditionalGetAttribute"/>), never response data.
+    /// </summary>
+    public sealed class MasterDataCache : IDisposable
+    {
+        public const string MeterName = "Employee.api.MasterDataCache";
+        public const string Departments = "departments";
+        public const string Designations = "designations";
+        public const string Employees = "employees";
+
+        private sealed class TableState
+        {
+            public CancellationTokenSource Generation = new();
+            public long Hits;
+            public long Misses;
+            public long Invalidations;
+        }
+
+        private readonly MemoryCache _cache;
+        private readonly TimeSpan _ttl;
+        private readonly ConcurrentDictionary<string, TableState> _tables = new();
+        private readonly Meter _meter = new(MeterName);
+        private readonly Counter<long> _hitCounter;
+        private readonly Counter<long> _missCounter;
+
+        public MasterDataCache(MasterDataCacheOptions options)
+        {
+            _cache = new MemoryCache(new MemoryCacheOptions { SizeLimit = Math.Max(options.SizeLimit, 1) });
+            _ttl = TimeSpan.FromSeconds(options.TtlSeconds);
+            _hitCounter = _meter.CreateCounter<long>("master_cache.hits");
+            _missCounter = _meter.CreateCounter<long>("master_cache.misses");
+            _meter.CreateObservableGauge("master_cache.entries", () => _cache.Count);
+        }
+
+        /// <summary>
+        /// Returns the cached value for (table, key) or runs the query and caches its result.
+        /// Null results (not found) are not cached.
+        /// </summary>
+        public async Task<T?> GetOrCreateAsync<T>(string table, string key, Func<Task<T?>> factory) where T : class
+        {
+            var state = _tables.GetOrAdd(table, _ => new TableState());
+            var cacheKey = $"{table}:{key}";
+
+            if (_cache.TryGetValue(cacheKey, out T? cached))
+            {
+                Interlocked.Increment(ref state.Hits);
+                _hitCounter.Add(1, new KeyValuePair<string, object?>("table", table));
+                return cached;
+            }
+
+            Interlocked.Increment(ref state.Misses);
+            _missCounter.Add(1, new KeyValuePair<string, object?>("table", table));
+
+            // Taken before querying: a write that lands while the query runs expires this entry straight away
+            var generation = CurrentGeneration(table);
+            var value = await factory();
+            if (value != null)
+            {
+                Store(cacheKey, value, generation);
+            }
+            return value;
+        }
+
+        /// <summary>
+        /// Token cancelled by the next write to the table. Capture it before reading, pass it to <see cref="SetETag"/>.
+        /// </summary>
+        public CancellationToken CurrentGeneration(string table)
+        {
+            var state = _tables.GetOrAdd(table, _ => new TableState());
+            return Volatile.Read(ref state.Generation).Token;
+        }
+
+        /// <summary>
+        /// ETag last sent for a request URL, valid until the table is written to or the TTL passes.
+        /// </summary>
+        public bool TryGetETag(string table, string requestKey, out string? etag)
+        {
+            return _cache.TryGetValue($"{table}:etag:{requestKey}", out etag);
+        }
+
+        public void SetETag(string table, string requestKey, string etag, CancellationToken generation)
+        {
+            Store($"{table}:etag:{requestKey}", etag, generation);
+        }
+
+        private void Store(string cacheKey, object value, CancellationToken generation)
+        {
+            using var entry = _cache.CreateEntry(cacheKey);
+            entry.Value = value;
+            entry.Size = 1;
+            entry.AbsoluteExpirationRelativeToNow = _ttl;
+            entry.AddExpirationToken(new CancellationChangeToken(generation));
+        }
+
+        public void Invalidate(string table)
+        {
+            var state = _tables.GetOrAdd(table, _ => new TableState());
+            var previous = Interlocked.Exchange(ref state.Generation, new CancellationTokenSource());
+            Interlocked.Increment(ref state.Invalidations);
+            // Not disposed: a concurrent reader may still be reading its Token
+            previous.Cancel();
+        }
+
+        public IReadOnlyList<MasterDataCacheStats> GetStats()
+        {
+            return _tables.OrderBy(t => t.Key)
+                .Select(t => new MasterDataCacheStats
+                {
+                    Table = t.Key,
+                    Hits = Interlocked.Read(ref t.Value.Hits),
+                    Misses = Interlocked.Read(ref t.Value.Misses),
+                    Invalidations = Interlocked.Read(ref t.Value.Invalidations)
+                })
+                .ToList();
+        }
+
+        public void Dispose()
+        {
+            _cache.Dispose();
+            _meter.Dispose();
+        }
+    }
+}
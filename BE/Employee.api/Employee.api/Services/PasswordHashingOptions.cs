@@ -0,0 +1,22 @@
+namespace Employee.api.Services
+{
+    public class PasswordHashingOptions
+    {
+        // BCrypt cost. Raising it makes existing hashes get upgraded on the next successful login.
+        public int WorkFactor { get; set; } = 11;
+
+        // Dedicated threads doing BCrypt work (0 = half the cores, at least 1)
+        public int Workers { get; set; }
+
+        // Requests allowed to wait for a worker before new ones are rejected
+        public int QueueCapacity { get; set; } = 64;
+
+        // How long a request may wait for a queue slot before it gets 503
+        public int QueueTimeoutMs { get; set; } = 2000;
+
+        public int ResolveWorkers()
+        {
+            return Workers > 0 ? Workers : Math.Max(Environment.ProcessorCount / 2, 1);
+        }
+    }
+}
@@ -0,0 +1,224 @@
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using System.Threading.Channels;
+
+namespace Employee.api.Services
+{
+    public enum PasswordVerification
+    {
+        Failed,
+        Success,
+        SuccessRehashNeeded
+    }
+
+    public class PasswordQueueFullException : Exception
+    {
+        public PasswordQueueFullException() : base("Password hashing queue is full.") { }
+    }
+
+    public class PasswordHashingStats
+    {
+        public int WorkFactor { get; set; }
+        public int Workers { get; set; }
+        public int QueueCapacity { get; set; }
+        public int QueueDepth { get; set; }
+        public int PeakQueueDepth { get; set; }
+        public long Completed { get; set; }
+        public long Rejected { get; set; }
+        public double AverageQueueWaitMs { get; set; }
+        public double AverageWorkMs { get; set; }
+        public double MaxWorkMs { get; set; }
+    }
+
+    /// <summary>
+    /// Runs BCrypt hashing/verification on a fixed set of dedicated threads fed by a bounded queue,
+    /// so a burst of logins cannot tie up the ASP.NET thread pool. Callers wait at most
+    /// QueueTimeoutMs for a queue slot and get <see cref="PasswordQueueFullException"/> after that.
+    /// </summary>
+    public sealed class PasswordHashingQueue : IDisposable
+    {
+        public const string MeterName = "Employee.api.PasswordHashing";
+
+        private sealed class WorkItem
+        {
+            public Func<object> Work { get; init; } = default!;
+            public TaskCompletionSource<object> Completion { get; } = new(TaskCreationOptions.RunContinuationsAsynchronously);
+            public long EnqueuedAt { get; } = Stopwatch.GetTimestamp();
+        }
+
+        private readonly PasswordHashingOptions _options;
+        private readonly Channel<WorkItem> _queue;
+        private readonly Thread[] _workers;
+        private readonly Meter _meter = new(MeterName);
+        private readonly Histogram<double> _workDuration;
+        private readonly Histogram<double> _queueWait;
+        private readonly Counter<long> _rejectedCounter;
+
+        private int _queueDepth;
+        private int _peakQueueDepth;
+        private long _completed;
+        private long _rejected;
+        private long _totalQueueWaitTicks;
+        private long _totalWorkTicks;
+        private long _maxWorkTicks;
+
+        public PasswordHashingQueue(PasswordHashingOptions options)
+        {
+            _options = options;
+            _queue = Channel.CreateBounded<WorkItem>(new BoundedChannelOptions(Math.Max(options.QueueCapacity, 1))
+            {
+                FullMode = BoundedChannelFullMode.Wait,
+                SingleReader = false,
+                SingleWriter = false
+            });
+
+            _workDuration = _meter.CreateHistogram<double>("password_hash.duration", "ms", "Time spent in BCrypt per operation");
+            _queueWait = _meter.CreateHistogram<double>("password_hash.queue_wait", "ms", "Time an operation waited for a worker");
+            _rejectedCounter = _meter.CreateCounter<long>("password_hash.rejected", description: "Operations rejected because the queue stayed full");
+            _meter.CreateObservableGauge("password_hash.queue_depth", () => Volatile.Read(ref _queueDepth), description: "Operations waiting or running");
+
+            _workers = new Thread[options.ResolveWorkers()];
+            for (var i = 0; i < _workers.Length; i++)
+            {
+                _workers[i] = new Thread(WorkerLoop) { IsBackground = true, Name = $"bcrypt-worker-{i}" };
+                _workers[i].Start();
+            }
+        }
+
+        public int WorkFactor => _options.WorkFactor;
+
+        public int Workers => _workers.Length;
+
+        public async Task<string> HashAsync(string password)
+        {
+            var workFactor = _options.WorkFactor;
+            return (string)await EnqueueAsync(() => BCrypt.Net.BCrypt.HashPassword(password, workFactor));
+        }
+
+        public async Task<PasswordVerification> VerifyAsync(string password, string hash)
+        {
+            var workFactor = _options.WorkFactor;
+            return (PasswordVerification)await EnqueueAsync(() =>
+            {
+                if (!BCrypt.Net.BCrypt.Verify(password, hash))
+                {
+                    return PasswordVerification.Failed;
+                }
+                return BCrypt.Net.BCrypt.PasswordNeedsRehash(hash, workFactor)
+                    ? PasswordVerification.SuccessRehashNeeded
+                    : PasswordVerification.Success;
+            });
+        }
+
+        public PasswordHashingStats GetStats()
+        {
+            var completed = Interlocked.Read(ref _completed);
+            return new PasswordHashingStats
+            {
+                WorkFactor = _options.WorkFactor,
+                Workers = _workers.Length,
+                QueueCapacity = _options.QueueCapacity,
+                QueueDepth = Volatile.Read(ref _queueDepth),
+                PeakQueueDepth = Volatile.Read(ref _peakQueueDepth),
+                Completed = completed,
+                Rejected = Interlocked.Read(ref _rejected),
+                AverageQueueWaitMs = completed == 0 ? 0 : Math.Round(ToMs(Interlocked.Read(ref _totalQueueWaitTicks)) / completed, 2),
+                AverageWorkMs = completed == 0 ? 0 : Math.Round(ToMs(Interlocked.Read(ref _totalWorkTicks)) / completed, 2),
+                MaxWorkMs = Math.Round(ToMs(Interlocked.Read(ref _maxWorkTicks)), 2)
+            };
+        }
+
+        private async Task<object> EnqueueAsync(Func<object> work)
+        {
+            var item = new WorkItem { Work = work };
+            TrackDepth(Interlocked.Increment(ref _queueDepth));
+
+            using var timeout = new CancellationTokenSource(_options.QueueTimeoutMs);
+            try
+            {
+                await _queue.Writer.WriteAsync(item, timeout.Token);
+            }
+            catch (OperationCanceledException)
+            {
+                Interlocked.Decrement(ref _queueDepth);
+                Interlocked.Increment(ref _rejected);
+                _rejectedCounter.Add(1);
+                throw new PasswordQueueFullException();
+            }
+
+            return await item.Completion.Task;
+        }
+
+        private void WorkerLoop()
+        {
+            var reader = _queue.Reader;
+            // Blocking is fine here: these are our own threads, not thread pool threads
+            while (reader.WaitToReadAsync().AsTask().GetAwaiter().GetResult())
+            {
+                while (reader.TryRead(out var item))
+                {
+                    var started = Stopwatch.GetTimestamp();
+                    object? result = null;
+                    Exception? error = null;
+                    try
+                    {
+                        result = item.Work();
+                    }
+                    catch (Exception ex)
+                    {
+                        error = ex;
+                    }
+
+                    // Counters first so a caller reading stats after its await sees its own operation
+                    Record(item.EnqueuedAt, started, Stopwatch.GetTimestamp());
+                    Interlocked.Decrement(ref _queueDepth);
+
+                    if (error != null)
+                    {
+                        item.Completion.SetException(error);
+                    }
+                    else
+                    {
+                        item.Completion.SetResult(result!);
+                    }
+                }
+            }
+        }
+
+        private void Record(long enqueuedAt, long started, long finished)
+        {
+            var waitTicks = started - enqueuedAt;
+            var workTicks = finished - started;
+
+            Interlocked.Increment(ref _completed);
+            Interlocked.Add(ref _totalQueueWaitTicks, waitTicks);
+            Interlocked.Add(ref _totalWorkTicks, workTicks);
+
+            long max;
+            while (workTicks > (max = Interlocked.Read(ref _maxWorkTicks))
+                   && Interlocked.CompareExchange(ref _maxWorkTicks, workTicks, max) != max)
+            {
+            }
+
+            _queueWait.Record(ToMs(waitTicks));
+            _workDuration.Record(ToMs(workTicks));
+        }
+
+        private void TrackDepth(int depth)
+        {
+            int peak;
+            while (depth > (peak = Volatile.Read(ref _peakQueueDepth))
+                   && Interlocked.CompareExchange(ref _peakQueueDepth, depth, peak) != peak)
+            {
+            }
+        }
+
+        private static double ToMs(long ticks) => ticks * 1000.0 / Stopwatch.Frequency;
+
+        public void Dispose()
+        {
+            _queue.Writer.TryComplete();
+            _meter.Dispose();
+        }
+    }
+}
@@ -0,0 +1,54 @@
+using Employee.api.Model;
+using FluentValidation;
+
+namespace Employee.api.Validators
+{
+    public static class BatchLimits
+    {
+        // Keeps each batch transaction, and the per-id report, reasonably small
+        public const int MaxIds = 1000;
+    }
+
+    public class BatchDeleteRequestValidator : AbstractValidator<BatchDeleteRequest>
+    {
+        public BatchDeleteRequestValidator()
+        {
+            RuleFor(r => r.Ids).NotEmpty().Must(ids => ids.Count <= BatchLimits.MaxIds)
+                .WithMessage($"At most {BatchLimits.MaxIds} ids per request.");
+        }
+    }
+
+    public class EmployeeBatchUpdateRequestValidator : AbstractValidator<BatchUpdateRequest<EmployeePatch>>
+    {
+        public EmployeeBatchUpdateRequestValidator()
+        {
+            RuleFor(r => r.Ids).NotEmpty().Must(ids => ids.Count <= BatchLimits.MaxIds)
+                .WithMessage($"At most {BatchLimits.MaxIds} ids per request.");
+            RuleFor(r => r.Patch).Must(p => p.DesignationId != null || p.City != null || p.State != null)
+                .WithMessage("Patch must set at least one field.");
+            RuleFor(r => r.Patch.DesignationId).GreaterThan(0).When(r => r.Patch.DesignationId != null);
+            RuleFor(r => r.Patch.City).NotEmpty().MaximumLength(50).When(r => r.Patch.City != null);
+            RuleFor(r => r.Patch.State).NotEmpty().MaximumLength(50).When(r => r.Patch.State != null);
+        }
+    }
+
+    public class DepartmentBatchUpdateRequestValidator : AbstractValidator<BatchUpdateRequest<DepartmentPatch>>
+    {
+        public DepartmentBatchUpdateRequestValidator()
+        {
+            RuleFor(r => r.Ids).NotEmpty().Must(ids => ids.Count <= BatchLimits.MaxIds)
+                .WithMessage($"At most {BatchLimits.MaxIds} ids per request.");
+            RuleFor(r => r.Patch.IsActive).NotNull().WithMessage("Patch must set at least one field.");
+        }
+    }
+
+    public class DesignationBatchUpdateRequestValidator : AbstractValidator<BatchUpdateRequest<DesignationPatch>>
+    {
+        public DesignationBatchUpdateRequestValidator()
+        {
+            RuleFor(r => r.Ids).NotEmpty().Must(ids => ids.Count <= BatchLimits.MaxIds)
+                .WithMessage($"At most {BatchLimits.MaxIds} ids per request.");
+            RuleFor(r => r.Patch.DepartmentId).NotNull().GreaterThan(0).WithMessage("Patch must set departmentId.");
+        }
+    }
+}
@@ -0,0 +1,288 @@
+"""
+API load generator for Employee.api.
+
+Replays a weighted mix of realistic calls against the master controllers and
+the Auth controller with a configurable number of concurrent virtual users.
+Every virtual user logs in once, then loops over the mix until the run ends.
+All users share one keep-alive connection pool.
+
+Requires aiohttp (`pip install aiohttp`).
+
+Usage:
+    python api_load.py --users 20 --duration 60
+    python api_load.py --users 50 --duration 120 --mix list=5,login=1 --json results.json
+    python api_load.py --mix page=1,cursor=1     # OFFSET paging vs keyset paging
+    python api_load.py --mix filter=1 --search-mode contains   # vs the default prefix search
+    python api_load.py --base-url https://localhost:44316/api --email admin@gmail.com --password 11111111
+
+Reports throughput and p50/p95/p99 latency per scenario as a console table,
+and optionally as JSON.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import string
+import sys
+import time
+import uuid
+from collections import defaultdict
+
+import aiohttp
+
+DEFAULT_BASE_URL = "https://localhost:44316/api"
+
+SORT_COLUMNS = ["name", "email", "city", "state", "createDate"]
+FILTER_TERMS = ["a", "an", "ng", "Ng", "Tr", "Le", "Ph", "Vu"]
+
+# Relative weight of every scenario in the default mix
+DEFAULT_MIX = {
+    "list": 30,
+    "filter": 15,
+    "sort": 10,
+    "page": 10,
+    "cursor": 5,
+    "get_by_id": 15,
+    "departments": 5,
+    "designations": 5,
+    "create": 4,
+    "update": 3,
+    "login": 3,
+}
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.errors = defaultdict(int)
+
+    def record(self, scenario, status, elapsed_ms):
+        self.latencies[scenario].append(elapsed_ms)
+        self.statuses[scenario][status] += 1
+
+    def record_error(self, scenario, elapsed_ms):
+        self.latencies[scenario].append(elapsed_ms)
+        self.errors[scenario] += 1
+
+    def summary(self, duration_s):
+        rows = {}
+        for scenario, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            failed = self.errors[scenario] + sum(
+                count for status, count in self.statuses[scenario].items() if status >= 400)
+            rows[scenario] = {
+                "requests": len(ordered),
+                "failed": failed,
+                "throughput_rps": round(len(ordered) / duration_s, 2),
+                "p50_ms": round(percentile(ordered, 50), 1),
+                "p95_ms": round(percentile(ordered, 95), 1),
+                "p99_ms": round(percentile(ordered, 99), 1),
+                "max_ms": round(ordered[-1], 1),
+                "statuses": dict(self.statuses[scenario]),
+            }
+        return rows
+
+
+def percentile(ordered, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def parse_mix(text):
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown scenario '{name}'. Choose from: {', '.join(DEFAULT_MIX)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def random_employee(designation_ids):
+    suffix = uuid.uuid4().hex[:8]
+    return {
+        "employeeId": 0,
+        "name": f"Load Test {suffix}",
+        "contactNo": "".join(random.choices(string.digits, k=10)),
+        "email": f"load.{suffix}@example.com",
+        "city": "Ho Chi Minh",
+        "state": "HCM",
+        "pincode": "".join(random.choices(string.digits, k=6)),
+        "altContactNo": "",
+        "address": "1 Load Test Street",
+        "designationId": random.choice(designation_ids),
+        "password": "LoadTest123",
+    }
+
+
+class VirtualUser:
+    def __init__(self, session, args, stats, shared):
+        self.session = session
+        self.args = args
+        self.stats = stats
+        self.shared = shared
+        self.headers = {}
+        self.created = []
+
+    async def call(self, scenario, method, path, **kwargs):
+        started = time.perf_counter()
+        try:
+            async with self.session.request(method, f"{self.args.base_url}{path}",
+                                            headers=self.headers, **kwargs) as response:
+                body = await response.read()
+                self.stats.record(scenario, response.status, (time.perf_counter() - started) * 1000)
+                if response.status < 400 and body:
+                    return json.loads(body)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.stats.record_error(scenario, (time.perf_counter() - started) * 1000)
+        return None
+
+    async def login(self, scenario="login"):
+        body = await self.call(scenario, "POST", "/Auth/login",
+                               json={"email": self.args.email, "password": self.args.password})
+        if body and body.get("data"):
+            self.headers = {"Authorization": f"Bearer {body['data']['token']}"}
+
+    def remember_ids(self, body):
+        if body and body.get("data"):
+            self.shared["employee_ids"].update(row["employeeId"] for row in body["data"]["items"])
+
+    async def run_scenario(self, scenario):
+        if scenario == "list":
+            self.remember_ids(await self.call(scenario, "GET", "/EmployeeMaster",
+                                              params={"pageNumber": 1, "pageSize": 10}))
+        elif scenario == "filter":
+            params = {"filter": random.choice(FILTER_TERMS), "pageNumber": 1, "pageSize": 10}
+            if self.args.search_mode:
+                params["searchMode"] = self.args.search_mode
+            await self.call(scenario, "GET", "/EmployeeMaster", params=params)
+        elif scenario == "sort":
+            await self.call(scenario, "GET", "/EmployeeMaster",
+                            params={"sortBy": random.choice(SORT_COLUMNS),
+                                    "sortOrder": random.choice(["asc", "desc"]),
+                                    "pageNumber": 1, "pageSize": 10})
+        elif scenario == "page":
+            self.remember_ids(await self.call(scenario, "GET", "/EmployeeMaster",
+                                              params={"pageNumber": random.randint(1, 5), "pageSize": 10}))
+        elif scenario == "cursor":
+            # Walks a few keyset pages; each call should cost the same as the first
+            params = {"keyset": "true", "sortBy": random.choice(SORT_COLUMNS), "pageSize": 10}
+            for _ in range(random.randint(1, 5)):
+                body = await self.call(scenario, "GET", "/EmployeeMaster", params=params)
+                if not body or not body.get("data") or not body["data"].get("nextCursor"):
+                    break
+                self.remember_ids(body)
+                params = dict(params, cursor=body["data"]["nextCursor"])
+        elif scenario == "get_by_id":
+            ids = self.shared["employee_ids"]
+            if ids:
+                await self.call(scenario, "GET", f"/EmployeeMaster/{random.choice(tuple(ids))}")
+        elif scenario == "departments":
+            await self.call(scenario, "GET", "/DepartmentMaster")
+        elif scenario == "designations":
+            await self.call(scenario, "GET", "/DesignationMaster")
+        elif scenario == "create":
+            if self.shared["designation_ids"]:
+                body = await self.call(scenario, "POST", "/EmployeeMaster",
+                                       json=random_employee(self.shared["designation_ids"]))
+                if body and body.get("data"):
+                    self.created.append(body["data"])
+        elif scenario == "update":
+            if self.created:
+                employee = dict(random.choice(self.created), password="")
+                employee["city"] = random.choice(["Ha Noi", "Da Nang", "Can Tho"])
+                await self.call(scenario, "PUT", f"/EmployeeMaster/{employee['employeeId']}", json=employee)
+        elif scenario == "login":
+            await self.login()
+
+    async def run(self, deadline, mix):
+        names, weights = list(mix), list(mix.values())
+        await self.login("login")
+        while time.perf_counter() < deadline:
+            await self.run_scenario(random.choices(names, weights)[0])
+            if self.args.think_time:
+                await asyncio.sleep(random.uniform(0, self.args.think_time))
+
+
+async def load_designation_ids(session, args):
+    user = VirtualUser(session, args, Stats(), {})
+    await user.login("setup")
+    body = await user.call("setup", "GET", "/DesignationMaster", params={"pageSize": 50})
+    if not body or not body.get("data"):
+        return []
+    return [row["designationId"] for row in body["data"]["items"]]
+
+
+def print_table(rows, duration_s, users):
+    header = f"{'scenario':<14}{'requests':>10}{'failed':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for scenario, row in rows.items():
+        print(f"{scenario:<14}{row['requests']:>10}{row['failed']:>8}{row['throughput_rps']:>9}"
+              f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}{row['max_ms']:>9}")
+    total = sum(row["requests"] for row in rows.values())
+    print("-" * len(header))
+    print(f"{users} users, {duration_s:.1f}s, {total} requests, {total / duration_s:.1f} req/s overall")
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent load generator for Employee.api")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--email", default="admin@gmail.com")
+    parser.add_argument("--password", default="11111111")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Run time in seconds")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Seconds over which users are started")
+    parser.add_argument("--think-time", type=float, default=0, help="Max random pause between calls (s)")
+    parser.add_argument("--mix", type=parse_mix, default=None, help="e.g. list=5,filter=2,login=1")
+    parser.add_argument("--search-mode", choices=["prefix", "fulltext", "contains"],
+                        help="searchMode for the filter scenario (default: the server's Search:Mode)")
+    parser.add_argument("--json", dest="json_path", help="Write the report to this file")
+    parser.add_argument("--verify-tls", action="store_true", help="Verify the API certificate (off for the dev cert)")
+    args = parser.parse_args(argv)
+    mix = args.mix or dict(DEFAULT_MIX)
+
+    connector = aiohttp.TCPConnector(limit=args.users, ssl=None if args.verify_tls else False)
+    timeout = aiohttp.ClientTimeout(total=30)
+    stats = Stats()
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        shared = {"employee_ids": set(), "designation_ids": await load_designation_ids(session, args)}
+
+        async def start_user(index, deadline):
+            if args.ramp_up:
+                await asyncio.sleep(args.ramp_up * index / args.users)
+            await VirtualUser(session, args, stats, shared).run(deadline, mix)
+
+        started = time.perf_counter()
+        deadline = started + args.ramp_up + args.duration
+        await asyncio.gather(*[start_user(i, deadline) for i in range(args.users)])
+        duration_s = time.perf_counter() - started
+
+    rows = stats.summary(duration_s)
+    print_table(rows, duration_s, args.users)
+
+    if args.json_path:
+        report = {
+            "base_url": args.base_url,
+            "users": args.users,
+            "duration_s": round(duration_s, 2),
+            "mix": mix,
+            "search_mode": args.search_mode,
+            "scenarios": rows,
+        }
+        with open(args.json_path, "w") as handle:
+            json.dump(report, handle, indent=2)
+
+    return 1 if any(row["failed"] for row in rows.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,127 @@
+"""
+Bulk import vs single-row create for Employee.api.
+
+Creates the same number of employees twice: once through
+`POST /api/EmployeeMaster` (one request per row, `--concurrency` in flight)
+and once through a single `POST /api/EmployeeMaster/import` call whose body
+is generated and uploaded chunk by chunk. Prints rows/s for both paths.
+
+Requires aiohttp (`pip install aiohttp`). Rows are real inserts; run it
+against a scratch database.
+
+Usage:
+    python import_benchmark.py --rows 2000
+    python import_benchmark.py --rows 20000 --format csv --skip-single
+    python import_benchmark.py --rows 500 --concurrency 20 --json import.json
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import sys
+import time
+
+import aiohttp
+
+from api_load import DEFAULT_BASE_URL, Stats, VirtualUser, load_designation_ids, random_employee
+
+CSV_COLUMNS = ["name", "contactNo", "email", "city", "state", "pincode",
+               "altContactNo", "address", "designationId", "password"]
+
+
+async def run_single(user, rows, concurrency, designation_ids):
+    """One POST per row; returns (seconds, failed)."""
+    slots = asyncio.Semaphore(concurrency)
+
+    async def create():
+        async with slots:
+            return await user.call("single", "POST", "/EmployeeMaster", json=random_employee(designation_ids))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[create() for _ in range(rows)])
+    return time.perf_counter() - started, sum(1 for body in results if not body)
+
+
+async def import_body(rows, fmt, designation_ids, chunk_rows=500):
+    """Yields the upload in chunks so the client never holds the whole file either."""
+    if fmt == "csv":
+        yield (",".join(CSV_COLUMNS) + "\n").encode()
+    for start in range(0, rows, chunk_rows):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, CSV_COLUMNS, extrasaction="ignore", lineterminator="\n") if fmt == "csv" else None
+        for _ in range(min(chunk_rows, rows - start)):
+            employee = random_employee(designation_ids)
+            if writer:
+                writer.writerow(employee)
+            else:
+                buffer.write(json.dumps(employee) + "\n")
+        yield buffer.getvalue().encode()
+
+
+async def run_import(user, rows, fmt, designation_ids):
+    """One streamed import call; returns (seconds, report)."""
+    content_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    started = time.perf_counter()
+    async with user.session.post(f"{user.args.base_url}/EmployeeMaster/import",
+                                 data=import_body(rows, fmt, designation_ids),
+                                 headers=dict(user.headers, **{"Content-Type": content_type})) as response:
+        body = await response.json() if response.status < 400 else {}
+    return time.perf_counter() - started, body.get("data")
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare bulk import with single-row creates")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--email", default="admin@gmail.com")
+    parser.add_argument("--password", default="11111111")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10, help="Single-row requests in flight")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--skip-single", action="store_true", help="Only time the import call")
+    parser.add_argument("--json", dest="json_path", help="Write the report to this file")
+    parser.add_argument("--verify-tls", action="store_true", help="Verify the API certificate (off for the dev cert)")
+    args = parser.parse_args(argv)
+
+    connector = aiohttp.TCPConnector(limit=args.concurrency, ssl=None if args.verify_tls else False)
+    timeout = aiohttp.ClientTimeout(total=None)
+    results = {"rows": args.rows, "format": args.format}
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        designation_ids = await load_designation_ids(session, args)
+        if not designation_ids:
+            print("No designations found (or login failed); create one first.")
+            return 1
+
+        user = VirtualUser(session, args, Stats(), {})
+        await user.login("setup")
+
+        if not args.skip_single:
+            seconds, failed = await run_single(user, args.rows, args.concurrency, designation_ids)
+            results["single"] = {"seconds": round(seconds, 2), "failed": failed,
+                                 "rows_per_s": round(args.rows / seconds, 1)}
+
+        seconds, report = await run_import(user, args.rows, args.format, designation_ids)
+        if report is None:
+            print("Import call failed.")
+            return 1
+        results["import"] = {"seconds": round(seconds, 2), "failed": report["failed"],
+                             "rows_per_s": round(args.rows / seconds, 1), "server_ms": report["elapsedMs"]}
+
+    print(f"{'path':<8}{'rows':>8}{'failed':>8}{'seconds':>10}{'rows/s':>10}")
+    for path in ("single", "import"):
+        if path in results:
+            row = results[path]
+            print(f"{path:<8}{args.rows:>8}{row['failed']:>8}{row['seconds']:>10}{row['rows_per_s']:>10}")
+    if "single" in results:
+        print(f"import is {results['import']['rows_per_s'] / results['single']['rows_per_s']:.1f}x the single-row path")
+
+    if args.json_path:
+        with open(args.json_path, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    return 1 if results["import"]["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,95 @@
+"""
+Response size on the wire for the Employee.api list endpoints.
+
+Requests each list endpoint with `Accept-Encoding: identity`, `gzip` and `br`
+and reports the body size as sent (nothing is decompressed) and the median
+latency over `--repeat` calls. Run it against a build with compression off
+and one with it on to get before/after numbers; serialisation CPU is covered
+by `SerializationBenchmarks` in Employee.api.Benchmarks.
+
+Requires aiohttp (`pip install aiohttp`).
+
+Usage:
+    python payload_size.py
+    python payload_size.py --page-size 50 --repeat 20 --json payload.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+import aiohttp
+
+from api_load import DEFAULT_BASE_URL, Stats, VirtualUser
+
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+def endpoints(page_size):
+    return {
+        "employees": ("/EmployeeMaster", {"pageNumber": 1, "pageSize": page_size}),
+        "employees_sorted": ("/EmployeeMaster", {"sortBy": "departmentName,name", "pageNumber": 1, "pageSize": page_size}),
+        "employees_keyset": ("/EmployeeMaster", {"keyset": "true", "pageSize": page_size}),
+        "departments": ("/DepartmentMaster", {"pageNumber": 1, "pageSize": page_size}),
+        "designations": ("/DesignationMaster", {"pageNumber": 1, "pageSize": page_size}),
+    }
+
+
+async def measure(user, path, params, encoding, repeat):
+    """Returns (bytes on the wire, content-encoding the server chose, median ms)."""
+    headers = dict(user.headers, **{"Accept-Encoding": encoding})
+    size, applied, timings = 0, "", []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        async with user.session.get(f"{user.args.base_url}{path}", params=params, headers=headers) as response:
+            body = await response.read()
+            timings.append((time.perf_counter() - started) * 1000)
+            size, applied = len(body), response.headers.get("Content-Encoding", "")
+    return size, applied, statistics.median(timings)
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure list response sizes per content encoding")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--email", default="admin@gmail.com")
+    parser.add_argument("--password", default="11111111")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=10, help="Calls per endpoint and encoding")
+    parser.add_argument("--json", dest="json_path", help="Write the results to this file")
+    parser.add_argument("--verify-tls", action="store_true", help="Verify the API certificate (off for the dev cert)")
+    args = parser.parse_args(argv)
+
+    connector = aiohttp.TCPConnector(ssl=None if args.verify_tls else False)
+    results = {}
+    # auto_decompress off so len(body) is what actually crossed the network
+    async with aiohttp.ClientSession(connector=connector, auto_decompress=False) as session:
+        user = VirtualUser(session, args, Stats(), {})
+        await user.login("setup")
+        if not user.headers:
+            print("Login failed.")
+            return 1
+
+        for name, (path, params) in endpoints(args.page_size).items():
+            results[name] = {}
+            for encoding in ENCODINGS:
+                size, applied, median_ms = await measure(user, path, params, encoding, args.repeat)
+                results[name][encoding] = {"bytes": size, "content_encoding": applied or "identity",
+                                           "median_ms": round(median_ms, 1)}
+
+    print(f"{'endpoint':<18}{'encoding':>10}{'sent as':>10}{'bytes':>9}{'saved':>8}{'p50 ms':>9}")
+    for name, rows in results.items():
+        plain = rows["identity"]["bytes"] or 1
+        for encoding, row in rows.items():
+            saved = 100 * (1 - row["bytes"] / plain)
+            print(f"{name:<18}{encoding:>10}{row['content_encoding']:>10}{row['bytes']:>9}{saved:>7.0f}%{row['median_ms']:>9}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as handle:
+            json.dump(results, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
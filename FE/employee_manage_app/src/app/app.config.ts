@@ -2,6 +2,8 @@ import { ApplicationConfig, provideBrowserGlobalErrorListeners } from '@angular/
 import { provideRouter } from '@angular/router';
 import { provideHttpClient, withInterceptors } from '@angular/common/http';
 import { apiInterceptor } from './core/interceptors/api.interceptor';
+import { etagInterceptor } from './core/interceptors/etag.interceptor';
+import { dedupeInterceptor } from './core/interceptors/dedupe.interceptor';
 import { provideToastr } from 'ngx-toastr';
 import { provideAnimations } from '@angular/platform-browser/animations';
 import { provideNzIcons } from 'ng-zorro-antd/icon';
@@ -25,7 +27,11 @@ import {
   ApartmentOutline,
   UserAddOutline,
   CloseOutline,
-  IdcardOutline
+  IdcardOutline,
+  DownloadOutline,
+  SearchOutline,
+  TableOutline,
+  BarsOutline
 } from '@ant-design/icons-angular/icons';
 
 import { routes } from './app.routes';
@@ -50,14 +56,18 @@ const icons = [
   ApartmentOutline,
   UserAddOutline,
   CloseOutline,
-  IdcardOutline
+  IdcardOutline,
+  DownloadOutline,
+  SearchOutline,
+  TableOutline,
+  BarsOutline
 ];
 
 export const appConfig: ApplicationConfig = {
   providers: [
     provideBrowserGlobalErrorListeners(),
     provideRouter(routes),
-    provideHttpClient(withInterceptors([apiInterceptor])),
+    provideHttpClient(withInterceptors([dedupeInterceptor, apiInterceptor, etagInterceptor])),
     provideAnimations(),
     provideNzIcons(icons),
     provideToastr({
@@ -1,10 +1,12 @@
-import { Injectable, signal, WritableSignal } from '@angular/core';
+import { Injectable, inject, signal, WritableSignal } from '@angular/core';
 import { HttpClient } from '@angular/common/http';
 import { Observable } from 'rxjs';
 import { tap } from 'rxjs/operators';
 import { jwtDecode } from 'jwt-decode';
 import { environment } from '../../../../environments/environment';
 import { ApiResponse } from '@core/models/api-response.model';
+import { EtagCache } from '@core/interceptors/etag.interceptor';
+import { QueryCache } from '@core/cache/query-cache';
 
 /**
  * User Role Enum
@@ -45,6 +47,8 @@ export class AuthService {
   private currentUserSignal: WritableSignal<User | null> = signal(null);
   readonly currentUser = this.currentUserSignal.asReadonly();
   private readonly tokenKey = 'authToken';
+  private readonly etagCache = inject(EtagCache);
+  private readonly queryCache = inject(QueryCache);
 
   constructor(private http: HttpClient) {
     this.initializeUser();
@@ -75,6 +79,9 @@ export class AuthService {
   logout(): void {
     localStorage.removeItem(this.tokenKey);
     this.currentUserSignal.set(null);
+    // Không giữ dữ liệu API của phiên trước
+    this.etagCache.clear();
+    this.queryCache.clear();
   }
 
   private setUserFromToken(token: string): void {
@@ -0,0 +1,176 @@
+import { Injectable, computed, signal } from '@angular/core';
+import { Observable, concat, defer, map, of, tap } from 'rxjs';
+
+/**
+ * Kết quả của QueryCache.query
+ * - fromCache: data lấy từ cache (render ngay, không spinner)
+ * - stale: data đã cũ, một request revalidate đang chạy và sẽ emit tiếp data mới
+ */
+export interface QueryResult<T> {
+    data: T;
+    fromCache: boolean;
+    stale: boolean;
+}
+
+export interface QueryOptions {
+    /** Trong khoảng này (ms) data được coi là mới: trả từ cache, không gọi API */
+    staleTimeMs?: number;
+}
+
+/** Số liệu hit/miss (hiện ở footer khi chạy dev mode) */
+export interface QueryCacheStats {
+    hits: number;
+    staleHits: number;
+    misses: number;
+    entries: number;
+    /** (hits + staleHits) / tổng số lần query, 0..1 */
+    hitRate: number;
+}
+
+interface QueryEntry {
+    data: unknown;
+    updatedAt: number;
+}
+
+/**
+ * QueryCache
+ * Cache dùng chung cho các store, key = endpoint + params (xem QueryCache.key)
+ *
+ * Stale-while-revalidate:
+ * - Chưa có entry           -> gọi API (miss)
+ * - Entry còn mới           -> trả data từ cache, không gọi API (hit)
+ * - Entry đã cũ (< ttl)     -> trả data cũ ngay rồi gọi API, emit thêm data mới (stale hit)
+ * - Entry quá ttl           -> bỏ, coi như miss
+ *
+ * Giới hạn số entry theo LRU (Map giữ thứ tự chèn, entry vừa đọc được đưa xuống cuối).
+ * Store gọi invalidate(scope) sau mỗi create/update/delete để lần load sau lấy data mới.
+ */
+@Injectable({
+    providedIn: 'root'
+})
+export class QueryCache {
+    private readonly maxEntries = 100;
+    private readonly ttlMs = 5 * 60_000;
+    private readonly defaultStaleTimeMs = 15_000;
+    private readonly entries = new Map<string, QueryEntry>();
+
+    // Tăng mỗi lần invalidate/clear: response của request bắt đầu trước đó không được ghi lại vào cache
+    private generation = 0;
+
+    private readonly hitsSignal = signal(0);
+    private readonly staleHitsSignal = signal(0);
+    private readonly missesSignal = signal(0);
+    private readonly entryCountSignal = signal(0);
+
+    readonly stats = computed<QueryCacheStats>(() => {
+        const hits = this.hitsSignal();
+        const staleHits = this.staleHitsSignal();
+        const misses = this.missesSignal();
+        const total = hits + staleHits + misses;
+        return {
+            hits,
+            staleHits,
+            misses,
+            entries: this.entryCountSignal(),
+            hitRate: total === 0 ? 0 : (hits + staleHits) / total
+        };
+    });
+
+    /**
+     * Tạo key từ scope (tên endpoint, vd 'EmployeeMaster') và params
+     * Params được sort theo tên, bỏ giá trị rỗng -> cùng query luôn ra cùng key
+     */
+    static key(scope: string, params?: Record<string, string | number | boolean | null | undefined>): string {
+        const query = Object.entries(params ?? {})
+            .filter(([, value]) => value !== undefined && value !== null && value !== '')
+            .sort(([a], [b]) => a.localeCompare(b))
+            .map(([name, value]) => `${name}=${encodeURIComponent(String(value))}`)
+            .join('&');
+        return query ? `${scope}?${query}` : scope;
+    }
+
+    /**
+     * Chạy fetch qua cache. Emit 1 lần (hit/miss) hoặc 2 lần (stale hit: data cũ rồi data mới)
+     * Lỗi của fetch được trả nguyên cho subscriber; entry cũ vẫn giữ trong cache.
+     */
+    query<T>(key: string, fetch: () => Observable<T>, options?: QueryOptions): Observable<QueryResult<T>> {
+        return defer(() => {
+            const staleTimeMs = options?.staleTimeMs ?? this.defaultStaleTimeMs;
+            const entry = this.read(key);
+
+            if (!entry) {
+                this.missesSignal.update(n => n + 1);
+                return this.fetchAndStore(key, fetch);
+            }
+
+            const cached = entry.data as T;
+            if (Date.now() - entry.updatedAt < staleTimeMs) {
+                this.hitsSignal.update(n => n + 1);
+                return of({ data: cached, fromCache: true, stale: false });
+            }
+
+            this.staleHitsSignal.update(n => n + 1);
+            return concat(
+                of({ data: cached, fromCache: true, stale: true }),
+                this.fetchAndStore(key, fetch)
+            );
+        });
+    }
+
+    /**
+     * Xóa mọi entry thuộc các scope (vd 'EmployeeMaster' xóa mọi trang/filter của list nhân viên)
+     */
+    invalidate(...scopes: string[]): void {
+        this.generation++;
+        for (const key of [...this.entries.keys()]) {
+            if (scopes.some(scope => key === scope || key.startsWith(`${scope}?`))) {
+                this.entries.delete(key);
+            }
+        }
+        this.entryCountSignal.set(this.entries.size);
+    }
+
+    clear(): void {
+        this.generation++;
+        this.entries.clear();
+        this.entryCountSignal.set(0);
+    }
+
+    private fetchAndStore<T>(key: string, fetch: () => Observable<T>): Observable<QueryResult<T>> {
+        const generation = this.generation;
+        return fetch().pipe(
+            tap(data => {
+                if (generation === this.generation) {
+                    this.write(key, data);
+                }
+            }),
+            map(data => ({ data, fromCache: false, stale: false }))
+        );
+    }
+
+    private read(key: string): QueryEntry | undefined {
+        const entry = this.entries.get(key);
+        if (!entry) {
+            return undefined;
+        }
+
+        this.entries.delete(key);
+        if (Date.now() - entry.updatedAt >= this.ttlMs) {
+            this.entryCountSignal.set(this.entries.size);
+            return undefined;
+        }
+
+        // Đưa xuống cuối: entry dùng gần nhất bị evict sau cùng
+        this.entries.set(key, entry);
+        return entry;
+    }
+
+    private write(key: string, data: unknown): void {
+        this.entries.delete(key);
+        this.entries.set(key, { data, updatedAt: Date.now() });
+        if (this.entries.size > this.maxEntries) {
+            this.entries.delete(this.entries.keys().next().value!);
+        }
+        this.entryCountSignal.set(this.entries.size);
+    }
+}
@@ -59,7 +59,11 @@ export const apiInterceptor: HttpInterceptorFn = (req, next) => {
                     case 404:
                         // Optional: Don't always toast 404, specific services might handle it.
                         // But for now, let's leave it to the caller or toast if needed.
-                        // toastr.error('Resource not found.', 'Not Found'); 
+                        // toastr.error('Resource not found.', 'Not Found');
+                        break;
+                    case 409:
+                        // e.g. duplicate employee email (unique index on employeeTbl.email)
+                        toastr.error(error.error?.message ?? 'The data conflicts with an existing record.', 'Conflict');
                         break;
                     case 500:
                         toastr.error('Internal Server Error. Please try again later.', 'Server Error');
@@ -0,0 +1,73 @@
+import { HttpContextToken, HttpEvent, HttpInterceptorFn } from '@angular/common/http';
+import { Injectable, inject, signal } from '@angular/core';
+import { Observable, finalize, share } from 'rxjs';
+
+/**
+ * Tắt gộp request cho một lần gọi:
+ * this.http.get(url, { context: new HttpContext().set(SKIP_DEDUPE, true) })
+ */
+export const SKIP_DEDUPE = new HttpContextToken<boolean>(() => false);
+
+/**
+ * InFlightRequests
+ * Các GET đang chờ response (key = responseType + URL đầy đủ kèm query)
+ * và số request đã tiết kiệm nhờ gộp
+ */
+@Injectable({
+    providedIn: 'root'
+})
+export class InFlightRequests {
+    private readonly requests = new Map<string, Observable<HttpEvent<unknown>>>();
+    private readonly savedSignal = signal(0);
+
+    /** Số GET không phải gửi đi vì đã có request giống hệt đang chạy */
+    readonly saved = this.savedSignal.asReadonly();
+
+    get(key: string): Observable<HttpEvent<unknown>> | undefined {
+        const request = this.requests.get(key);
+        if (request) {
+            this.savedSignal.update(n => n + 1);
+        }
+        return request;
+    }
+
+    set(key: string, request: Observable<HttpEvent<unknown>>): void {
+        this.requests.set(key, request);
+    }
+
+    delete(key: string, request: Observable<HttpEvent<unknown>>): void {
+        // Chỉ xóa nếu key vẫn trỏ tới đúng request này
+        if (this.requests.get(key) === request) {
+            this.requests.delete(key);
+        }
+    }
+}
+
+/**
+ * Dedupe Interceptor (in-flight coalescing)
+ * GET giống hệt nhau gửi cùng lúc (vd list + edit cùng load master data) dùng chung
+ * một request mạng và cùng nhận một response. Request chỉ bị hủy khi mọi bên đều unsubscribe.
+ * Request đã xong thì bị bỏ khỏi danh sách: đây không phải cache (xem QueryCache / EtagCache).
+ *
+ * Phải đứng ĐẦU withInterceptors([...]) để phần còn lại của chuỗi (token, toast lỗi, ETag)
+ * chạy một lần cho cả nhóm.
+ */
+export const dedupeInterceptor: HttpInterceptorFn = (req, next) => {
+    if (req.method !== 'GET' || req.reportProgress || req.context.get(SKIP_DEDUPE)) {
+        return next(req);
+    }
+
+    const inFlight = inject(InFlightRequests);
+    const key = `${req.responseType} ${req.urlWithParams}`;
+    const pending = inFlight.get(key);
+    if (pending) {
+        return pending;
+    }
+
+    const request: Observable<HttpEvent<unknown>> = next(req).pipe(
+        finalize(() => inFlight.delete(key, request)),
+        share()
+    );
+    inFlight.set(key, request);
+    return request;
+};
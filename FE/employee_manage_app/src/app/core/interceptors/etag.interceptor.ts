@@ -0,0 +1,84 @@
+import { HttpErrorResponse, HttpInterceptorFn, HttpResponse } from '@angular/common/http';
+import { Injectable, inject } from '@angular/core';
+import { catchError, of, tap, throwError } from 'rxjs';
+import { environment } from 'src/environments/environment';
+
+interface EtagEntry {
+    etag: string;
+    body: unknown;
+}
+
+/**
+ * EtagCache
+ * Lưu ETag + body của các GET API gần nhất (key = URL đầy đủ kèm query)
+ * Giới hạn số entry để không giữ mãi các trang list cũ
+ */
+@Injectable({
+    providedIn: 'root'
+})
+export class EtagCache {
+    private readonly maxEntries = 200;
+    private readonly entries = new Map<string, EtagEntry>();
+
+    get(key: string): EtagEntry | undefined {
+        return this.entries.get(key);
+    }
+
+    set(key: string, entry: EtagEntry): void {
+        // Map giữ thứ tự chèn: xóa rồi chèn lại để entry mới nhất nằm cuối
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+        if (this.entries.size > this.maxEntries) {
+            this.entries.delete(this.entries.keys().next().value!);
+        }
+    }
+
+    clear(): void {
+        this.entries.clear();
+    }
+}
+
+/**
+ * ETag Interceptor (conditional GET)
+ * - Gửi If-None-Match với ETag đã nhận trước đó
+ * - Server trả 304 (không body) -> trả lại body đã cache như một response 200
+ * Các service/store không cần biết gì về ETag.
+ *
+ * Phải đứng SAU apiInterceptor trong withInterceptors([...]) để 304 được xử lý
+ * trước khi apiInterceptor coi nó là lỗi và hiện toast.
+ */
+export const etagInterceptor: HttpInterceptorFn = (req, next) => {
+    if (req.method !== 'GET' || !req.url.startsWith(environment.apiUrl)) {
+        return next(req);
+    }
+
+    const cache = inject(EtagCache);
+    const key = req.urlWithParams;
+    const cached = cache.get(key);
+    const conditionalReq = cached
+        ? req.clone({ setHeaders: { 'If-None-Match': cached.etag } })
+        : req;
+
+    return next(conditionalReq).pipe(
+        tap(event => {
+            if (event instanceof HttpResponse) {
+                const etag = event.headers.get('ETag');
+                if (etag) {
+                    cache.set(key, { etag, body: event.body });
+                }
+            }
+        }),
+        catchError((error: HttpErrorResponse) => {
+            if (error.status === 304 && cached) {
+                return of(new HttpResponse({
+                    body: cached.body,
+                    headers: error.headers,
+                    status: 200,
+                    statusText: 'OK',
+                    url: error.url ?? req.urlWithParams
+                }));
+            }
+            return throwError(() => error);
+        })
+    );
+};
@@ -1,5 +1,7 @@
-import { Component } from '@angular/core';
+import { Component, inject, isDevMode } from '@angular/core';
 import { CommonModule } from '@angular/common';
+import { QueryCache } from '@core/cache/query-cache';
+import { InFlightRequests } from '@core/interceptors/dedupe.interceptor';
 
 @Component({
     selector: 'app-footer',
@@ -9,6 +11,13 @@ import { CommonModule } from '@angular/common';
     <footer class="footer mt-auto py-3 bg-white border-top text-center text-muted">
       <div class="container">
         <span class="small">&copy; {{ year }} Employee Management System. All rights reserved.</span>
+        @if (devMode) {
+        <div class="small font-monospace mt-1">
+          query cache: {{ cacheStats().hits }} hit / {{ cacheStats().staleHits }} stale / {{ cacheStats().misses }} miss
+          ({{ cacheStats().hitRate | percent }}), {{ cacheStats().entries }} entries
+          &middot; coalesced GETs: {{ savedRequests() }}
+        </div>
+        }
       </div>
     </footer>
   `,
@@ -20,4 +29,9 @@ import { CommonModule } from '@angular/common';
 })
 export class FooterComponent {
     year = new Date().getFullYear();
+
+    // Hit rate của QueryCache và số GET được gộp, chỉ hiện khi chạy dev (ng serve)
+    readonly devMode = isDevMode();
+    readonly cacheStats = inject(QueryCache).stats;
+    readonly savedRequests = inject(InFlightRequests).saved;
 }
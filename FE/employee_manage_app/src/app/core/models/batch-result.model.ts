@@ -0,0 +1,26 @@
+/**
+ * Batch mutation (POST .../delete-many, PATCH .../update-many)
+ * Khớp với BatchMutation.cs của backend .NET
+ */
+export interface BatchUpdateRequest<TPatch> {
+  ids: number[];
+  patch: TPatch;
+}
+
+export type BatchItemStatus = 'deleted' | 'updated' | 'notFound' | 'inUse';
+
+export interface BatchItemResult {
+  id: number;
+  status: BatchItemStatus;
+  message?: string;
+}
+
+/**
+ * Kết quả theo từng id, theo thứ tự gửi lên (id trùng chỉ tính một lần)
+ */
+export interface BatchResult {
+  requested: number;
+  succeeded: number;
+  failed: number;
+  results: BatchItemResult[];
+}
@@ -1,2 +1,4 @@
 export * from './api-response.model';
 export * from './app-error.model';
+export * from './paged-result.model';
+export * from './batch-result.model';
@@ -0,0 +1,11 @@
+/**
+ * Paging envelope trả về từ các endpoint GetAll
+ * Khớp với PagedResult<T> của backend .NET
+ */
+export interface PagedResult<T> {
+  items: T[];
+  totalCount: number;
+  pageNumber: number;
+  pageSize: number;
+  totalPages: number;
+}
@@ -0,0 +1,18 @@
+import { BatchResult } from '@core/models/batch-result.model';
+
+/**
+ * Các id được xử lý thành công trong một BatchResult
+ */
+export function succeededIds(result: BatchResult): Set<number> {
+    return new Set(result.results.filter(r => r.status === 'deleted' || r.status === 'updated').map(r => r.id));
+}
+
+/**
+ * Mô tả ngắn các id lỗi để hiện trong toast (tối đa `limit` id)
+ */
+export function describeBatchFailures(result: BatchResult, limit: number = 5): string {
+    const failed = result.results.filter(r => r.status !== 'deleted' && r.status !== 'updated');
+    const shown = failed.slice(0, limit).map(r => `#${r.id}: ${r.message ?? r.status}`);
+    const more = failed.length > limit ? ` (+${failed.length - limit})` : '';
+    return `${result.failed}/${result.requested} không xử lý được. ${shown.join('; ')}${more}`;
+}
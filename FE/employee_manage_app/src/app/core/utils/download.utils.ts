@@ -0,0 +1,16 @@
+/**
+ * Lưu Blob thành file qua thẻ <a download> tạm thời
+ * @param blob Nội dung file (vd: response với responseType 'blob')
+ * @param fileName Tên file gợi ý cho trình duyệt
+ */
+export function saveBlob(blob: Blob, fileName: string): void {
+    const url = URL.createObjectURL(blob);
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = fileName;
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    // Trả lại bộ nhớ sau khi trình duyệt đã bắt đầu tải
+    setTimeout(() => URL.revokeObjectURL(url));
+}
@@ -1,6 +1,6 @@
-import { Injectable, inject, computed } from '@angular/core';
+import { Injectable, inject, computed, signal } from '@angular/core';
 import { DepartmentStore } from '../store/department/department.store';
-import { CreateDepartmentRequest, Department } from '../models';
+import { CreateDepartmentRequest, Department, DepartmentPatch } from '../models';
 
 @Injectable({
     providedIn: 'root'
@@ -8,9 +8,16 @@ import { CreateDepartmentRequest, Department } from '../models';
 export class DepartmentFacade {
     private readonly store = inject(DepartmentStore);
 
+    // Pagination State
+    private readonly _pageIndex = signal(1);
+    private readonly _pageSize = signal(10);
+
     // ViewModel for List/Form
     readonly viewModel = computed(() => ({
         departments: this.store.departments(),
+        totalCount: this.store.totalCount(),
+        pageIndex: this._pageIndex(),
+        pageSize: this._pageSize(),
         selectedDepartment: this.store.selectedDepartment(),
         isLoading: this.store.isLoading(),
         error: this.store.error(),
@@ -18,8 +25,10 @@ export class DepartmentFacade {
     }));
 
     // Actions
-    loadDepartments(): void {
-        this.store.loadDepartments();
+    loadDepartments(pageIndex: number = 1, pageSize: number = this._pageSize()): void {
+        this._pageIndex.set(pageIndex);
+        this._pageSize.set(pageSize);
+        this.store.loadDepartments(pageIndex, pageSize);
     }
 
     loadDepartmentById(id: number): void {
@@ -38,6 +47,14 @@ export class DepartmentFacade {
         this.store.deleteDepartment(id);
     }
 
+    deleteDepartments(ids: number[], onDone?: () => void): void {
+        this.store.deleteDepartments(ids, onDone);
+    }
+
+    updateDepartments(ids: number[], patch: DepartmentPatch, onDone?: () => void): void {
+        this.store.updateDepartments(ids, patch, onDone);
+    }
+
     selectDepartment(department: Department | null): void {
         if (department) {
             this.store.selectDepartment(department);
@@ -1,7 +1,7 @@
-import { Injectable, inject, computed } from '@angular/core';
+import { Injectable, inject, computed, signal } from '@angular/core';
 import { DesignationStore } from '../store/designation/designation.store';
 import { DepartmentStore } from '../store/department/department.store';
-import { CreateDesignationRequest, Designation } from '../models';
+import { CreateDesignationRequest, Designation, DesignationPatch } from '../models';
 
 @Injectable({
     providedIn: 'root'
@@ -10,33 +10,42 @@ export class DesignationFacade {
     private readonly store = inject(DesignationStore);
     private readonly deptStore = inject(DepartmentStore);
 
+    // Pagination State
+    private readonly _pageIndex = signal(1);
+    private readonly _pageSize = signal(10);
+
     // ViewModel for Lists/Forms
     readonly viewModel = computed(() => {
         const designations = this.store.designations();
-        const departments = this.deptStore.departments();
+        const departments = this.deptStore.allDepartments();
 
         const mappedDesignations = designations.map(d => ({
             ...d,
-            departmentName: departments.find(dept => dept.departmentId === d.departmentId)?.departmentName || 'N/A'
+            // Name comes joined from the API; the department list (if loaded) covers rows edited since the last load
+            departmentName: departments.find(dept => dept.departmentId === d.departmentId)?.departmentName || d.departmentName || 'N/A'
         }));
 
         return {
             designations: mappedDesignations,
+            totalCount: this.store.totalCount(),
+            pageIndex: this._pageIndex(),
+            pageSize: this._pageSize(),
             isLoading: this.store.isLoading(),
             error: this.store.error(),
             selectedDesignation: this.store.selectedDesignation(),
-            departments: this.deptStore.departments()
+            departments
         };
     });
 
-    loadDesignations(): void {
-        this.store.loadDesignations();
+    loadDesignations(pageIndex: number = 1, pageSize: number = this._pageSize()): void {
+        this._pageIndex.set(pageIndex);
+        this._pageSize.set(pageSize);
+        this.store.loadDesignations(pageIndex, pageSize);
     }
 
+    // Dropdown needs every department, not just the page the department list last showed
     loadMasterData(): void {
-        if (this.deptStore.departments().length === 0) {
-            this.deptStore.loadDepartments();
-        }
+        this.deptStore.loadDepartmentLookup();
     }
 
     loadDesignationById(id: number): void {
@@ -55,6 +64,14 @@ export class DesignationFacade {
         this.store.deleteDesignation(id);
     }
 
+    deleteDesignations(ids: number[], onDone?: () => void): void {
+        this.store.deleteDesignations(ids, onDone);
+    }
+
+    updateDesignations(ids: number[], patch: DesignationPatch, onDone?: () => void): void {
+        this.store.updateDesignations(ids, patch, onDone);
+    }
+
     selectDesignation(designation: Designation | null): void {
         if (designation) {
             this.store.selectDesignation(designation);
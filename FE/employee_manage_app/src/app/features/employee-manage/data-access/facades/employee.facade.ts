@@ -1,14 +1,27 @@
 import { Injectable, inject, computed, signal } from '@angular/core';
+import { takeUntilDestroyed } from '@angular/core/rxjs-interop';
+import { Subject, debounceTime, filter, map } from 'rxjs';
 import { EmployeeStore } from '../store/employee/employee.store';
+import { EmployeeScrollQuery, EmployeeScrollStore, RowRange } from '../store/employee/employee-scroll.store';
 import { DepartmentStore } from '../store/department/department.store';
 import { DesignationStore } from '../store/designation/designation.store';
-import { CreateEmployeeRequest, UpdateEmployeeRequest, Employee } from '../models';
+import { CreateEmployeeRequest, UpdateEmployeeRequest, Employee, EmployeeExportFormat, EmployeePatch } from '../models';
+
+/** 'paged': nz-table pages; 'scroll': one virtual-scroll list loaded in windows as the user scrolls */
+export type EmployeeListViewMode = 'paged' | 'scroll';
+
+/** How long typing must pause (ms) before a search is sent */
+const SEARCH_DEBOUNCE_MS = 300;
+
+/** Shorter terms are ignored; an empty term (clear the filter) always goes through */
+const SEARCH_MIN_LENGTH = 2;
 
 @Injectable({
     providedIn: 'root'
 })
 export class EmployeeFacade {
     private readonly store = inject(EmployeeStore);
+    private readonly scrollStore = inject(EmployeeScrollStore);
     private readonly deptStore = inject(DepartmentStore);
     private readonly desigStore = inject(DesignationStore);
 
@@ -16,49 +29,66 @@ export class EmployeeFacade {
     private readonly _pageIndex = signal(1);
     private readonly _pageSize = signal(10);
     private readonly _searchTerm = signal('');
+    private readonly _viewMode = signal<EmployeeListViewMode>('paged');
+
+    // Raw keystrokes from the search box, see search()
+    private readonly searchInput = new Subject<string>();
+
+    // ViewModel for Lists (designationName/departmentName come joined from the API)
+    readonly listViewModel = computed(() => ({
+        employees: this.store.employees(),
+        totalRequest: this.store.totalCount(),
+        pageIndex: this._pageIndex(),
+        pageSize: this._pageSize(),
+        searchTerm: this._searchTerm(),
+        viewMode: this._viewMode(),
+        isLoading: this.store.isLoading(),
+        error: this._viewMode() === 'scroll' ? this.scrollStore.error() : this.store.error()
+    }));
 
-    // ViewModel for Lists
-    readonly listViewModel = computed(() => {
-        const employees = this.store.employees();
-        const depts = this.deptStore.departments();
-        const desigs = this.desigStore.designations();
-
-        const mappedEmployees = employees.map(emp => ({
-            ...emp,
-            departmentName: depts.find(d => d.departmentId === emp.designationId)?.departmentName || 'N/A', // Logic seems wrong in Pipe too, DesignationId used for Department? 
-            // WAIT, looking at DesignationNamePipe: const designation = designations.find(d => d.designationId === designationId);
-            // Employee has designationId. Designation has departmentId. 
-            // So Employee -> Designation -> Department. 
-            // The table shows "Chức vụ" (Designation). Does it show Department?
-            // Table columns: Name, Email, Phone, Designation, Actions.
-            // EmployeeTableComponent.html uses: {{ data.designationId | designationName: designations }}
-            // So I only need designationName for now.
-
-            designationName: desigs.find(d => d.designationId === emp.designationId)?.designationName || 'N/A'
-        }));
-
-        return {
-            employees: mappedEmployees,
-            totalRequest: this.store.totalCount(),
-            pageIndex: this._pageIndex(),
-            pageSize: this._pageSize(),
-            isLoading: this.store.isLoading(),
-            error: this.store.error()
-        };
-    });
+    // ViewModel for the virtual-scroll list
+    readonly scrollViewModel = computed(() => ({
+        rowAt: this.scrollStore.rowAt(),
+        totalCount: this.scrollStore.totalCount(),
+        query: this.scrollStore.query(),
+        isLoading: this.scrollStore.isLoading()
+    }));
 
     // ViewModel for Forms (Edit/Add)
     readonly formViewModel = computed(() => ({
         selectedEmployee: this.store.selectedEmployee(),
-        departments: this.deptStore.departments(),
-        designations: this.desigStore.designations(),
+        departments: this.deptStore.allDepartments(),
+        designations: this.desigStore.allDesignations(),
         isLoading: this.store.isLoading(),
         error: this.store.error()
     }));
 
     // Exposed Signals for List Helpers
-    readonly departments = this.deptStore.departments;
-    readonly designations = this.desigStore.designations;
+    readonly departments = this.deptStore.allDepartments;
+    readonly designations = this.desigStore.allDesignations;
+    readonly isExporting = this.store.isExporting;
+
+    constructor() {
+        // Search pipeline: trim -> debounce -> min length -> distinct -> load page 1.
+        // The store cancels the previous in-flight list request and serves recent pages from its cache,
+        // so only the last term typed ever reaches the table.
+        this.searchInput.pipe(
+            map(term => term.trim()),
+            debounceTime(SEARCH_DEBOUNCE_MS),
+            filter(term => term.length === 0 || term.length >= SEARCH_MIN_LENGTH),
+            // distinct against the applied term, so "ab" -> "abc" -> "ab" inside one pause is a no-op
+            filter(term => term !== this._searchTerm()),
+            takeUntilDestroyed()
+        ).subscribe(term => {
+            this._searchTerm.set(term);
+            this._pageIndex.set(1); // Reset to first page
+            if (this._viewMode() === 'scroll') {
+                this.scrollStore.reset({ filter: term });
+            } else {
+                this.store.loadEmployees(term, 'name', 'asc', 1, this._pageSize());
+            }
+        });
+    }
 
     // Actions
     loadEmployees(pageIndex: number, pageSize: number): void {
@@ -67,15 +97,45 @@ export class EmployeeFacade {
         this.store.loadEmployees(this._searchTerm(), 'name', 'asc', pageIndex, pageSize);
     }
 
-    loadMasterData(): void {
-        if (this.deptStore.departments().length === 0) {
-            this.deptStore.loadDepartments();
+    /**
+     * Loads whichever list view is active (list page init / back from edit)
+     */
+    loadList(): void {
+        if (this._viewMode() === 'scroll') {
+            this.scrollStore.refresh();
+        } else {
+            this.loadEmployees(1, this._pageSize());
         }
-        if (this.desigStore.designations().length === 0) {
-            this.desigStore.loadDesignations();
+    }
+
+    setViewMode(mode: EmployeeListViewMode): void {
+        if (mode === this._viewMode()) return;
+        this._viewMode.set(mode);
+        if (mode === 'scroll') {
+            this.scrollStore.reset({ filter: this._searchTerm() });
+        } else {
+            this._pageIndex.set(1);
+            this.reloadCurrentPage();
         }
     }
 
+    /**
+     * Virtual-scroll viewport reports the rows it renders; missing windows are fetched (and prefetched)
+     */
+    onScrollRangeChange(range: RowRange): void {
+        this.scrollStore.setVisibleRange(range);
+    }
+
+    sortScrollList(sort: Pick<EmployeeScrollQuery, 'sortBy' | 'sortOrder'>): void {
+        this.scrollStore.reset(sort);
+    }
+
+    // Dropdowns need the full lists, not whichever page the master-data screens last showed
+    loadMasterData(): void {
+        this.deptStore.loadDepartmentLookup();
+        this.desigStore.loadDesignationLookup();
+    }
+
     loadEmployeeById(id: number): void {
         this.store.loadEmployeeById(id);
     }
@@ -100,16 +160,61 @@ export class EmployeeFacade {
     }
 
     deleteEmployee(id: number): void {
-        this.store.deleteEmployee(id);
+        // The paged list drops the row locally; scroll windows are reloaded since every later row shifts
+        this.store.deleteEmployee(id, () => {
+            if (this._viewMode() === 'scroll') this.scrollStore.refresh();
+        });
+    }
+
+    /**
+     * Bulk delete, then reload the current page so it fills up again
+     */
+    deleteEmployees(ids: number[], onDone?: () => void): void {
+        this.store.deleteEmployees(ids, () => {
+            this.reloadCurrentPage();
+            if (onDone) onDone();
+        });
+    }
+
+    /**
+     * Bulk patch (e.g. move the selected employees to another designation)
+     */
+    updateEmployees(ids: number[], patch: EmployeePatch, onDone?: () => void): void {
+        this.store.updateEmployees(ids, patch, () => {
+            // A new designation changes the joined designation/department names, which only the server has
+            if (patch.designationId !== undefined) {
+                this.reloadCurrentPage();
+            } else if (this._viewMode() === 'scroll') {
+                this.scrollStore.refresh();
+            }
+            if (onDone) onDone();
+        });
+    }
+
+    /**
+     * Exports every employee matching the current search (not just the visible page)
+     */
+    exportEmployees(format: EmployeeExportFormat): void {
+        this.store.exportEmployees(format, this._searchTerm());
     }
 
+    /**
+     * Call on every keystroke; the list reloads once typing pauses (see constructor)
+     */
     search(term: string): void {
-        this._searchTerm.set(term);
-        this._pageIndex.set(1); // Reset to first page
-        this.store.loadEmployees(term, 'name', 'asc', 1, this._pageSize());
+        this.searchInput.next(term);
+    }
+
+    private reloadCurrentPage(): void {
+        if (this._viewMode() === 'scroll') {
+            this.scrollStore.refresh();
+            return;
+        }
+        this.store.loadEmployees(this._searchTerm(), 'name', 'asc', this._pageIndex(), this._pageSize());
     }
 
     clearError(): void {
         this.store.clearError();
+        this.scrollStore.clearError();
     }
 }
@@ -15,3 +15,10 @@ export interface CreateDepartmentRequest {
   departmentName: string;
   isActive: boolean;
 }
+
+/**
+ * Patch dùng cho PATCH /api/DepartmentMaster/update-many
+ */
+export interface DepartmentPatch {
+  isActive: boolean;
+}
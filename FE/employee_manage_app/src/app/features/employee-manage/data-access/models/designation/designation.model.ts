@@ -6,6 +6,8 @@ export interface Designation {
   designationId: number;
   departmentId: number;
   designationName: string;
+  /** Chỉ có trong response list (server join sẵn), không có khi create/update trả về */
+  departmentName?: string;
 }
 
 /**
@@ -23,3 +25,10 @@ export interface CreateDesignationRequest {
 export interface DesignationViewModel extends Designation {
   departmentName: string;
 }
+
+/**
+ * Patch dùng cho PATCH /api/DesignationMaster/update-many (chuyển chức danh sang phòng ban khác)
+ */
+export interface DesignationPatch {
+  departmentId: number;
+}
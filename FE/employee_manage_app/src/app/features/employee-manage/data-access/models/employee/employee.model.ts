@@ -58,9 +58,35 @@ export interface UpdateEmployeeRequest {
 }
 
 /**
- * Employee View Model (For UI Display)
- * Includes computed properties like designationName
+ * Employee List Item
+ * Khớp với Backend DTO từ EmployeeListItem.cs (GET /api/EmployeeMaster)
+ * Server đã join sẵn designationName / departmentName, không có password, address
  */
-export interface EmployeeViewModel extends Employee {
+export interface EmployeeListItem {
+  employeeId: number;
+  name: string;
+  email: string;
+  contactNo: string;
+  city: string;
+  state: string;
+  pincode: string;
+  designationId: number;
   designationName: string;
+  departmentId: number;
+  departmentName: string;
+  createDate: string;
+}
+
+/**
+ * Patch dùng cho PATCH /api/EmployeeMaster/update-many (field bỏ trống = giữ nguyên)
+ */
+export interface EmployeePatch {
+  designationId?: number;
+  city?: string;
+  state?: string;
 }
+
+/**
+ * Định dạng file xuất (GET /api/EmployeeMaster/export)
+ */
+export type EmployeeExportFormat = 'csv' | 'ndjson';
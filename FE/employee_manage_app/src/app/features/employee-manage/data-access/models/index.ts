@@ -1,3 +1,4 @@
 export * from './employee/employee.model';
 export * from './department/department.model';
 export * from './designation/designation.model';
+export * from './overview/dashboard-stats.model';
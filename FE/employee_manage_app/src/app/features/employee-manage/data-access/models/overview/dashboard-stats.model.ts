@@ -0,0 +1,34 @@
+/**
+ * Dashboard Stats Model
+ * Khớp với Backend DTO từ DashboardStats.cs (GET /api/Stats)
+ */
+export interface DashboardStats {
+  totalEmployees: number;
+  totalDepartments: number;
+  activeDepartments: number;
+  recentHireCount: number;
+  recentHireDays: number;
+  employeesPerDepartment: DepartmentHeadcount[];
+  employeesPerDesignation: DesignationHeadcount[];
+  recentHires: RecentHire[];
+}
+
+export interface DepartmentHeadcount {
+  departmentId: number;
+  departmentName: string;
+  employeeCount: number;
+}
+
+export interface DesignationHeadcount {
+  designationId: number;
+  designationName: string;
+  departmentId: number;
+  employeeCount: number;
+}
+
+export interface RecentHire {
+  employeeId: number;
+  name: string;
+  designationId: number;
+  createDate: string;
+}
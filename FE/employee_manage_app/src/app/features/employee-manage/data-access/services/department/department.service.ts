@@ -1,8 +1,10 @@
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
 import { ApiResponse } from '@core/models/api-response.model';
-import { Department } from '../../models';
+import { PagedResult } from '@core/models/paged-result.model';
+import { BatchResult } from '@core/models/batch-result.model';
+import { Department, DepartmentPatch } from '../../models';
 import { environment } from 'src/environments/environment';
 
 @Injectable({
@@ -14,11 +16,24 @@ export class DepartmentService {
   constructor(private http: HttpClient) { }
 
   /**
-   * Get all departments
+   * Get one page of departments
+   * @param pageNumber Page number (default: 1)
+   * @param pageSize Items per page (default: 10, server max 50)
+   * @returns Observable<ApiResponse<PagedResult<Department>>> (items + totalCount)
+   */
+  getAllDepartments(pageNumber: number = 1, pageSize: number = 10): Observable<ApiResponse<PagedResult<Department>>> {
+    const params = new HttpParams()
+      .set('pageNumber', pageNumber.toString())
+      .set('pageSize', pageSize.toString());
+    return this.http.get<ApiResponse<PagedResult<Department>>>(this.apiUrl, { params });
+  }
+
+  /**
+   * Every department (not paged), for dropdowns
    * @returns Observable<ApiResponse<Department[]>>
    */
-  getAllDepartments(): Observable<ApiResponse<Department[]>> {
-    return this.http.get<ApiResponse<Department[]>>(this.apiUrl);
+  getDepartmentLookup(): Observable<ApiResponse<Department[]>> {
+    return this.http.get<ApiResponse<Department[]>>(`${this.apiUrl}/lookup`);
   }
 
   /**
@@ -57,4 +72,23 @@ export class DepartmentService {
   deleteDepartment(id: number): Observable<ApiResponse<void>> {
     return this.http.delete<ApiResponse<void>>(`${this.apiUrl}/${id}`);
   }
+
+  /**
+   * Delete many departments in one request (one transaction on the server)
+   * @param ids Department IDs
+   * @returns Observable<ApiResponse<BatchResult>> with one result per id
+   */
+  deleteDepartments(ids: number[]): Observable<ApiResponse<BatchResult>> {
+    return this.http.post<ApiResponse<BatchResult>>(`${this.apiUrl}/delete-many`, { ids });
+  }
+
+  /**
+   * Apply the same patch to many departments in one request
+   * @param ids Department IDs
+   * @param patch Fields to set
+   * @returns Observable<ApiResponse<BatchResult>> with one result per id
+   */
+  updateDepartments(ids: number[], patch: DepartmentPatch): Observable<ApiResponse<BatchResult>> {
+    return this.http.patch<ApiResponse<BatchResult>>(`${this.apiUrl}/update-many`, { ids, patch });
+  }
 }
@@ -1,9 +1,11 @@
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
 import { ApiResponse } from '@core/models/api-response.model';
+import { PagedResult } from '@core/models/paged-result.model';
+import { BatchResult } from '@core/models/batch-result.model';
 import { environment } from 'src/environments/environment';
-import { Designation } from '../../models';
+import { Designation, DesignationPatch } from '../../models';
 
 @Injectable({
   providedIn: 'root'
@@ -14,11 +16,24 @@ export class DesignationService {
   constructor(private http: HttpClient) { }
 
   /**
-   * Get all designations
+   * Get one page of designations (department name joined by the server)
+   * @param pageNumber Page number (default: 1)
+   * @param pageSize Items per page (default: 10, server max 50)
+   * @returns Observable<ApiResponse<PagedResult<Designation>>> (items + totalCount)
+   */
+  getAllDesignations(pageNumber: number = 1, pageSize: number = 10): Observable<ApiResponse<PagedResult<Designation>>> {
+    const params = new HttpParams()
+      .set('pageNumber', pageNumber.toString())
+      .set('pageSize', pageSize.toString());
+    return this.http.get<ApiResponse<PagedResult<Designation>>>(this.apiUrl, { params });
+  }
+
+  /**
+   * Every designation (not paged), for dropdowns
    * @returns Observable<ApiResponse<Designation[]>>
    */
-  getAllDesignations(): Observable<ApiResponse<Designation[]>> {
-    return this.http.get<ApiResponse<Designation[]>>(this.apiUrl);
+  getDesignationLookup(): Observable<ApiResponse<Designation[]>> {
+    return this.http.get<ApiResponse<Designation[]>>(`${this.apiUrl}/lookup`);
   }
 
   /**
@@ -57,4 +72,23 @@ export class DesignationService {
   deleteDesignation(id: number): Observable<ApiResponse<void>> {
     return this.http.delete<ApiResponse<void>>(`${this.apiUrl}/${id}`);
   }
+
+  /**
+   * Delete many designations in one request (one transaction on the server)
+   * @param ids Designation IDs
+   * @returns Observable<ApiResponse<BatchResult>> with one result per id
+   */
+  deleteDesignations(ids: number[]): Observable<ApiResponse<BatchResult>> {
+    return this.http.post<ApiResponse<BatchResult>>(`${this.apiUrl}/delete-many`, { ids });
+  }
+
+  /**
+   * Apply the same patch to many designations in one request
+   * @param ids Designation IDs
+   * @param patch Fields to set
+   * @returns Observable<ApiResponse<BatchResult>> with one result per id
+   */
+  updateDesignations(ids: number[], patch: DesignationPatch): Observable<ApiResponse<BatchResult>> {
+    return this.http.patch<ApiResponse<BatchResult>>(`${this.apiUrl}/update-many`, { ids, patch });
+  }
 }
@@ -1,8 +1,11 @@
 import { Injectable } from '@angular/core';
-import { HttpClient, HttpParams } from '@angular/common/http';
+import { HttpClient, HttpContext, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
-import { Employee, CreateEmployeeRequest, UpdateEmployeeRequest } from '../../models';
+import { Employee, EmployeeListItem, EmployeeExportFormat, EmployeePatch, CreateEmployeeRequest, UpdateEmployeeRequest } from '../../models';
 import { ApiResponse } from '@core/models/api-response.model';
+import { PagedResult } from '@core/models/paged-result.model';
+import { BatchResult } from '@core/models/batch-result.model';
+import { SKIP_DEDUPE } from '@core/interceptors/dedupe.interceptor';
 import { environment } from 'src/environments/environment';
 
 /**
@@ -32,7 +35,7 @@ export class EmployeeService {
    * @param sortOrder 'asc' hoặc 'desc'
    * @param pageNumber Số trang (mặc định: 1)
    * @param pageSize Số item/trang (mặc định: 10)
-   * @returns Observable chứa ApiResponse với mảng Employee
+   * @returns Observable chứa ApiResponse với PagedResult<EmployeeListItem> (items + totalCount)
    */
   getAllEmployees(
     filter?: string,
@@ -40,7 +43,7 @@ export class EmployeeService {
     sortOrder: string = 'asc',
     pageNumber: number = 1,
     pageSize: number = 10
-  ): Observable<ApiResponse<Employee[]>> {
+  ): Observable<ApiResponse<PagedResult<EmployeeListItem>>> {
     let params = new HttpParams();
 
     if (filter) {
@@ -52,7 +55,29 @@ export class EmployeeService {
       .set('pageNumber', pageNumber.toString())
       .set('pageSize', pageSize.toString());
 
-    return this.http.get<ApiResponse<Employee[]>>(this.employeeEndpoint, { params });
+    return this.http.get<ApiResponse<PagedResult<EmployeeListItem>>>(this.employeeEndpoint, { params });
+  }
+
+  /**
+   * Xuất toàn bộ nhân viên (kèm tên chức vụ / phòng ban) ra file
+   * Server stream từng dòng nên không bị giới hạn pageSize như getAllEmployees
+   * Không gộp với request đang chạy: mỗi lần bấm xuất là một file riêng
+   *
+   * @param format 'csv' hoặc 'ndjson'
+   * @param filter Cùng điều kiện tìm kiếm với danh sách (tùy chọn)
+   * @returns Observable chứa file dạng Blob (không bọc trong ApiResponse)
+   */
+  exportEmployees(format: EmployeeExportFormat, filter?: string): Observable<Blob> {
+    let params = new HttpParams().set('format', format);
+    if (filter) {
+      params = params.set('filter', filter);
+    }
+
+    return this.http.get(`${this.employeeEndpoint}/export`, {
+      params,
+      responseType: 'blob',
+      context: new HttpContext().set(SKIP_DEDUPE, true)
+    });
   }
 
   /**
@@ -95,4 +120,25 @@ export class EmployeeService {
   deleteEmployee(employeeId: number): Observable<ApiResponse<null>> {
     return this.http.delete<ApiResponse<null>>(`${this.employeeEndpoint}/${employeeId}`);
   }
+
+  /**
+   * Xóa nhiều nhân viên trong một request (một transaction phía server)
+   *
+   * @param employeeIds Danh sách ID (tối đa 1000)
+   * @returns Observable chứa ApiResponse với BatchResult (kết quả theo từng id)
+   */
+  deleteEmployees(employeeIds: number[]): Observable<ApiResponse<BatchResult>> {
+    return this.http.post<ApiResponse<BatchResult>>(`${this.employeeEndpoint}/delete-many`, { ids: employeeIds });
+  }
+
+  /**
+   * Cập nhật cùng một patch cho nhiều nhân viên (vd: chuyển sang chức vụ mới)
+   *
+   * @param employeeIds Danh sách ID (tối đa 1000)
+   * @param patch Các field cần đổi, field bỏ trống được giữ nguyên
+   * @returns Observable chứa ApiResponse với BatchResult (kết quả theo từng id)
+   */
+  updateEmployees(employeeIds: number[], patch: EmployeePatch): Observable<ApiResponse<BatchResult>> {
+    return this.http.patch<ApiResponse<BatchResult>>(`${this.employeeEndpoint}/update-many`, { ids: employeeIds, patch });
+  }
 }
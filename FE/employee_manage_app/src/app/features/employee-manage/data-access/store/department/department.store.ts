@@ -1,15 +1,20 @@
 import { Injectable, NgZone, Injector, computed, signal, WritableSignal } from '@angular/core';
 import { ToastrService } from 'ngx-toastr';
+import { QueryCache } from '@core/cache/query-cache';
 import { AppError } from '@core/models/app-error.model';
 import { mapToAppError } from '@core/utils/error.utils';
-import { CreateDepartmentRequest, Department } from '../../models';
+import { describeBatchFailures, succeededIds } from '@core/utils/batch.utils';
+import { CreateDepartmentRequest, Department, DepartmentPatch } from '../../models';
 import { DepartmentService } from '../../services/department/department.service';
+import { QueryScopes } from '../query-scopes';
 
 /**
  * Department State Interface
  */
 interface DepartmentState {
     departments: Department[];
+    totalCount: number;
+    allDepartments: Department[];
     loading: boolean;
     error: AppError | null;
     selectedDepartment: Department | null;
@@ -20,7 +25,11 @@ interface DepartmentState {
 })
 export class DepartmentStore {
     // ============= INTERNAL STATE SIGNALS =============
+    // Trang đang hiện trên bảng (phân trang phía server)
     private departmentsSignal: WritableSignal<Department[]> = signal([]);
+    private totalCountSignal: WritableSignal<number> = signal(0);
+    // Toàn bộ phòng ban cho dropdown (GET /lookup)
+    private allDepartmentsSignal: WritableSignal<Department[]> = signal([]);
     private loadingSignal: WritableSignal<boolean> = signal(false);
     private errorSignal: WritableSignal<AppError | null> = signal(null);
     private selectedDepartmentSignal: WritableSignal<Department | null> = signal(null);
@@ -32,6 +41,8 @@ export class DepartmentStore {
 
     // ============= COMPUTED SIGNALS =============
     readonly departments = computed(() => this.departmentsSignal());
+    readonly totalCount = computed(() => this.totalCountSignal());
+    readonly allDepartments = computed(() => this.allDepartmentsSignal());
     readonly selectedDepartment = computed(() => this.selectedDepartmentSignal());
     readonly error = computed(() => this.errorSignal());
 
@@ -51,6 +62,7 @@ export class DepartmentStore {
 
     constructor(
         private departmentService: DepartmentService,
+        private queryCache: QueryCache,
         private toastrService: ToastrService,
         private ngZone: NgZone
     ) { }
@@ -58,16 +70,19 @@ export class DepartmentStore {
     // ============= ACTIONS =============
 
     /**
-     * Load all departments
+     * Load một trang phòng ban (qua QueryCache: quay lại trang không phải chờ spinner)
      */
-    loadDepartments(): void {
+    loadDepartments(pageNumber: number = 1, pageSize: number = 10): void {
         this.loadingSignal.set(true);
         this.errorSignal.set(null);
 
-        this.departmentService.getAllDepartments().subscribe({
-            next: (response) => {
+        // Có cache thì render ngay, data cũ được revalidate ngầm (xem QueryCache)
+        const key = QueryCache.key(QueryScopes.departments, { pageNumber, pageSize });
+        this.queryCache.query(key, () => this.departmentService.getAllDepartments(pageNumber, pageSize)).subscribe({
+            next: ({ data: response }) => {
                 this.ngZone.run(() => {
-                    this.departmentsSignal.set(response.data || []);
+                    this.departmentsSignal.set(response.data?.items || []);
+                    this.totalCountSignal.set(response.data?.totalCount || 0);
                     this.loadingSignal.set(false);
                 });
             },
@@ -80,6 +95,21 @@ export class DepartmentStore {
         });
     }
 
+    /**
+     * Load toàn bộ phòng ban cho dropdown (không phụ thuộc trang/pageSize mặc định của server)
+     */
+    loadDepartmentLookup(): void {
+        const key = QueryCache.key(QueryScopes.departments, { lookup: true });
+        this.queryCache.query(key, () => this.departmentService.getDepartmentLookup()).subscribe({
+            next: ({ data: response }) => {
+                this.ngZone.run(() => this.allDepartmentsSignal.set(response.data || []));
+            },
+            error: (err) => {
+                this.ngZone.run(() => this.errorSignal.set(mapToAppError(err, 'Failed to load departments')));
+            }
+        });
+    }
+
     /**
      * Get department by ID
      */
@@ -117,8 +147,10 @@ export class DepartmentStore {
 
         this.departmentService.createDepartment(payload).subscribe({
             next: (response) => {
-                const current = this.departmentsSignal();
-                this.departmentsSignal.set([...current, response.data]);
+                this.queryCache.invalidate(QueryScopes.departments);
+                // Bảng phân trang phía server nên không chèn tay, màn list sẽ load lại trang
+                this.totalCountSignal.set(this.totalCountSignal() + 1);
+                this.allDepartmentsSignal.set([...this.allDepartmentsSignal(), response.data]);
                 this.isCreatingSignal.set(false);
                 this.toastrService.success('Phòng ban mới đã được tạo!', 'Thành công');
                 if (onSuccess) onSuccess();
@@ -143,9 +175,8 @@ export class DepartmentStore {
 
         this.departmentService.updateDepartment(id, payload).subscribe({
             next: (response) => {
-                const current = this.departmentsSignal();
-                const updated = current.map(d => d.departmentId === id ? response.data : d);
-                this.departmentsSignal.set(updated);
+                this.queryCache.invalidate(QueryScopes.departments, QueryScopes.employees);
+                this.patchLists(list => list.map(d => d.departmentId === id ? response.data : d));
 
                 // Update selected if needed
                 const selected = this.selectedDepartmentSignal();
@@ -175,9 +206,9 @@ export class DepartmentStore {
 
         this.departmentService.deleteDepartment(id).subscribe({
             next: () => {
-                const current = this.departmentsSignal();
-                const filtered = current.filter(d => d.departmentId !== id);
-                this.departmentsSignal.set(filtered);
+                this.queryCache.invalidate(QueryScopes.departments, QueryScopes.employees);
+                this.patchLists(list => list.filter(d => d.departmentId !== id));
+                this.totalCountSignal.set(Math.max(this.totalCountSignal() - 1, 0));
 
                 const selected = this.selectedDepartmentSignal();
                 if (selected && selected.departmentId === id) {
@@ -196,6 +227,80 @@ export class DepartmentStore {
         });
     }
 
+    /**
+     * Delete many departments in one request; ids still in use are reported and kept
+     */
+    deleteDepartments(ids: number[], onDone?: () => void): void {
+        this.isDeletingSignal.set(true);
+        this.errorSignal.set(null);
+
+        this.departmentService.deleteDepartments(ids).subscribe({
+            next: (response) => {
+                this.queryCache.invalidate(QueryScopes.departments, QueryScopes.employees);
+                const deleted = succeededIds(response.data);
+                this.patchLists(list => list.filter(d => !deleted.has(d.departmentId)));
+                this.totalCountSignal.set(Math.max(this.totalCountSignal() - deleted.size, 0));
+
+                const selected = this.selectedDepartmentSignal();
+                if (selected && deleted.has(selected.departmentId)) {
+                    this.selectedDepartmentSignal.set(null);
+                }
+
+                this.isDeletingSignal.set(false);
+                if (response.data.failed === 0) {
+                    this.toastrService.success(`Đã xóa ${deleted.size} phòng ban!`, 'Thành công');
+                } else {
+                    this.toastrService.warning(describeBatchFailures(response.data), `Đã xóa ${deleted.size} phòng ban`);
+                }
+                if (onDone) onDone();
+            },
+            error: (err) => {
+                const errorObj = mapToAppError(err, 'Không thể xóa phòng ban');
+                this.errorSignal.set(errorObj);
+                this.isDeletingSignal.set(false);
+                this.toastrService.error(errorObj.message, 'Lỗi');
+            }
+        });
+    }
+
+    /**
+     * Apply the same patch to many departments in one request
+     */
+    updateDepartments(ids: number[], patch: DepartmentPatch, onDone?: () => void): void {
+        this.isUpdatingSignal.set(true);
+        this.errorSignal.set(null);
+
+        this.departmentService.updateDepartments(ids, patch).subscribe({
+            next: (response) => {
+                this.queryCache.invalidate(QueryScopes.departments, QueryScopes.employees);
+                const updated = succeededIds(response.data);
+                this.patchLists(list => list.map(d => updated.has(d.departmentId) ? { ...d, ...patch } : d));
+
+                this.isUpdatingSignal.set(false);
+                if (response.data.failed === 0) {
+                    this.toastrService.success(`Đã cập nhật ${updated.size} phòng ban!`, 'Thành công');
+                } else {
+                    this.toastrService.warning(describeBatchFailures(response.data), `Đã cập nhật ${updated.size} phòng ban`);
+                }
+                if (onDone) onDone();
+            },
+            error: (err) => {
+                const errorObj = mapToAppError(err, 'Không thể cập nhật phòng ban');
+                this.errorSignal.set(errorObj);
+                this.isUpdatingSignal.set(false);
+                this.toastrService.error(errorObj.message, 'Lỗi');
+            }
+        });
+    }
+
+    /**
+     * Áp cùng một thay đổi lên trang đang hiện và danh sách dropdown
+     */
+    private patchLists(change: (list: Department[]) => Department[]): void {
+        this.departmentsSignal.set(change(this.departmentsSignal()));
+        this.allDepartmentsSignal.set(change(this.allDepartmentsSignal()));
+    }
+
     /**
      * Clear errors
      */
@@ -1,15 +1,20 @@
 import { Injectable, NgZone, computed, signal, WritableSignal } from '@angular/core';
 import { ToastrService } from 'ngx-toastr';
+import { QueryCache } from '@core/cache/query-cache';
 import { AppError } from '@core/models/app-error.model';
 import { mapToAppError } from '@core/utils/error.utils';
-import { CreateDesignationRequest, Designation } from '../../models';
+import { describeBatchFailures, succeededIds } from '@core/utils/batch.utils';
+import { CreateDesignationRequest, Designation, DesignationPatch } from '../../models';
 import { DesignationService } from '../../services/designation/designation.service';
+import { QueryScopes } from '../query-scopes';
 
 /**
  * Designation State Interface
  */
 interface DesignationState {
     designations: Designation[];
+    totalCount: number;
+    allDesignations: Designation[];
     loading: boolean;
     error: AppError | null;
     selectedDesignation: Designation | null;
@@ -20,7 +25,11 @@ interface DesignationState {
 })
 export class DesignationStore {
     // ============= INTERNAL STATE SIGNALS =============
+    // Trang đang hiện trên bảng (phân trang phía server)
     private designationsSignal: WritableSignal<Designation[]> = signal([]);
+    private totalCountSignal: WritableSignal<number> = signal(0);
+    // Toàn bộ chức danh cho dropdown (GET /lookup)
+    private allDesignationsSignal: WritableSignal<Designation[]> = signal([]);
     private loadingSignal: WritableSignal<boolean> = signal(false);
     private errorSignal: WritableSignal<AppError | null> = signal(null);
     private selectedDesignationSignal: WritableSignal<Designation | null> = signal(null);
@@ -32,6 +41,8 @@ export class DesignationStore {
 
     // ============= COMPUTED SIGNALS =============
     readonly designations = computed(() => this.designationsSignal());
+    readonly totalCount = computed(() => this.totalCountSignal());
+    readonly allDesignations = computed(() => this.allDesignationsSignal());
     readonly selectedDesignation = computed(() => this.selectedDesignationSignal());
     readonly error = computed(() => this.errorSignal());
 
@@ -50,6 +61,7 @@ export class DesignationStore {
 
     constructor(
         private designationService: DesignationService,
+        private queryCache: QueryCache,
         private toastrService: ToastrService,
         private ngZone: NgZone
     ) { }
@@ -57,16 +69,19 @@ export class DesignationStore {
     // ============= ACTIONS =============
 
     /**
-     * Load all designations
+     * Load một trang chức danh (qua QueryCache: quay lại trang không phải chờ spinner)
      */
-    loadDesignations(): void {
+    loadDesignations(pageNumber: number = 1, pageSize: number = 10): void {
         this.loadingSignal.set(true);
         this.errorSignal.set(null);
 
-        this.designationService.getAllDesignations().subscribe({
-            next: (response) => {
+        // Có cache thì render ngay, data cũ được revalidate ngầm (xem QueryCache)
+        const key = QueryCache.key(QueryScopes.designations, { pageNumber, pageSize });
+        this.queryCache.query(key, () => this.designationService.getAllDesignations(pageNumber, pageSize)).subscribe({
+            next: ({ data: response }) => {
                 this.ngZone.run(() => {
-                    this.designationsSignal.set(response.data || []);
+                    this.designationsSignal.set(response.data?.items || []);
+                    this.totalCountSignal.set(response.data?.totalCount || 0);
                     this.loadingSignal.set(false);
                 });
             },
@@ -79,6 +94,21 @@ export class DesignationStore {
         });
     }
 
+    /**
+     * Load toàn bộ chức danh cho dropdown (không phụ thuộc trang/pageSize mặc định của server)
+     */
+    loadDesignationLookup(): void {
+        const key = QueryCache.key(QueryScopes.designations, { lookup: true });
+        this.queryCache.query(key, () => this.designationService.getDesignationLookup()).subscribe({
+            next: ({ data: response }) => {
+                this.ngZone.run(() => this.allDesignationsSignal.set(response.data || []));
+            },
+            error: (err) => {
+                this.ngZone.run(() => this.errorSignal.set(mapToAppError(err, 'Failed to load designations')));
+            }
+        });
+    }
+
     /**
      * Get designation by ID
      */
@@ -116,8 +146,10 @@ export class DesignationStore {
 
         this.designationService.createDesignation(payload).subscribe({
             next: (response) => {
-                const current = this.designationsSignal();
-                this.designationsSignal.set([...current, response.data]);
+                this.queryCache.invalidate(QueryScopes.designations);
+                // Bảng phân trang phía server nên không chèn tay, màn list sẽ load lại trang
+                this.totalCountSignal.set(this.totalCountSignal() + 1);
+                this.allDesignationsSignal.set([...this.allDesignationsSignal(), response.data]);
                 this.isCreatingSignal.set(false);
                 this.toastrService.success('Chức danh mới đã được tạo!', 'Thành công');
                 if (onSuccess) onSuccess();
@@ -142,9 +174,8 @@ export class DesignationStore {
 
         this.designationService.updateDesignation(id, payload).subscribe({
             next: (response) => {
-                const current = this.designationsSignal();
-                const updated = current.map(d => d.designationId === id ? response.data : d);
-                this.designationsSignal.set(updated);
+                this.queryCache.invalidate(QueryScopes.designations, QueryScopes.employees);
+                this.patchLists(list => list.map(d => d.designationId === id ? response.data : d));
 
                 const selected = this.selectedDesignationSignal();
                 if (selected && selected.designationId === id) {
@@ -173,9 +204,9 @@ export class DesignationStore {
 
         this.designationService.deleteDesignation(id).subscribe({
             next: () => {
-                const current = this.designationsSignal();
-                const filtered = current.filter(d => d.designationId !== id);
-                this.designationsSignal.set(filtered);
+                this.queryCache.invalidate(QueryScopes.designations, QueryScopes.employees);
+                this.patchLists(list => list.filter(d => d.designationId !== id));
+                this.totalCountSignal.set(Math.max(this.totalCountSignal() - 1, 0));
 
                 const selected = this.selectedDesignationSignal();
                 if (selected && selected.designationId === id) {
@@ -194,6 +225,83 @@ export class DesignationStore {
         });
     }
 
+    /**
+     * Delete many designations in one request; ids still in use are reported and kept
+     */
+    deleteDesignations(ids: number[], onDone?: () => void): void {
+        this.isDeletingSignal.set(true);
+        this.errorSignal.set(null);
+
+        this.designationService.deleteDesignations(ids).subscribe({
+            next: (response) => {
+                this.queryCache.invalidate(QueryScopes.designations, QueryScopes.employees);
+                const deleted = succeededIds(response.data);
+                this.patchLists(list => list.filter(d => !deleted.has(d.designationId)));
+                this.totalCountSignal.set(Math.max(this.totalCountSignal() - deleted.size, 0));
+
+                const selected = this.selectedDesignationSignal();
+                if (selected && deleted.has(selected.designationId)) {
+                    this.selectedDesignationSignal.set(null);
+                }
+
+                this.isDeletingSignal.set(false);
+                if (response.data.failed === 0) {
+                    this.toastrService.success(`Đã xóa ${deleted.size} chức danh!`, 'Thành công');
+                } else {
+                    this.toastrService.warning(describeBatchFailures(response.data), `Đã xóa ${deleted.size} chức danh`);
+                }
+                if (onDone) onDone();
+            },
+            error: (err) => {
+                const errorObj = mapToAppError(err, 'Không thể xóa chức danh');
+                this.errorSignal.set(errorObj);
+                this.isDeletingSignal.set(false);
+                this.toastrService.error(errorObj.message, 'Lỗi');
+            }
+        });
+    }
+
+    /**
+     * Apply the same patch to many designations in one request
+     */
+    updateDesignations(ids: number[], patch: DesignationPatch, onDone?: () => void): void {
+        this.isUpdatingSignal.set(true);
+        this.errorSignal.set(null);
+
+        this.designationService.updateDesignations(ids, patch).subscribe({
+            next: (response) => {
+                this.queryCache.invalidate(QueryScopes.designations, QueryScopes.employees);
+                const updated = succeededIds(response.data);
+                // Đổi phòng ban thì tên phòng ban từ lần load trước không còn đúng
+                this.patchLists(list => list.map(d => updated.has(d.designationId)
+                    ? { ...d, ...patch, departmentName: patch.departmentId === d.departmentId ? d.departmentName : undefined }
+                    : d));
+
+                this.isUpdatingSignal.set(false);
+                if (response.data.failed === 0) {
+                    this.toastrService.success(`Đã cập nhật ${updated.size} chức danh!`, 'Thành công');
+                } else {
+                    this.toastrService.warning(describeBatchFailures(response.data), `Đã cập nhật ${updated.size} chức danh`);
+                }
+                if (onDone) onDone();
+            },
+            error: (err) => {
+                const errorObj = mapToAppError(err, 'Không thể cập nhật chức danh');
+                this.errorSignal.set(errorObj);
+                this.isUpdatingSignal.set(false);
+                this.toastrService.error(errorObj.message, 'Lỗi');
+            }
+        });
+    }
+
+    /**
+     * Áp cùng một thay đổi lên trang đang hiện và danh sách dropdown
+     */
+    private patchLists(change: (list: Designation[]) => Designation[]): void {
+        this.designationsSignal.set(change(this.designationsSignal()));
+        this.allDesignationsSignal.set(change(this.allDesignationsSignal()));
+    }
+
     clearError(): void {
         this.errorSignal.set(null);
     }
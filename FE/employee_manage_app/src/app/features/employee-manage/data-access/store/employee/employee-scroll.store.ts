@@ -0,0 +1,193 @@
+import { Injectable, NgZone, WritableSignal, computed, signal } from '@angular/core';
+import { Subscription, finalize } from 'rxjs';
+import { EmployeeService } from '../../services/employee/employee.service';
+import { EmployeeListItem } from '../../models';
+import { AppError } from '@core/models/app-error.model';
+import { mapToAppError } from '@core/utils/error.utils';
+
+/** Số dòng mỗi window = pageSize gửi lên API (server giới hạn tối đa 50) */
+const WINDOW_SIZE = 50;
+
+/** Số window tối đa giữ trong bộ nhớ; khi vượt, window xa vùng đang xem nhất bị bỏ */
+const MAX_WINDOWS = 20;
+
+/** Tải trước bao nhiêu dòng theo hướng đang cuộn */
+const PREFETCH_ROWS = WINDOW_SIZE;
+
+/**
+ * Điều kiện của danh sách cuộn (filter / sort vẫn chạy phía server)
+ */
+export interface EmployeeScrollQuery {
+  filter: string;
+  sortBy: string;
+  sortOrder: 'asc' | 'desc';
+}
+
+/**
+ * Khoảng dòng đang được render [start, end)
+ */
+export interface RowRange {
+  start: number;
+  end: number;
+}
+
+/**
+ * EmployeeScrollStore
+ * State cho chế độ xem cuộn ảo (virtual scroll) của danh sách nhân viên
+ *
+ * Kiến trúc:
+ * - Dữ liệu được tải theo window WINDOW_SIZE dòng (GET /api/EmployeeMaster?pageNumber=&pageSize=)
+ *   và giữ trong Map<window index, dòng>; UI đọc từng dòng qua rowAt(index), dòng chưa tải (hoặc đã bị bỏ)
+ *   là undefined -> placeholder. totalCount chỉ dùng cho chiều cao vùng cuộn
+ * - Mỗi lần vùng render thay đổi: tải các window còn thiếu + một window phía trước theo hướng cuộn
+ * - Chỉ giữ tối đa MAX_WINDOWS window: bộ nhớ và chi phí mỗi lần tải không tăng theo totalCount
+ * - Đổi filter/sort: hủy mọi request đang chạy và tải lại từ đầu
+ */
+@Injectable({
+  providedIn: 'root'
+})
+export class EmployeeScrollStore {
+  // ============= INTERNAL STATE SIGNALS (PRIVATE) =============
+
+  private windowsSignal: WritableSignal<ReadonlyMap<number, EmployeeListItem[]>> = signal(new Map());
+  private totalCountSignal: WritableSignal<number> = signal(0);
+  private pendingCountSignal: WritableSignal<number> = signal(0);
+  private errorSignal: WritableSignal<AppError | null> = signal(null);
+  private querySignal: WritableSignal<EmployeeScrollQuery> = signal({ filter: '', sortBy: 'name', sortOrder: 'asc' });
+
+  /** Request đang chạy theo window index (đăng ký trước khi subscribe, finalize tự xóa) */
+  private readonly pendingWindows = new Map<number, Subscription>();
+
+  /** Vùng render gần nhất, dùng cho refresh() và để biết hướng cuộn */
+  private lastRange: RowRange = { start: 0, end: 0 };
+
+  // ============= DERIVED/COMPUTED SIGNALS (PUBLIC READ-ONLY) =============
+
+  /** Dòng thứ index của danh sách, undefined nếu window chứa nó chưa tải / đã bị bỏ */
+  readonly rowAt = computed(() => {
+    const windows = this.windowsSignal();
+    return (index: number): EmployeeListItem | undefined =>
+      windows.get(Math.floor(index / WINDOW_SIZE))?.[index % WINDOW_SIZE];
+  });
+  readonly totalCount = computed(() => this.totalCountSignal());
+  readonly isLoading = computed(() => this.pendingCountSignal() > 0);
+  readonly error = computed(() => this.errorSignal());
+  readonly query = computed(() => this.querySignal());
+
+  constructor(
+    private employeeService: EmployeeService,
+    private ngZone: NgZone
+  ) { }
+
+  // ============= ACTIONS / METHODS =============
+
+  /**
+   * Bắt đầu lại với điều kiện mới (giữ các field không truyền vào)
+   */
+  reset(query: Partial<EmployeeScrollQuery> = {}): void {
+    this.cancelPending();
+    this.querySignal.set({ ...this.querySignal(), ...query });
+    this.windowsSignal.set(new Map());
+    this.totalCountSignal.set(0);
+    this.errorSignal.set(null);
+    this.lastRange = { start: 0, end: 0 };
+
+    // Window đầu + prefetch, trước khi viewport kịp báo vùng render
+    this.loadWindow(0);
+    this.loadWindow(1);
+  }
+
+  /**
+   * Tải lại vùng đang xem với cùng điều kiện (vd: sau khi xóa nhân viên), giữ vị trí cuộn
+   */
+  refresh(): void {
+    this.cancelPending();
+    // totalCount giữ nguyên đến khi có response: chiều cao vùng cuộn không đổi
+    this.windowsSignal.set(new Map());
+    this.errorSignal.set(null);
+    this.setVisibleRange(this.lastRange);
+  }
+
+  /**
+   * Viewport báo vùng đang render: tải window còn thiếu, prefetch theo hướng cuộn, bỏ window ở xa
+   */
+  setVisibleRange(range: RowRange): void {
+    const scrollingUp = range.start < this.lastRange.start;
+    this.lastRange = range;
+
+    const total = this.totalCountSignal();
+    const start = scrollingUp ? Math.max(range.start - PREFETCH_ROWS, 0) : range.start;
+    const end = scrollingUp ? range.end : range.end + PREFETCH_ROWS;
+    const lastRow = total > 0 ? Math.min(end, total) - 1 : end - 1;
+
+    for (let w = Math.floor(start / WINDOW_SIZE); w <= Math.floor(Math.max(lastRow, start) / WINDOW_SIZE); w++) {
+      this.loadWindow(w);
+    }
+  }
+
+  clearError(): void {
+    this.errorSignal.set(null);
+  }
+
+  // ============= PRIVATE HELPERS =============
+
+  private loadWindow(window: number): void {
+    const total = this.totalCountSignal();
+    if (this.windowsSignal().has(window) || this.pendingWindows.has(window) || (total > 0 && window * WINDOW_SIZE >= total)) {
+      return;
+    }
+
+    const { filter, sortBy, sortOrder } = this.querySignal();
+    this.pendingCountSignal.update(n => n + 1);
+
+    // Đăng ký trước khi subscribe: response trả về đồng bộ (dedupe/ETag) chạy finalize ngay trong subscribe()
+    const subscription = new Subscription();
+    this.pendingWindows.set(window, subscription);
+    subscription.add(this.employeeService
+      .getAllEmployees(filter || undefined, sortBy, sortOrder, window + 1, WINDOW_SIZE)
+      .pipe(finalize(() => {
+        if (this.pendingWindows.get(window) === subscription) {
+          this.pendingWindows.delete(window);
+        }
+        this.pendingCountSignal.update(n => n - 1);
+      }))
+      .subscribe({
+        next: (response) => {
+          this.ngZone.run(() => {
+            this.applyWindow(window, response.data?.items || [], response.data?.totalCount || 0);
+          });
+        },
+
+        error: (err) => {
+          this.ngZone.run(() => {
+            this.errorSignal.set(mapToAppError(err, 'Failed to load employees'));
+          });
+        }
+      }));
+  }
+
+  /**
+   * Thêm một window vào Map (copy tối đa MAX_WINDOWS + 1 entry, không phụ thuộc totalCount) rồi bỏ bớt window ở xa
+   */
+  private applyWindow(window: number, items: EmployeeListItem[], totalCount: number): void {
+    const windows = new Map(this.windowsSignal());
+    windows.set(window, items);
+
+    // Giữ các window gần giữa vùng đang xem nhất
+    const center = Math.floor((this.lastRange.start + this.lastRange.end) / 2 / WINDOW_SIZE);
+    const byDistance = [...windows.keys()].sort((a, b) => Math.abs(b - center) - Math.abs(a - center));
+    while (windows.size > MAX_WINDOWS) {
+      windows.delete(byDistance.shift()!);
+    }
+
+    this.windowsSignal.set(windows);
+    this.totalCountSignal.set(totalCount);
+  }
+
+  private cancelPending(): void {
+    // finalize() của mỗi request tự xóa nó khỏi pendingWindows
+    for (const subscription of [...this.pendingWindows.values()]) {
+      subscription.unsubscribe();
+    }
+  }
+}
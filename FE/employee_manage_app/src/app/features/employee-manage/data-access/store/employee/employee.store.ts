@@ -7,21 +7,26 @@ import {
   Injector,
   runInInjectionContext
 } from '@angular/core';
-import { forkJoin } from 'rxjs';
+import { forkJoin, Subscription } from 'rxjs';
 import { ToastrService } from 'ngx-toastr';
 import { EmployeeService } from '../../services/employee/employee.service';
 import { DepartmentService } from '../../services/department/department.service';
 import { DesignationService } from '../../services/designation/designation.service';
-import { Employee, CreateEmployeeRequest, UpdateEmployeeRequest, Department, Designation } from '../../models';
+import { Employee, EmployeeListItem, EmployeeExportFormat, EmployeePatch, CreateEmployeeRequest, UpdateEmployeeRequest, Department, Designation } from '../../models';
 import { AppError } from '@core/models/app-error.model';
+import { QueryCache } from '@core/cache/query-cache';
+import { BatchResult } from '@core/models/batch-result.model';
 import { mapToAppError } from '@core/utils/error.utils';
+import { saveBlob } from '@core/utils/download.utils';
+import { describeBatchFailures, succeededIds } from '@core/utils/batch.utils';
+import { QueryScopes } from '../query-scopes';
 
 /**
  * State Interface
  * Định nghĩa toàn bộ state liên quan đến Employee
  */
 interface EmployeeState {
-  employees: Employee[];
+  employees: EmployeeListItem[];
   loading: boolean;
   error: AppError | null;
   selectedEmployee: Employee | null;
@@ -56,7 +61,7 @@ export class EmployeeStore {
   // ============= INTERNAL STATE SIGNALS (PRIVATE) =============
 
   /** Danh sách nhân viên */
-  private employeesSignal: WritableSignal<Employee[]> = signal([]);
+  private employeesSignal: WritableSignal<EmployeeListItem[]> = signal([]);
 
   /** Loading state */
   private loadingSignal: WritableSignal<boolean> = signal(false);
@@ -88,6 +93,12 @@ export class EmployeeStore {
   /** Deleting state */
   private isDeletingSignal: WritableSignal<boolean> = signal(false);
 
+  /** Exporting state (không tính vào isLoading để bảng không bị spinner) */
+  private isExportingSignal: WritableSignal<boolean> = signal(false);
+
+  /** Request list đang chạy, bị hủy khi có lần load mới (tránh response cũ ghi đè response mới) */
+  private loadEmployeesSubscription?: Subscription;
+
   // ============= DERIVED/COMPUTED SIGNALS (PUBLIC READ-ONLY) =============
 
   /**
@@ -121,6 +132,11 @@ export class EmployeeStore {
    */
   readonly isDeleting = computed(() => this.isDeletingSignal());
 
+  /**
+   * Expose read-only exporting state
+   */
+  readonly isExporting = computed(() => this.isExportingSignal());
+
   /**
    * Expose read-only error
    */
@@ -187,6 +203,7 @@ export class EmployeeStore {
     private employeeService: EmployeeService,
     private departmentService: DepartmentService,
     private designationService: DesignationService,
+    private queryCache: QueryCache,
     private toastrService: ToastrService,
     private injector: Injector,
     private ngZone: NgZone
@@ -211,8 +228,9 @@ export class EmployeeStore {
     this.errorSignal.set(null);
 
     forkJoin({
-      departments: this.departmentService.getAllDepartments(),
-      designations: this.designationService.getAllDesignations()
+      // Endpoint lookup trả về toàn bộ, không bị cắt theo pageSize mặc định
+      departments: this.departmentService.getDepartmentLookup(),
+      designations: this.designationService.getDesignationLookup()
     }).subscribe({
       next: (result) => {
         // Success: update state
@@ -237,8 +255,9 @@ export class EmployeeStore {
    * Load danh sách nhân viên từ API
    *
    * Luồng xử lý:
-   * 1. Set loading = true
-   * 2. Call API qua EmployeeService
+   * 1. Hủy request list đang chạy (nếu có) - chỉ response của lần gọi cuối được ghi vào state
+   * 2. Set loading = true, call API qua QueryCache (key = filter/sort/page)
+   *    - trang đã xem gần đây: render ngay từ cache, nếu đã cũ thì revalidate ngầm rồi render lại
    * 3. Nếu success -> update employees signal
    * 4. Nếu error -> update error signal
    * 5. Set loading = false
@@ -256,20 +275,19 @@ export class EmployeeStore {
     pageNumber: number = 1,
     pageSize: number = 10
   ): void {
-    // Set loading state
+    this.loadEmployeesSubscription?.unsubscribe();
     this.loadingSignal.set(true);
     this.errorSignal.set(null);
 
-    // Gọi API (không subscribe ở đây, dùng effect hoặc subscription trong component)
-    // Nhưng để keep this simple, chúng ta có thể subscribe ở đây cho demo
-    this.employeeService
-      .getAllEmployees(filter, sortBy, sortOrder, pageNumber, pageSize)
+    const key = QueryCache.key(QueryScopes.employees, { filter, sortBy, sortOrder, pageNumber, pageSize });
+    this.loadEmployeesSubscription = this.queryCache
+      .query(key, () => this.employeeService.getAllEmployees(filter, sortBy, sortOrder, pageNumber, pageSize))
       .subscribe({
-        next: (response) => {
+        next: ({ data: response }) => {
           // Success: update state
           this.ngZone.run(() => {
-            this.employeesSignal.set(response.data || []);
-            this.totalCountSignal.set(response.data?.length || 0);
+            this.employeesSignal.set(response.data?.items || []);
+            this.totalCountSignal.set(response.data?.totalCount || 0);
             this.loadingSignal.set(false);
           });
         },
@@ -322,10 +340,10 @@ export class EmployeeStore {
 
     this.employeeService.createEmployee(payload).subscribe({
       next: (response) => {
-        // Thêm nhân viên mới vào danh sách
-        const currentEmployees = this.employeesSignal();
-        this.employeesSignal.set([...currentEmployees, response.data]);
-        this.totalCountSignal.set(currentEmployees.length + 1);
+        this.queryCache.invalidate(QueryScopes.employees);
+        // Danh sách được phân trang/sort phía server nên không chèn tay,
+        // màn list sẽ load lại trang hiện tại
+        this.totalCountSignal.set(this.totalCountSignal() + 1);
         this.isCreatingSignal.set(false);
 
         // Show success toast
@@ -359,10 +377,11 @@ export class EmployeeStore {
 
     this.employeeService.updateEmployee(employeeId, payload).subscribe({
       next: (response) => {
+        this.queryCache.invalidate(QueryScopes.employees);
         // Update nhân viên trong danh sách
         const currentEmployees = this.employeesSignal();
         const updatedEmployees = currentEmployees.map(emp =>
-          emp.employeeId === employeeId ? response.data : emp
+          emp.employeeId === employeeId ? this.toListItem(response.data, emp) : emp
         );
         this.employeesSignal.set(updatedEmployees);
 
@@ -396,18 +415,20 @@ export class EmployeeStore {
    * Xóa nhân viên
    *
    * @param employeeId ID của nhân viên cần xóa
+   * @param onSuccess Callback khi thành công (vd: tải lại danh sách cuộn)
    */
-  deleteEmployee(employeeId: number): void {
+  deleteEmployee(employeeId: number, onSuccess?: () => void): void {
     this.isDeletingSignal.set(true);
     this.errorSignal.set(null);
 
     this.employeeService.deleteEmployee(employeeId).subscribe({
       next: () => {
+        this.queryCache.invalidate(QueryScopes.employees);
         // Remove nhân viên khỏi danh sách
         const currentEmployees = this.employeesSignal();
         const filteredEmployees = currentEmployees.filter(emp => emp.employeeId !== employeeId);
         this.employeesSignal.set(filteredEmployees);
-        this.totalCountSignal.set(filteredEmployees.length);
+        this.totalCountSignal.set(Math.max(this.totalCountSignal() - 1, 0));
 
         // Nếu là selected employee, clear nó
         const selected = this.selectedEmployeeSignal();
@@ -419,6 +440,47 @@ export class EmployeeStore {
 
         // Show success toast
         this.toastrService.success('Nhân viên đã được xóa thành công!', 'Thành công');
+
+        // Execute callback
+        if (onSuccess) onSuccess();
+      },
+
+      error: (err) => {
+        const errorObj = mapToAppError(err, 'Không thể xóa nhân viên');
+        this.errorSignal.set(errorObj);
+        this.isDeletingSignal.set(false);
+
+        // Show error toast
+        this.toastrService.error(errorObj.message, 'Lỗi');
+      }
+    });
+  }
+
+  /**
+   * Xóa nhiều nhân viên trong một request
+   *
+   * @param employeeIds Danh sách ID cần xóa
+   * @param onDone Callback sau khi server trả kết quả (kể cả khi có id lỗi), vd: load lại trang
+   */
+  deleteEmployees(employeeIds: number[], onDone?: () => void): void {
+    this.isDeletingSignal.set(true);
+    this.errorSignal.set(null);
+
+    this.employeeService.deleteEmployees(employeeIds).subscribe({
+      next: (response) => {
+        this.queryCache.invalidate(QueryScopes.employees);
+        const deleted = succeededIds(response.data);
+        this.employeesSignal.set(this.employeesSignal().filter(emp => !deleted.has(emp.employeeId)));
+        this.totalCountSignal.set(Math.max(this.totalCountSignal() - deleted.size, 0));
+
+        const selected = this.selectedEmployeeSignal();
+        if (selected && deleted.has(selected.employeeId)) {
+          this.selectedEmployeeSignal.set(null);
+        }
+
+        this.isDeletingSignal.set(false);
+        this.toastBatchResult(response.data, `Đã xóa ${deleted.size} nhân viên`);
+        if (onDone) onDone();
       },
 
       error: (err) => {
@@ -432,6 +494,126 @@ export class EmployeeStore {
     });
   }
 
+  /**
+   * Cập nhật cùng một patch cho nhiều nhân viên (vd: đổi chức vụ hàng loạt)
+   *
+   * @param employeeIds Danh sách ID cần cập nhật
+   * @param patch Các field cần đổi
+   * @param onDone Callback sau khi server trả kết quả
+   */
+  updateEmployees(employeeIds: number[], patch: EmployeePatch, onDone?: () => void): void {
+    this.isUpdatingSignal.set(true);
+    this.errorSignal.set(null);
+
+    this.employeeService.updateEmployees(employeeIds, patch).subscribe({
+      next: (response) => {
+        this.queryCache.invalidate(QueryScopes.employees);
+        const updated = succeededIds(response.data);
+        this.employeesSignal.set(this.employeesSignal().map(emp =>
+          updated.has(emp.employeeId) ? this.applyPatch(emp, patch) : emp
+        ));
+
+        this.isUpdatingSignal.set(false);
+        this.toastBatchResult(response.data, `Đã cập nhật ${updated.size} nhân viên`);
+        if (onDone) onDone();
+      },
+
+      error: (err) => {
+        const errorObj = mapToAppError(err, 'Không thể cập nhật nhân viên');
+        this.errorSignal.set(errorObj);
+        this.isUpdatingSignal.set(false);
+
+        // Show error toast
+        this.toastrService.error(errorObj.message, 'Lỗi');
+      }
+    });
+  }
+
+  /**
+   * Xuất danh sách nhân viên ra file và tải về
+   *
+   * @param format 'csv' hoặc 'ndjson'
+   * @param filter Điều kiện tìm kiếm hiện tại của danh sách
+   */
+  exportEmployees(format: EmployeeExportFormat, filter?: string): void {
+    this.isExportingSignal.set(true);
+
+    this.employeeService.exportEmployees(format, filter).subscribe({
+      next: (blob) => {
+        const stamp = new Date().toISOString().slice(0, 10).replace(/-/g, '');
+        saveBlob(blob, `employees-${stamp}.${format}`);
+        this.isExportingSignal.set(false);
+      },
+
+      error: (err) => {
+        const errorObj = mapToAppError(err, 'Không thể xuất danh sách nhân viên');
+        this.isExportingSignal.set(false);
+
+        // Show error toast
+        this.toastrService.error(errorObj.message, 'Lỗi');
+      }
+    });
+  }
+
+  private toastBatchResult(result: BatchResult, title: string): void {
+    if (result.failed === 0) {
+      this.toastrService.success(`${title}!`, 'Thành công');
+    } else {
+      this.toastrService.warning(describeBatchFailures(result), title);
+    }
+  }
+
+  /**
+   * Áp patch hàng loạt lên một dòng list
+   * Đổi chức vụ: tên chức vụ/phòng ban để trống, facade load lại trang để lấy tên đã join từ server
+   */
+  private applyPatch(current: EmployeeListItem, patch: EmployeePatch): EmployeeListItem {
+    const row: EmployeeListItem = {
+      ...current,
+      city: patch.city ?? current.city,
+      state: patch.state ?? current.state
+    };
+    if (patch.designationId === undefined || patch.designationId === current.designationId) {
+      return row;
+    }
+
+    return {
+      ...row,
+      designationId: patch.designationId,
+      designationName: '',
+      departmentName: ''
+    };
+  }
+
+  /**
+   * Cập nhật một dòng list từ Employee đầy đủ mà API PUT trả về
+   * Đổi chức vụ: lấy tên từ master data nếu đã load, nếu không để trống đến lần load list sau
+   */
+  private toListItem(employee: Employee, current: EmployeeListItem): EmployeeListItem {
+    const row: EmployeeListItem = {
+      ...current,
+      name: employee.name,
+      email: employee.email,
+      contactNo: employee.contactNo,
+      city: employee.city,
+      state: employee.state,
+      pincode: employee.pincode
+    };
+    if (employee.designationId === current.designationId) {
+      return row;
+    }
+
+    const designation = this.designationsSignal().find(d => d.designationId === employee.designationId);
+    const department = this.departmentsSignal().find(d => d.departmentId === designation?.departmentId);
+    return {
+      ...row,
+      designationId: employee.designationId,
+      designationName: designation?.designationName ?? '',
+      departmentId: designation?.departmentId ?? 0,
+      departmentName: department?.departmentName ?? ''
+    };
+  }
+
   /**
    * Clear error message
    * Hữu ích để clear toast/snackbar error sau một thời gian
@@ -445,6 +627,7 @@ export class EmployeeStore {
    * Dùng khi logout hoặc switch user
    */
   resetState(): void {
+    this.loadEmployeesSubscription?.unsubscribe();
     this.employeesSignal.set([]);
     this.loadingSignal.set(false);
     this.errorSignal.set(null);
@@ -0,0 +1,9 @@
+/**
+ * Scope của QueryCache cho từng nhóm API (= tên controller backend)
+ * Dùng làm prefix của key khi load và để invalidate sau khi ghi dữ liệu
+ */
+export const QueryScopes = {
+    employees: 'EmployeeMaster',
+    departments: 'DepartmentMaster',
+    designations: 'DesignationMaster'
+} as const;
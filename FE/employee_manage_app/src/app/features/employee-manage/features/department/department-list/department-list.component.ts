@@ -40,6 +40,10 @@ export class DepartmentListComponent implements OnInit {
         this.facade.loadDepartments();
     }
 
+    onPageChange(event: { pageIndex: number; pageSize: number }): void {
+        this.facade.loadDepartments(event.pageIndex, event.pageSize);
+    }
+
     onEdit(id: number): void {
         this.router.navigate(['/employee-manage/departments', id, 'edit']);
     }
@@ -37,8 +37,12 @@ export class DesignationListComponent implements OnInit {
     router = inject(Router);
 
     ngOnInit(): void {
+        // Rows already carry the department name, no department list needed here
         this.facade.loadDesignations();
-        this.facade.loadMasterData();
+    }
+
+    onPageChange(event: { pageIndex: number; pageSize: number }): void {
+        this.facade.loadDesignations(event.pageIndex, event.pageSize);
     }
 
     onEdit(id: number): void {
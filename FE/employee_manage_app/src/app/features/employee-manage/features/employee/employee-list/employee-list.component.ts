@@ -1,18 +1,22 @@
 import { CommonModule } from '@angular/common';
-import { ChangeDetectionStrategy, Component, OnInit, inject } from '@angular/core';
+import { ChangeDetectionStrategy, Component, OnInit, inject, signal } from '@angular/core';
 import { Router, RouterLink } from '@angular/router';
-import { Employee } from '@features/employee-manage/data-access/models';
 import { EmployeeFacade } from '@features/employee-manage/data-access/facades/employee.facade';
 import { NzAlertModule } from 'ng-zorro-antd/alert';
 import { NzButtonModule } from 'ng-zorro-antd/button';
 import { NzCardModule } from 'ng-zorro-antd/card';
 import { NzDividerModule } from 'ng-zorro-antd/divider';
+import { NzDropDownModule } from 'ng-zorro-antd/dropdown';
 import { NzEmptyModule } from 'ng-zorro-antd/empty';
 import { NzIconModule } from 'ng-zorro-antd/icon';
+import { NzInputModule } from 'ng-zorro-antd/input';
 import { NzSpinModule } from 'ng-zorro-antd/spin';
 import { NzTagModule } from 'ng-zorro-antd/tag';
+import { NzTooltipModule } from 'ng-zorro-antd/tooltip';
 import Swal from 'sweetalert2';
 import { EmployeeTableComponent } from '../../../ui/employee/employee-table/employee-table.component';
+import { EmployeeVirtualTableComponent } from '../../../ui/employee/employee-virtual-table/employee-virtual-table.component';
+import { EmployeeListViewMode } from '@features/employee-manage/data-access/facades/employee.facade';
 
 /**
  * EmployeeListComponent
@@ -24,7 +28,11 @@ import { EmployeeTableComponent } from '../../../ui/employee/employee-table/empl
  * - Hiển thị error message
  * - Action buttons (Edit, Delete)
  * - Responsive design (Bootstrap 5)
- * - Display designation name instead of ID
+ * - Display designation name (joined by the API)
+ * - Chọn nhiều dòng và xóa trong một request (delete-many)
+ * - Xuất CSV/NDJSON toàn bộ danh sách (theo từ khóa tìm kiếm hiện tại)
+ * - Ô tìm kiếm theo tên (debounce trong EmployeeFacade)
+ * - Chế độ cuộn ảo cho danh sách lớn: chỉ render dòng đang thấy, tải thêm khi cuộn, sort phía server
  *
  * Change Detection: OnPush (performance optimization)
  */
@@ -40,9 +48,13 @@ import { EmployeeTableComponent } from '../../../ui/employee/employee-table/empl
     NzCardModule,
     NzAlertModule,
     NzDividerModule,
+    NzDropDownModule,
     NzSpinModule,
     NzEmptyModule,
-    EmployeeTableComponent
+    NzInputModule,
+    NzTooltipModule,
+    EmployeeTableComponent,
+    EmployeeVirtualTableComponent
   ],
   changeDetection: ChangeDetectionStrategy.OnPush,
   templateUrl: './employee-list.component.html',
@@ -52,10 +64,17 @@ export class EmployeeListComponent implements OnInit {
   facade = inject(EmployeeFacade);
   router = inject(Router);
 
+  /** ID các dòng đang được chọn (giữ qua các trang, xóa khi đổi pageSize) */
+  readonly selectedIds = signal<number[]>([]);
+
   ngOnInit(): void {
-    // Facade orchestrates loading employees and master data
-    this.facade.loadEmployees(1, 10);
-    this.facade.loadMasterData();
+    // Rows already carry designation/department names, no master data needed here
+    this.facade.loadList();
+  }
+
+  onViewModeChange(mode: EmployeeListViewMode): void {
+    this.selectedIds.set([]);
+    this.facade.setViewMode(mode);
   }
 
   onEdit(id: number): void {
@@ -66,6 +85,39 @@ export class EmployeeListComponent implements OnInit {
     this.onDeleteEmployee(event.id, event.name);
   }
 
+  onSearch(event: Event): void {
+    this.facade.search((event.target as HTMLInputElement).value);
+  }
+
+  onPageChange(event: { pageIndex: number; pageSize: number }): void {
+    if (event.pageSize !== this.facade.listViewModel().pageSize) {
+      this.selectedIds.set([]);
+    }
+    this.facade.loadEmployees(event.pageIndex, event.pageSize);
+  }
+
+  /**
+   * Xóa các nhân viên đã chọn trong một request (với SweetAlert2 confirmation)
+   */
+  onDeleteSelected(): void {
+    const ids = this.selectedIds();
+    Swal.fire({
+      title: `Xóa ${ids.length} nhân viên?`,
+      text: 'Hành động này không thể hoàn tác.',
+      icon: 'warning',
+      showCancelButton: true,
+      confirmButtonColor: '#dc3545',
+      cancelButtonColor: '#6c757d',
+      confirmButtonText: 'Có, xóa',
+      cancelButtonText: 'Hủy',
+      reverseButtons: true
+    }).then((result: any) => {
+      if (result.isConfirmed) {
+        this.facade.deleteEmployees(ids, () => this.selectedIds.set([]));
+      }
+    });
+  }
+
   /**
    * Xóa nhân viên (với SweetAlert2 confirmation)
    * @param employeeId ID của nhân viên cần xóa
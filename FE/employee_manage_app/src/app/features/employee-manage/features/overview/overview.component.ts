@@ -1,4 +1,4 @@
-import { Component, inject, OnInit } from '@angular/core';
+import { Component, inject, OnInit, signal } from '@angular/core';
 import { CommonModule } from '@angular/common';
 import { NzGridModule } from 'ng-zorro-antd/grid';
 import { NzCardModule } from 'ng-zorro-antd/card';
@@ -8,6 +8,7 @@ import { NzButtonModule } from 'ng-zorro-antd/button';
 import { RouterLink } from '@angular/router';
 import { AuthService } from '@core/auth/services/auth.service';
 import { OverviewService } from '../../data-access/services/overview.service';
+import { DashboardStats } from '../../data-access/models';
 
 @Component({
     selector: 'app-employee-overview',
@@ -22,11 +23,9 @@ export class OverviewComponent implements OnInit {
 
     user = this.authService.currentUser;
 
-    employeeCount = 0;
-    departmentCount = 0;
+    stats = signal<DashboardStats | null>(null);
 
     ngOnInit() {
-        this.overviewService.getEmployeeCount().subscribe(count => this.employeeCount = count);
-        this.overviewService.getDepartmentCount().subscribe(count => this.departmentCount = count);
+        this.overviewService.getStats().subscribe(stats => this.stats.set(stats));
     }
 }
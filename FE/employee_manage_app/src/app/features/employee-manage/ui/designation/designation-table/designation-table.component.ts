@@ -35,9 +35,13 @@ export class DesignationTableComponent {
     @Input() designations: DesignationViewModel[] = [];
     @Input() departments: Department[] = [];
     @Input() isLoading = false;
+    @Input() totalCount = 0;
+    @Input() pageIndex = 1;
+    @Input() pageSize = 10;
 
     @Output() delete = new EventEmitter<{ id: number; name: string }>();
     @Output() edit = new EventEmitter<number>();
+    @Output() pageChange = new EventEmitter<{ pageIndex: number; pageSize: number }>();
 
     onDelete(id: number, name: string): void {
         this.delete.emit({ id, name });
@@ -46,4 +50,13 @@ export class DesignationTableComponent {
     onEdit(id: number): void {
         this.edit.emit(id);
     }
+
+    onPageIndexChange(pageIndex: number): void {
+        this.pageChange.emit({ pageIndex, pageSize: this.pageSize });
+    }
+
+    onPageSizeChange(pageSize: number): void {
+        // Server-side paging: back to the first page when the page size changes
+        this.pageChange.emit({ pageIndex: 1, pageSize });
+    }
 }
@@ -1,6 +1,6 @@
 import { Component, Input, Output, EventEmitter, ChangeDetectionStrategy } from '@angular/core';
 import { CommonModule } from '@angular/common';
-import { Employee, Designation, EmployeeViewModel } from '@features/employee-manage/data-access/models';
+import { EmployeeListItem } from '@features/employee-manage/data-access/models';
 import { NzTableModule } from 'ng-zorro-antd/table';
 import { NzTagModule } from 'ng-zorro-antd/tag';
 import { NzButtonModule } from 'ng-zorro-antd/button';
@@ -36,13 +36,42 @@ import { HasRoleDirective } from '@shared/directives/has-role.directive';
   `]
 })
 export class EmployeeTableComponent {
-    @Input() employees: EmployeeViewModel[] = [];
+    @Input() employees: EmployeeListItem[] = [];
     @Input() isLoading = false;
     @Input() totalCount = 0;
-    @Input() designations: Designation[] = [];
+    @Input() pageIndex = 1;
+    @Input() pageSize = 10;
+    @Input() selectedIds: number[] = [];
 
     @Output() delete = new EventEmitter<{ id: number; name: string }>();
     @Output() edit = new EventEmitter<number>();
+    @Output() pageChange = new EventEmitter<{ pageIndex: number; pageSize: number }>();
+    @Output() selectionChange = new EventEmitter<number[]>();
+
+    get allChecked(): boolean {
+        return this.employees.length > 0 && this.employees.every(e => this.selectedIds.includes(e.employeeId));
+    }
+
+    get indeterminate(): boolean {
+        return !this.allChecked && this.employees.some(e => this.selectedIds.includes(e.employeeId));
+    }
+
+    isSelected(id: number): boolean {
+        return this.selectedIds.includes(id);
+    }
+
+    onItemChecked(id: number, checked: boolean): void {
+        this.selectionChange.emit(checked
+            ? [...this.selectedIds, id]
+            : this.selectedIds.filter(selected => selected !== id));
+    }
+
+    onAllChecked(checked: boolean): void {
+        const pageIds = this.employees.map(e => e.employeeId);
+        this.selectionChange.emit(checked
+            ? [...new Set([...this.selectedIds, ...pageIds])]
+            : this.selectedIds.filter(selected => !pageIds.includes(selected)));
+    }
 
     onDelete(id: number, name: string): void {
         this.delete.emit({ id, name });
@@ -51,4 +80,13 @@ export class EmployeeTableComponent {
     onEdit(id: number): void {
         this.edit.emit(id);
     }
+
+    onPageIndexChange(pageIndex: number): void {
+        this.pageChange.emit({ pageIndex, pageSize: this.pageSize });
+    }
+
+    onPageSizeChange(pageSize: number): void {
+        // Server-side paging: back to the first page when the page size changes
+        this.pageChange.emit({ pageIndex: 1, pageSize });
+    }
 }
@@ -0,0 +1,140 @@
+import {
+    AfterViewInit,
+    ChangeDetectionStrategy,
+    Component,
+    DestroyRef,
+    EventEmitter,
+    Input,
+    OnChanges,
+    Output,
+    SimpleChanges,
+    ViewChild,
+    inject
+} from '@angular/core';
+import { CommonModule } from '@angular/common';
+import { takeUntilDestroyed } from '@angular/core/rxjs-interop';
+import { EmployeeListItem } from '@features/employee-manage/data-access/models';
+import { EmployeeScrollQuery, RowRange } from '@features/employee-manage/data-access/store/employee/employee-scroll.store';
+import { NzTableComponent, NzTableModule, NzTableSortOrder } from 'ng-zorro-antd/table';
+import { NzTagModule } from 'ng-zorro-antd/tag';
+import { NzButtonModule } from 'ng-zorro-antd/button';
+import { NzIconModule } from 'ng-zorro-antd/icon';
+import { NzSpaceModule } from 'ng-zorro-antd/space';
+import { NzTooltipModule } from 'ng-zorro-antd/tooltip';
+import { HasRoleDirective } from '@shared/directives/has-role.directive';
+
+/**
+ * EmployeeVirtualTableComponent
+ * Bảng cuộn ảo: chỉ render các dòng đang nhìn thấy (cdk virtual scroll của nz-table)
+ * nz-table chỉ nhận một mảng rỗng độ dài totalCount (tạo lại khi totalCount đổi) để tính chiều cao;
+ * nội dung mỗi dòng lấy qua rowAt(index), dòng chưa tải là undefined -> hiện placeholder
+ * Vùng render được báo lên qua (rangeChange)
+ * Sort phía server qua (sortChange)
+ */
+@Component({
+    selector: 'app-employee-virtual-table',
+    standalone: true,
+    imports: [
+        CommonModule,
+        NzTableModule,
+        NzTagModule,
+        NzButtonModule,
+        NzIconModule,
+        NzSpaceModule,
+        NzTooltipModule,
+        HasRoleDirective
+    ],
+    changeDetection: ChangeDetectionStrategy.OnPush,
+    templateUrl: './employee-virtual-table.component.html',
+    styles: [`
+    :host {
+      display: block;
+    }
+    .fw-semibold {
+        font-weight: 600;
+    }
+    .row-placeholder {
+        display: inline-block;
+        width: 60%;
+        height: 0.75rem;
+        border-radius: 0.25rem;
+        background: #f0f0f0;
+    }
+  `]
+})
+export class EmployeeVirtualTableComponent implements AfterViewInit, OnChanges {
+    /** Chiều cao mỗi dòng (px), phải khớp với CSS của nz-table size mặc định */
+    readonly rowHeight = 54;
+
+    @Input() rowAt: (index: number) => EmployeeListItem | undefined = () => undefined;
+    @Input() totalCount = 0;
+    @Input() isLoading = false;
+    @Input() query: EmployeeScrollQuery = { filter: '', sortBy: 'name', sortOrder: 'asc' };
+    @Input() selectedIds: number[] = [];
+    @Input() height = '600px';
+
+    @Output() delete = new EventEmitter<{ id: number; name: string }>();
+    @Output() edit = new EventEmitter<number>();
+    @Output() rangeChange = new EventEmitter<RowRange>();
+    @Output() sortChange = new EventEmitter<Pick<EmployeeScrollQuery, 'sortBy' | 'sortOrder'>>();
+    @Output() selectionChange = new EventEmitter<number[]>();
+
+    @ViewChild('virtualTable', { static: true }) virtualTable!: NzTableComponent<undefined>;
+
+    /** nzData: mảng rỗng (không có phần tử) độ dài totalCount, chỉ để virtual scroll biết số dòng */
+    slots: undefined[] = [];
+
+    private readonly destroyRef = inject(DestroyRef);
+
+    ngAfterViewInit(): void {
+        this.virtualTable.cdkVirtualScrollViewport?.renderedRangeStream
+            .pipe(takeUntilDestroyed(this.destroyRef))
+            .subscribe(range => this.rangeChange.emit(range));
+    }
+
+    ngOnChanges(changes: SimpleChanges): void {
+        if (changes['totalCount']) {
+            this.slots = new Array(this.totalCount);
+        }
+
+        // Filter/sort mới -> về đầu danh sách
+        const query = changes['query'];
+        if (query && !query.firstChange) {
+            this.virtualTable.cdkVirtualScrollViewport?.scrollToIndex(0);
+        }
+    }
+
+    trackByIndex(index: number): number {
+        return index;
+    }
+
+    sortOrderFor(column: string): NzTableSortOrder {
+        if (this.query.sortBy !== column) return null;
+        return this.query.sortOrder === 'desc' ? 'descend' : 'ascend';
+    }
+
+    onSortOrderChange(column: string, order: NzTableSortOrder): void {
+        // Bỏ sort -> về mặc định (tên A-Z)
+        this.sortChange.emit(order
+            ? { sortBy: column, sortOrder: order === 'descend' ? 'desc' : 'asc' }
+            : { sortBy: 'name', sortOrder: 'asc' });
+    }
+
+    isSelected(id: number): boolean {
+        return this.selectedIds.includes(id);
+    }
+
+    onItemChecked(id: number, checked: boolean): void {
+        this.selectionChange.emit(checked
+            ? [...this.selectedIds, id]
+            : this.selectedIds.filter(selected => selected !== id));
+    }
+
+    onDelete(id: number, name: string): void {
+        this.delete.emit({ id, name });
+    }
+
+    onEdit(id: number): void {
+        this.edit.emit(id);
+    }
+}
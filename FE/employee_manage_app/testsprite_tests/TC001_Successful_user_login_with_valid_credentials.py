@@ -1,33 +1,12 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from support.browser_pool import open_session
+from support.waits import wait_actionable, wait_for_page_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
+async def run_test(pool=None):
+    # Open an isolated browser context (pooled when started by run_suite.py)
+    async with open_session(pool) as (context, page):
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:4200", wait_until="commit", timeout=10000)
@@ -54,62 +33,62 @@ async def run_test():
         frame = context.pages[-1]
         # Enter valid registered email address
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
+        await wait_actionable(elem); await elem.fill('admin@gmail.com')
         
 
         frame = context.pages[-1]
         # Enter correct password
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
+        await wait_actionable(elem); await elem.fill('11111111')
         
 
         frame = context.pages[-1]
         # Click the login button
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Input valid email and password, then click login button to trigger network requests for JWT token capture.
         frame = context.pages[-1]
         # Enter valid registered email address
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
+        await wait_actionable(elem); await elem.fill('admin@gmail.com')
         
 
         frame = context.pages[-1]
         # Enter correct password
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
+        await wait_actionable(elem); await elem.fill('11111111')
         
 
         frame = context.pages[-1]
         # Click the login button
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Reload the login page to attempt to restore input fields and login button.
         await page.goto('http://localhost:4200/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_for_page_ready(page)
         
 
         # -> Input valid email and password, then click the login button to attempt login and verify JWT token issuance.
         frame = context.pages[-1]
         # Enter valid registered email address
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
+        await wait_actionable(elem); await elem.fill('admin@gmail.com')
         
 
         frame = context.pages[-1]
         # Enter correct password
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
+        await wait_actionable(elem); await elem.fill('11111111')
         
 
         frame = context.pages[-1]
         # Click the login button
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -126,15 +105,6 @@ async def run_test():
         await expect(frame.locator('text=New Module').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Coming soon...').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=© 2026 Employee Management System. All rights reserved.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
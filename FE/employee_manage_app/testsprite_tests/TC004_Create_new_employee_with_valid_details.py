@@ -1,33 +1,12 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from support.browser_pool import open_session
+from support.waits import wait_actionable, wait_for_page_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
+async def run_test(pool=None):
+    # Open an isolated, pre-authenticated browser context (pooled when started by run_suite.py)
+    async with open_session(pool, authenticated=True) as (context, page):
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:4200", wait_until="commit", timeout=10000)
@@ -50,37 +29,21 @@ async def run_test():
         await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
         
 
-        # -> Input admin email and password, then click login button.
-        frame = context.pages[-1]
-        # Input admin email
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
-        
+        # -> Session starts pre-authenticated as admin (storage state from support/auth_state.py).
 
-        frame = context.pages[-1]
-        # Input admin password
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
-        
-
-        frame = context.pages[-1]
-        # Click login button
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
         # -> Click on Employee Management module to proceed to employee management section.
         frame = context.pages[-1]
         # Click on Employee Management module card
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-core-dashboard/div/div/div/nz-card').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click 'Add Employee' button to open the employee creation form.
         frame = context.pages[-1]
         # Click 'Add Employee' button to open employee creation form
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-overview/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -89,15 +52,6 @@ async def run_test():
             await expect(frame.locator('text=Employee Creation Failed: Invalid Details').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: The employee creation process did not complete successfully as per the test plan requiring valid unique email, phone number, and pincode.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,33 +1,12 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from support.browser_pool import open_session
+from support.waits import wait_actionable, wait_for_page_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
+async def run_test(pool=None):
+    # Open an isolated, pre-authenticated browser context (pooled when started by run_suite.py)
+    async with open_session(pool, authenticated=True) as (context, page):
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:4200", wait_until="commit", timeout=10000)
@@ -46,51 +25,35 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input login credentials and click login button to access the application.
-        frame = context.pages[-1]
-        # Input email address for login
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
-        
+        # -> Session starts pre-authenticated as admin (storage state from support/auth_state.py).
 
-        frame = context.pages[-1]
-        # Input password for login
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
-        
-
-        frame = context.pages[-1]
-        # Click login button to submit credentials
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
         # -> Click on 'Employee Management' module to proceed to employee list or creation form.
         frame = context.pages[-1]
         # Click on Employee Management module card
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-core-dashboard/div/div/div/nz-card').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click on 'Add Employee' button to open employee creation form.
         frame = context.pages[-1]
         # Click on Add Employee button to open employee creation form
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-overview/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Enter invalid phone number formats (letters, incomplete number) into the phone input field and check for validation errors.
         frame = context.pages[-1]
         # Enter invalid phone number with letters and incomplete digits
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-edit/app-employee-form/div/div/div/nz-card/div/form/div[2]/div/nz-form-item/nz-form-control/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abcde123')
+        await wait_actionable(elem); await elem.fill('abcde123')
         
 
         # -> Enter invalid pincode formats (non-numeric, wrong length) into the pincode input field and check for validation errors.
         frame = context.pages[-1]
         # Enter invalid pincode with non-numeric characters and wrong length
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-edit/app-employee-form/div/div/div/nz-card/div/form/div[4]/div[3]/nz-form-item/nz-form-control/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('12ab')
+        await wait_actionable(elem); await elem.fill('12ab')
         
 
         # --> Assertions to verify final state
@@ -99,15 +62,6 @@ async def run_test():
         await expect(frame.locator('text=Phone').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Pincode').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Create').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,33 +1,12 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from support.browser_pool import open_session
+from support.waits import wait_actionable, wait_for_page_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
+async def run_test(pool=None):
+    # Open an isolated, pre-authenticated browser context (pooled when started by run_suite.py)
+    async with open_session(pool, authenticated=True) as (context, page):
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:4200", wait_until="commit", timeout=10000)
@@ -46,51 +25,35 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input email and password, then click login button to access employee list.
-        frame = context.pages[-1]
-        # Input the email address
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
-        
+        # -> Session starts pre-authenticated as admin (storage state from support/auth_state.py).
 
-        frame = context.pages[-1]
-        # Input the password
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
-        
-
-        frame = context.pages[-1]
-        # Click the login button
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
         # -> Navigate to Employee List by clicking the Employee List link.
         frame = context.pages[-1]
         # Click the Employee List link to navigate to the employee list page
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li[2]/div[2]/ul/li[2]/span/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click the delete button for the first employee to trigger the confirmation dialog.
         frame = context.pages[-1]
         # Click the delete button for the first employee (admin345) to trigger confirmation dialog
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-list/div/nz-card/div/app-employee-table/nz-table/nz-spin/div/div/nz-table-inner-default/div/table/tbody/tr/td[5]/nz-space/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click the delete button for the second employee to check if confirmation dialog appears.
         frame = context.pages[-1]
         # Click the delete button for the second employee (admin345) to check for confirmation dialog
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-list/div/nz-card/div/app-employee-table/nz-table/nz-spin/div/div/nz-table-inner-default/div/table/tbody/tr[2]/td[5]/nz-space/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Confirm the deletion by clicking the 'Có, xóa' button to delete the employee.
         frame = context.pages[-1]
         # Click the 'Có, xóa' button to confirm deletion of employee 'admin345'
         elem = frame.locator('xpath=html/body/div[2]/div/div[6]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -98,15 +61,6 @@ async def run_test():
         await expect(frame.locator('text=Bạn có chắc chắn muốn xóa nhân viên này?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=admin').first).not_to_be_visible(timeout=30000)
         await expect(frame.locator('text=admin').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
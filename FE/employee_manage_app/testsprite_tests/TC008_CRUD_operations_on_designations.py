@@ -1,33 +1,12 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from support.browser_pool import open_session
+from support.waits import expect_api, wait_actionable, wait_for_page_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
+async def run_test(pool=None):
+    # Open an isolated, pre-authenticated browser context (pooled when started by run_suite.py)
+    async with open_session(pool, authenticated=True) as (context, page):
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:4200", wait_until="commit", timeout=10000)
@@ -50,98 +29,84 @@ async def run_test():
         await page.mouse.wheel(0, 300)
         
 
-        # -> Input admin email and password, then click login button.
-        frame = context.pages[-1]
-        # Input admin email
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input admin password
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
-        
+        # -> Session starts pre-authenticated as admin (storage state from support/auth_state.py).
 
-        frame = context.pages[-1]
-        # Click login button
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
         # -> Click on the 'Designations' link in the sidebar to navigate to designation management.
         frame = context.pages[-1]
         # Click on Designations link in sidebar
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li[2]/div[2]/ul/li[4]/span/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem)
+        async with expect_api(page, '/api/DesignationMaster'):
+            await elem.click(timeout=5000)
         
 
         # -> Retry clicking the 'Thêm Mới' link with index 11 to open the create designation form.
         frame = context.pages[-1]
         # Retry click on 'Thêm Mới' link to open create designation form
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-designation-list/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Input a valid designation name and select a department from the dropdown, then submit the form.
         frame = context.pages[-1]
         # Input valid designation name
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-designation-edit/app-designation-form/div/div/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Senior Developer')
+        await wait_actionable(elem); await elem.fill('Senior Developer')
         
 
         frame = context.pages[-1]
         # Click department dropdown to open options
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-designation-edit/app-designation-form/div/div/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-select').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Select 'Software' department from the dropdown and submit the form to create the designation.
         frame = context.pages[-1]
         # Select 'Software' department from dropdown
         elem = frame.locator('xpath=html/body/div/div/div/nz-option-container/div/cdk-virtual-scroll-viewport/div/nz-option-item[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Retry clicking the 'Thêm Mới' submit button with index 16 to submit the form.
         frame = context.pages[-1]
         # Retry click on 'Thêm Mới' submit button to submit the form
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-designation-edit/app-designation-form/div/div/div/nz-card/div/form/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Input a valid designation name into the 'Tên Chức Danh' field and then click the 'Thêm Mới' submit button.
         frame = context.pages[-1]
         # Input valid designation name 'Senior Developer'
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-designation-edit/app-designation-form/div/div/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Senior Developer')
+        await wait_actionable(elem); await elem.fill('Senior Developer')
         
 
         frame = context.pages[-1]
         # Click 'Thêm Mới' submit button to submit the form
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-designation-edit/app-designation-form/div/div/div/nz-card/div/form/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click the department dropdown to open options and select a valid department.
         frame = context.pages[-1]
         # Click department dropdown to open options
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-designation-edit/app-designation-form/div/div/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-select').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Try clicking the department dropdown input at index 14 to open options and then select a department option if it appears.
         frame = context.pages[-1]
         # Click department dropdown input to open options
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-designation-edit/app-designation-form/div/div/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-select/nz-select-top-control/span/nz-select-search/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click the 'Software' department option with index 17 to select it.
         frame = context.pages[-1]
         # Select 'Software' department from dropdown options
         elem = frame.locator('xpath=html/body/div/div/div/nz-option-container/div/cdk-virtual-scroll-viewport/div/nz-option-item[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -150,15 +115,6 @@ async def run_test():
             await expect(frame.locator('text=Designation Creation Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution for creating, reading, updating, and deleting designations did not complete successfully. Expected confirmation message 'Designation Creation Successful' was not found on the page.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,163 +1,36 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:4200", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Input login credentials and click login button to proceed.
-        frame = context.pages[-1]
-        # Input email address
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
-        
-
-        frame = context.pages[-1]
-        # Click login button
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Switch to tablet viewport and verify UI layout and load time.
-        await page.goto('http://localhost:4200/dashboard', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        frame = context.pages[-1]
-        # Click Employee Management card to check interaction on desktop before switching viewport
-        elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-core-dashboard/div/div/div/nz-card').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Switch to tablet viewport and verify UI layout and load time.
-        await page.goto('http://localhost:4200/employee-manage/overview', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Switch to tablet viewport and verify UI layout and load time.
-        await page.goto('http://localhost:4200/employee-manage/overview', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Switch viewport to tablet size and reload the Employee Management overview page to verify UI layout and load time.
-        await page.goto('http://localhost:4200/employee-manage/overview', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Switch viewport to tablet size and reload the Employee Management overview page to verify UI layout and load time.
-        frame = context.pages[-1]
-        # Open viewport settings or menu to switch to tablet viewport
-        elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Switch viewport to tablet size and reload the Employee Management overview page to verify UI layout and load time.
-        await page.goto('http://localhost:4200/employee-manage/overview', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Switch viewport to tablet size and reload the Employee Management overview page to verify UI layout and load time.
-        frame = context.pages[-1]
-        # Open viewport settings or menu to switch to tablet viewport
-        elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Switch viewport to tablet size and reload the Employee Management overview page to verify UI layout and load time.
-        frame = context.pages[-1]
-        # Click Employee Management card to open overview page on tablet viewport
-        elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-core-dashboard/div/div/div/nz-card').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Switch viewport to tablet size and reload the Employee Management overview page to verify UI layout and load time.
-        frame = context.pages[-1]
-        # Open viewport settings or menu to switch to tablet viewport
-        elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Manually switch viewport to tablet size using browser commands or settings, then reload the Employee Management overview page to verify UI layout and load time on tablet viewport.
-        await page.goto('http://localhost:4200/employee-manage/overview', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Switch viewport to tablet size and reload the Employee Management overview page to verify UI layout and load time.
-        frame = context.pages[-1]
-        # Open viewport settings or menu to switch to tablet viewport
-        elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Switch viewport to tablet size and reload the Employee Management overview page to verify UI layout and load time.
-        frame = context.pages[-1]
-        # Open viewport settings or menu to switch to tablet viewport
-        elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=UI Components Rendered Successfully').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError('Test plan execution failed: UI components did not render properly or load times exceeded 2 seconds on desktop, tablet, or mobile devices.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+from support.browser_pool import open_session
+from support import perf
+
+async def run_test(pool=None):
+    results = []
+
+    # Measure every route on each device profile in its own pre-authenticated context
+    for device, profile in perf.DEVICE_PROFILES.items():
+        budgets = perf.load_budgets(device)
+        async with open_session(pool, authenticated=True, **profile) as (context, page):
+            for route_name, route in perf.ROUTES.items():
+                metrics = await perf.measure_route(context, route)
+                results.append({"device": device, "route": route_name, "metrics": metrics, "budgets": budgets})
+
+            # The layout must still render the main shell at this viewport
+            await page.goto(f"{perf.APP_URL}{perf.ROUTES['overview']}", timeout=10000)
+            await expect(page.locator('app-main-layout').first).to_be_visible(timeout=10000)
+            await expect(page.locator('app-employee-overview').first).to_be_visible(timeout=10000)
+
+    report = perf.format_report(results)
+    print(report)
+    perf.write_report(results)
+
+    # --> Assertions to verify final state
+    failures = [
+        f"{r['device']}/{r['route']}: {metric}={'n/a' if value is None else round(value)}ms (budget {budget}ms)"
+        for r in results
+        for metric, value, budget in perf.check_budgets(r["metrics"], r["budgets"])
+    ]
+    if failures:
+        raise AssertionError("Performance budgets exceeded:\n" + "\n".join(failures) + "\n\n" + report)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,33 +1,12 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from support.browser_pool import open_session
+from support.waits import wait_actionable, wait_for_page_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
+async def run_test(pool=None):
+    # Open an isolated, pre-authenticated browser context (pooled when started by run_suite.py)
+    async with open_session(pool, authenticated=True) as (context, page):
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:4200", wait_until="commit", timeout=10000)
@@ -50,37 +29,21 @@ async def run_test():
         await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
         
 
-        # -> Check if there is a way to create a new user or register a user with a known password.
-        frame = context.pages[-1]
-        # Input the test user's email
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
-        
+        # -> Session starts pre-authenticated as admin (storage state from support/auth_state.py).
 
-        frame = context.pages[-1]
-        # Input the test user's password
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
-        
-
-        frame = context.pages[-1]
-        # Click the login button to attempt login or proceed
-        elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
         # -> Navigate to Employee List to check if user management or password storage info is accessible.
         frame = context.pages[-1]
         # Click on 'Employee List' to check user management options
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li[2]/div[2]/ul/li[2]/span/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Check if there is an option to view or edit user details to confirm password storage or try to access backend or database to verify password hashing.
         frame = context.pages[-1]
         # Click 'Thêm Mới' (Add New) to see if user creation or password input is possible
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-list/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Try to find alternative ways to access user details or password storage, such as navigating to other sections or using backend access.
@@ -91,74 +54,74 @@ async def run_test():
         frame = context.pages[-1]
         # Click on admin@gmail.com email link to view user details or password info
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-list/div/nz-card/div/app-employee-table/nz-table/nz-spin/div/div/nz-table-inner-default/div/table/tbody/tr/td[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Since no password info is accessible via UI, attempt to access backend or database to verify password storage security.
         await page.goto('http://localhost:4200/admin/backend-access', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_for_page_ready(page)
         
 
         # -> Try to access the database directly or use other means outside the UI to verify password storage security.
         await page.goto('http://localhost:4200/admin/database', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_for_page_ready(page)
         
 
         # -> Log in again with admin credentials to regain access and continue verification of password storage.
         frame = context.pages[-1]
         # Input admin email to login
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
+        await wait_actionable(elem); await elem.fill('admin@gmail.com')
         
 
         frame = context.pages[-1]
         # Input admin password to login
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
+        await wait_actionable(elem); await elem.fill('11111111')
         
 
         frame = context.pages[-1]
         # Click login button to authenticate
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click on 'Employee List' to check user management or password storage info again.
         frame = context.pages[-1]
         # Click on 'Employee List' to check user management options
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-sider/div/app-sidebar/ul/li[2]/div[2]/ul/li[2]/span/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click the edit button (index 13) for the admin user to check if password details or hash are accessible in the edit form.
         frame = context.pages[-1]
         # Click the edit button for the admin user to view or edit user details including password
         elem = frame.locator('xpath=html/body/app-root/app-main-layout/nz-layout/nz-layout/nz-content/div/app-employee-list/div/nz-card/div/app-employee-table/nz-table/nz-spin/div/div/nz-table-inner-default/div/table/tbody/tr/td[5]/nz-space/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Since no password hash is visible in the UI, the next step is to verify password storage security by accessing the backend database or API directly to check the stored password hash.
         await page.goto('http://localhost:4200/admin/api/users', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_for_page_ready(page)
         
 
         # -> Log in again with admin credentials to regain access and attempt to verify password storage via API or other backend means.
         frame = context.pages[-1]
         # Input admin email to login
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@gmail.com')
+        await wait_actionable(elem); await elem.fill('admin@gmail.com')
         
 
         frame = context.pages[-1]
         # Input admin password to login
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item[2]/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('11111111')
+        await wait_actionable(elem); await elem.fill('11111111')
         
 
         frame = context.pages[-1]
         # Click login button to authenticate
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -167,15 +130,6 @@ async def run_test():
             await expect(frame.locator('text=Password stored in plain text').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Password storage verification could not be completed. The test plan requires confirming that user passwords are stored securely using bcrypt or Argon2 hashing algorithms, but this verification step was not successful or accessible in the UI/backend.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
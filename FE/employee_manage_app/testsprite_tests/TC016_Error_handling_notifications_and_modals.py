@@ -1,33 +1,12 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from support.browser_pool import open_session
+from support.waits import wait_actionable, wait_for_page_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
+async def run_test(pool=None):
+    # Open an isolated browser context (pooled when started by run_suite.py)
+    async with open_session(pool) as (context, page):
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:4200", wait_until="commit", timeout=10000)
@@ -50,31 +29,31 @@ async def run_test():
         frame = context.pages[-1]
         # Try to click any visible element to reveal login or form page
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Input invalid email and password, then submit the login form to trigger validation error.
         frame = context.pages[-1]
         # Input invalid email to trigger validation error
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email')
+        await wait_actionable(elem); await elem.fill('invalid-email')
         
 
         # -> Reload the login page to attempt to restore form elements or navigate to a different page with forms to test error notifications.
         await page.goto('http://localhost:4200/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_for_page_ready(page)
         
 
         # -> Input invalid email and password, then submit the login form to trigger validation error notification.
         frame = context.pages[-1]
         # Input invalid email to trigger validation error
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email')
+        await wait_actionable(elem); await elem.fill('invalid-email')
         
 
         # -> Navigate to the home page or dashboard to find a form or action to test error notifications.
         await page.goto('http://localhost:4200/home', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_for_page_ready(page)
         
 
         # -> Look for navigation elements or links to pages with forms or actions to test error notifications.
@@ -85,7 +64,7 @@ async def run_test():
         frame = context.pages[-1]
         # Input invalid email to trigger validation error
         elem = frame.locator('xpath=html/body/app-root/app-login/div/nz-card/div/form/nz-form-item/nz-form-control/div/div/nz-input-group/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email')
+        await wait_actionable(elem); await elem.fill('invalid-email')
         
 
         # --> Assertions to verify final state
@@ -94,15 +73,6 @@ async def run_test():
             await expect(frame.locator('text=Unexpected Success Message').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError('Test case failed: The application did not show clear and descriptive notifications or modals on errors such as failed form submissions, API errors, or permission denials as required by the test plan.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
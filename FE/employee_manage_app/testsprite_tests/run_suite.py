@@ -0,0 +1,102 @@
+"""
+Run the TestSprite regression suite concurrently.
+
+Every TC0xx_*.py script in this folder is imported and its `run_test()` is
+awaited with a shared BrowserPool, from which each test takes its own
+isolated BrowserContext, so the whole suite takes roughly as long as its
+slowest test.
+
+Usage:
+    python run_suite.py                      # all tests, 2 browsers x 4 contexts
+    python run_suite.py -k TC008 -k TC009    # only matching tests
+    python run_suite.py --browsers 4 --contexts-per-browser 2 --headed
+"""
+import argparse
+import asyncio
+import importlib.util
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from support import waits
+from support.browser_pool import BrowserPool
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+
+def discover_tests(patterns=None):
+    paths = sorted(TESTS_DIR.glob("TC[0-9][0-9][0-9]_*.py"))
+    if patterns:
+        paths = [p for p in paths if any(pattern in p.stem for pattern in patterns)]
+    return paths
+
+
+def load_test(path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.run_test
+
+
+async def run_one(pool, path):
+    started = time.perf_counter()
+    stats = waits.start_stats()
+    error = None
+    try:
+        run_test = load_test(path)
+        await run_test(pool)
+    except Exception as exc:  # AssertionError, playwright errors, timeouts...
+        error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+    return {
+        "name": path.stem,
+        "passed": error is None,
+        "duration": time.perf_counter() - started,
+        "error": error,
+        "waits": stats,
+    }
+
+
+def print_report(results, wall_time):
+    width = max(len(r["name"]) for r in results)
+    print()
+    for r in sorted(results, key=lambda r: r["name"]):
+        status = "PASS" if r["passed"] else "FAIL"
+        print(f"{status}  {r['name']:<{width}}  {r['duration']:7.1f}s  {r['waits'].summary()}")
+        if r["error"]:
+            print(f"      {r['error'].splitlines()[-1]}")
+
+    passed = sum(r["passed"] for r in results)
+    serial_time = sum(r["duration"] for r in results)
+    slowest = max(r["duration"] for r in results)
+    print()
+    print(f"{passed}/{len(results)} passed")
+    saved = sum(r["waits"].saved_ms for r in results) / 1000
+    print(f"Wall time: {wall_time:.1f}s (slowest test {slowest:.1f}s, serial sum {serial_time:.1f}s)")
+    print(f"Condition-based waits saved {saved:.1f}s of fixed sleeps across the suite")
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run TC0xx tests concurrently on a shared browser pool")
+    parser.add_argument("-k", dest="patterns", action="append", help="Only run tests whose file name contains this text")
+    parser.add_argument("--browsers", type=int, default=2, help="Number of long-lived browsers in the pool")
+    parser.add_argument("--contexts-per-browser", type=int, default=4, help="Concurrent contexts per browser")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows")
+    args = parser.parse_args(argv)
+
+    paths = discover_tests(args.patterns)
+    if not paths:
+        print("No tests found.")
+        return 1
+
+    print(f"Running {len(paths)} tests on {args.browsers} browser(s) x {args.contexts_per_browser} context(s)")
+    started = time.perf_counter()
+    async with BrowserPool(args.browsers, args.contexts_per_browser, headless=not args.headed) as pool:
+        results = await asyncio.gather(*[run_one(pool, path) for path in paths])
+    print_report(results, time.perf_counter() - started)
+
+    return 0 if all(r["passed"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1 @@
+"""Shared helpers for the TestSprite Playwright scripts (TC0xx_*.py)."""
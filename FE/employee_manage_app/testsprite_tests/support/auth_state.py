@@ -0,0 +1,84 @@
+"""
+Authenticated storage state shared by the TC scripts.
+
+Logs in once through `POST /api/Auth/login` and stores the JWT the way the
+Angular AuthService does (localStorage `authToken` on the app origin), as a
+Playwright storage state. Tests that are not about the login form open
+their context with this state and start on an authenticated page instead
+of typing into `app-login`.
+
+The state is cached on disk and reused until the token expires.
+"""
+import base64
+import json
+import os
+import time
+from pathlib import Path
+
+APP_URL = os.environ.get("EMPLOYEE_APP_URL", "http://localhost:4200")
+API_URL = os.environ.get("EMPLOYEE_API_URL", "https://localhost:44316/api")
+ADMIN_EMAIL = os.environ.get("EMPLOYEE_ADMIN_EMAIL", "admin@gmail.com")
+ADMIN_PASSWORD = os.environ.get("EMPLOYEE_ADMIN_PASSWORD", "11111111")
+
+TOKEN_KEY = "authToken"
+STORAGE_STATE_PATH = Path(__file__).resolve().parent.parent / ".auth" / "admin.json"
+
+# Refresh the cached state this long before the token actually expires
+EXPIRY_MARGIN_S = 300
+
+
+def _token_expiry(token):
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload)).get("exp", 0)
+
+
+def _cached_token(path):
+    try:
+        state = json.loads(path.read_text())
+        for origin in state["origins"]:
+            for item in origin["localStorage"]:
+                if item["name"] == TOKEN_KEY:
+                    return item["value"]
+    except (OSError, ValueError, KeyError, IndexError):
+        pass
+    return None
+
+
+def _is_fresh(token):
+    try:
+        return _token_expiry(token) - EXPIRY_MARGIN_S > time.time()
+    except (ValueError, IndexError):
+        return False
+
+
+async def login_via_api(playwright, email=ADMIN_EMAIL, password=ADMIN_PASSWORD):
+    """Return a JWT from the Auth controller without going through the UI."""
+    request = await playwright.request.new_context(ignore_https_errors=True)
+    try:
+        response = await request.post(f"{API_URL}/Auth/login", data={"email": email, "password": password})
+        if not response.ok:
+            raise RuntimeError(f"API login failed for {email}: HTTP {response.status}")
+        body = await response.json()
+        return body["data"]["token"]
+    finally:
+        await request.dispose()
+
+
+def build_storage_state(token):
+    return {
+        "cookies": [],
+        "origins": [
+            {"origin": APP_URL, "localStorage": [{"name": TOKEN_KEY, "value": token}]},
+        ],
+    }
+
+
+async def admin_storage_state(playwright, path=STORAGE_STATE_PATH):
+    """Path to a storage state holding a valid admin token, logging in only when needed."""
+    token = _cached_token(path)
+    if token is None or not _is_fresh(token):
+        token = await login_via_api(playwright)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(build_storage_state(token), indent=2))
+    return str(path)
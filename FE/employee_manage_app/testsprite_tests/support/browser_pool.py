@@ -0,0 +1,116 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from playwright import async_api
+
+from support import auth_state, waits
+
+# Default timeout applied to every context, same value the generated scripts used
+DEFAULT_TIMEOUT_MS = 5000
+
+BROWSER_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+
+
+class BrowserPool:
+    """
+    Bounded pool of long-lived Chromium browsers.
+
+    Each call to `context()` hands out a fresh, isolated BrowserContext on the
+    least-loaded browser. At most `size * contexts_per_browser` contexts are
+    open at any time; extra callers wait for a free slot. Authenticated
+    contexts share one admin storage state, fetched once per pool.
+    """
+
+    def __init__(self, size=2, contexts_per_browser=4, headless=True, single_process=False):
+        self.size = size
+        self.contexts_per_browser = contexts_per_browser
+        self.headless = headless
+        self.single_process = single_process
+        self._pw = None
+        self._browsers = []
+        self._load = []
+        self._slots = asyncio.Semaphore(size * contexts_per_browser)
+        self._storage_state = None
+        self._storage_state_lock = asyncio.Lock()
+
+    async def start(self):
+        args = list(BROWSER_ARGS)
+        if self.single_process:
+            # Only safe with one context per browser
+            args.append("--single-process")
+
+        self._pw = await async_api.async_playwright().start()
+        self._browsers = await asyncio.gather(*[
+            self._pw.chromium.launch(headless=self.headless, args=args)
+            for _ in range(self.size)
+        ])
+        self._load = [0] * self.size
+        return self
+
+    async def close(self):
+        await asyncio.gather(*[browser.close() for browser in self._browsers], return_exceptions=True)
+        self._browsers = []
+        if self._pw:
+            await self._pw.stop()
+            self._pw = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def storage_state(self):
+        async with self._storage_state_lock:
+            if self._storage_state is None:
+                self._storage_state = await auth_state.admin_storage_state(self._pw)
+        return self._storage_state
+
+    @asynccontextmanager
+    async def context(self, authenticated=False, **context_options):
+        if authenticated:
+            context_options.setdefault("storage_state", await self.storage_state())
+
+        async with self._slots:
+            index = min(range(len(self._browsers)), key=lambda i: self._load[i])
+            self._load[index] += 1
+            context = None
+            try:
+                context = await self._browsers[index].new_context(**context_options)
+                context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+                yield context
+            finally:
+                self._load[index] -= 1
+                if context:
+                    await context.close()
+
+
+@asynccontextmanager
+async def open_session(pool=None, authenticated=False, **context_options):
+    """
+    Yield `(context, page)` for a TC script.
+
+    When the suite runner passes in its BrowserPool the context comes from
+    there. A script run on its own gets a private single-browser pool,
+    matching the old standalone behaviour. With `authenticated=True` the
+    context starts with the admin token already in localStorage; any other
+    keyword is passed to `Browser.new_context` (viewport, is_mobile...).
+    """
+    if pool is not None:
+        async with pool.context(authenticated=authenticated, **context_options) as context:
+            page = await context.new_page()
+            waits.track_api(page)
+            yield context, page
+        return
+
+    stats = waits.start_stats()
+    async with BrowserPool(size=1, contexts_per_browser=1, single_process=True) as own_pool:
+        async with own_pool.context(authenticated=authenticated, **context_options) as context:
+            page = await context.new_page()
+            waits.track_api(page)
+            yield context, page
+    print(f"Waits: {stats.summary()}")
@@ -0,0 +1,154 @@
+"""
+Page-load performance measurement for TC014.
+
+Loads each route in a real device profile and collects:
+- Navigation Timing (TTFB, DOMContentLoaded, load)
+- Largest Contentful Paint
+- long tasks (count and total blocking duration)
+- XHR/fetch timings of the /api/ calls the route makes
+
+Results are compared against budgets (milliseconds). Defaults live in
+DEFAULT_BUDGETS; override them with a JSON file passed in PERF_BUDGETS:
+
+    {"default": {"lcp": 2500}, "mobile": {"lcp": 3500, "api_max": 1500}}
+
+Set PERF_REPORT to a path to also dump the raw measurements as JSON.
+"""
+import json
+import os
+from pathlib import Path
+
+from support import waits
+
+APP_URL = os.environ.get("EMPLOYEE_APP_URL", "http://localhost:4200")
+
+ROUTES = {
+    "overview": "/employee-manage/overview",
+    "employees": "/employee-manage/employees",
+    "departments": "/employee-manage/departments",
+    "designations": "/employee-manage/designations",
+}
+
+# Context options copied from Playwright's "Desktop Chrome", "iPad (gen 7)" and "Pixel 5" descriptors
+DEVICE_PROFILES = {
+    "desktop": {
+        "viewport": {"width": 1920, "height": 1080},
+        "device_scale_factor": 1,
+        "is_mobile": False,
+        "has_touch": False,
+    },
+    "tablet": {
+        "viewport": {"width": 810, "height": 1080},
+        "device_scale_factor": 2,
+        "is_mobile": True,
+        "has_touch": True,
+        "user_agent": "Mozilla/5.0 (iPad; CPU OS 12_2 like Mac OS X) AppleWebKit/605.1.15 "
+                      "(KHTML, like Gecko) Version/12.1 Mobile/15E148 Safari/604.1",
+    },
+    "mobile": {
+        "viewport": {"width": 393, "height": 727},
+        "device_scale_factor": 2.75,
+        "is_mobile": True,
+        "has_touch": True,
+        "user_agent": "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
+    },
+}
+
+DEFAULT_BUDGETS = {
+    "ttfb": 600,
+    "dom_content_loaded": 1500,
+    "load": 2000,
+    "lcp": 2000,
+    "long_tasks_total": 300,
+    "api_max": 1000,
+}
+
+# Registered before any page script runs so buffered LCP/long task entries are kept
+OBSERVER_SCRIPT = """
+(() => {
+    window.__perf = { lcp: null, longTasks: [] };
+    try {
+        new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) window.__perf.lcp = entry.startTime;
+        }).observe({ type: 'largest-contentful-paint', buffered: true });
+        new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) window.__perf.longTasks.push(entry.duration);
+        }).observe({ type: 'longtask', buffered: true });
+    } catch (e) { /* unsupported entry type */ }
+})();
+"""
+
+COLLECT_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const api = performance.getEntriesByType('resource')
+        .filter(r => (r.initiatorType === 'xmlhttprequest' || r.initiatorType === 'fetch') && r.name.includes('/api/'))
+        .map(r => ({ url: r.name, duration: r.duration }));
+    const longTasks = window.__perf ? window.__perf.longTasks : [];
+    return {
+        ttfb: nav ? nav.responseStart - nav.requestStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load: nav ? nav.loadEventEnd : null,
+        lcp: window.__perf ? window.__perf.lcp : null,
+        long_tasks: longTasks.length,
+        long_tasks_total: longTasks.reduce((sum, d) => sum + d, 0),
+        api_max: api.length ? Math.max(...api.map(r => r.duration)) : 0,
+        api: api,
+    };
+}
+"""
+
+
+def load_budgets(device, path=None):
+    budgets = dict(DEFAULT_BUDGETS)
+    path = path or os.environ.get("PERF_BUDGETS")
+    if path:
+        overrides = json.loads(Path(path).read_text())
+        budgets.update(overrides.get("default", {}))
+        budgets.update(overrides.get(device, {}))
+    return budgets
+
+
+async def measure_route(context, route, timeout=15000):
+    """Load `route` in a fresh page of `context` and return its timing metrics in ms."""
+    page = await context.new_page()
+    try:
+        await page.add_init_script(OBSERVER_SCRIPT)
+        waits.track_api(page)
+        await page.goto(f"{APP_URL}{route}", wait_until="load", timeout=timeout)
+        await waits.wait_for_angular(page, timeout=timeout)
+        await waits.track_api(page).wait_idle(timeout=timeout)
+        return await page.evaluate(COLLECT_SCRIPT)
+    finally:
+        await page.close()
+
+
+def check_budgets(metrics, budgets):
+    """Return `(metric, value, budget)` for every metric over budget or not measured."""
+    failures = []
+    for metric, budget in budgets.items():
+        value = metrics.get(metric)
+        if value is None or value > budget:
+            failures.append((metric, value, budget))
+    return failures
+
+
+def format_report(results):
+    """Render `[{device, route, metrics, budgets}]` as a per-metric table."""
+    lines = [f"{'device':<8} {'route':<13} {'metric':<19} {'value':>9} {'budget':>8}  status"]
+    for result in results:
+        for metric, budget in result["budgets"].items():
+            value = result["metrics"].get(metric)
+            status = "OK" if value is not None and value <= budget else "OVER"
+            shown = "n/a" if value is None else f"{value:.0f}"
+            lines.append(f"{result['device']:<8} {result['route']:<13} {metric:<19} {shown:>9} {budget:>8}  {status}")
+        for call in result["metrics"].get("api", []):
+            lines.append(f"{'':<8} {'':<13} {'  ' + call['url'].split('/api/')[-1][:40]:<19} {call['duration']:>9.0f}")
+    return "\n".join(lines)
+
+
+def write_report(results, path=None):
+    path = path or os.environ.get("PERF_REPORT")
+    if path:
+        Path(path).write_text(json.dumps(results, indent=2))
@@ -0,0 +1,165 @@
+"""
+Condition-based waits for the TC scripts.
+
+Replaces the fixed `page.wait_for_timeout(3000)` / `asyncio.sleep(3)` calls
+with waits on the things the tests actually depend on:
+- in-flight /api/EmployeeMaster, /api/DepartmentMaster, /api/DesignationMaster and /api/Stats calls
+- Angular finishing its render after a navigation
+- the target locator becoming visible and enabled
+
+Every helper records how long it really waited against the fixed delay it
+replaced, so the suite runner can report the wall time saved per test.
+"""
+import asyncio
+import contextvars
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from playwright.async_api import expect
+
+MASTER_ENDPOINTS = ("/api/EmployeeMaster", "/api/DepartmentMaster", "/api/DesignationMaster", "/api/Stats")
+
+# Fixed delays the generated scripts used before every step / after every goto
+REPLACED_STEP_MS = 3000
+REPLACED_LOAD_MS = 3000
+
+# How long the tracked endpoints must stay quiet to count as idle
+QUIET_MS = 250
+
+
+@dataclass
+class WaitStats:
+    waits: int = 0
+    replaced_ms: float = 0.0
+    waited_ms: float = 0.0
+
+    @property
+    def saved_ms(self):
+        return max(self.replaced_ms - self.waited_ms, 0.0)
+
+    def record(self, replaced_ms, started):
+        self.waits += 1
+        self.replaced_ms += replaced_ms
+        self.waited_ms += (time.perf_counter() - started) * 1000
+
+    def summary(self):
+        return (f"{self.waits} waits: {self.waited_ms / 1000:.1f}s waited "
+                f"instead of {self.replaced_ms / 1000:.1f}s fixed, saved {self.saved_ms / 1000:.1f}s")
+
+
+# One WaitStats per running test; run_suite.py sets a fresh one per task
+_stats = contextvars.ContextVar("wait_stats", default=None)
+
+
+def start_stats():
+    stats = WaitStats()
+    _stats.set(stats)
+    return stats
+
+
+def current_stats():
+    stats = _stats.get()
+    if stats is None:
+        stats = start_stats()
+    return stats
+
+
+class ApiTracker:
+    """Counts in-flight requests to the master API endpoints of one page."""
+
+    def __init__(self, page, endpoints=MASTER_ENDPOINTS):
+        self.endpoints = endpoints
+        self._pending = {}
+        self._last_change = time.perf_counter()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    def _matches(self, request, endpoints):
+        return any(endpoint in request.url for endpoint in endpoints)
+
+    def _on_request(self, request):
+        if self._matches(request, self.endpoints):
+            self._pending[request] = request.url
+            self._last_change = time.perf_counter()
+
+    def _on_done(self, request):
+        if self._pending.pop(request, None) is not None:
+            self._last_change = time.perf_counter()
+
+    def pending(self, endpoints=None):
+        endpoints = endpoints or self.endpoints
+        return [url for url in self._pending.values() if any(endpoint in url for endpoint in endpoints)]
+
+    async def wait_idle(self, endpoints=None, timeout=10000, quiet_ms=QUIET_MS):
+        deadline = time.perf_counter() + timeout / 1000
+        while True:
+            quiet_for = (time.perf_counter() - self._last_change) * 1000
+            if not self.pending(endpoints) and quiet_for >= quiet_ms:
+                return
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"API calls still pending after {timeout}ms: {self.pending(endpoints)}")
+            await asyncio.sleep(0.05)
+
+
+_trackers = {}
+
+
+def track_api(page):
+    """Start tracking master API calls on `page` (idempotent)."""
+    tracker = _trackers.get(page)
+    if tracker is None:
+        tracker = _trackers[page] = ApiTracker(page)
+        page.once("close", lambda _: _trackers.pop(page, None))
+    return tracker
+
+
+async def wait_for_api_idle(page, *endpoints, timeout=10000):
+    """Wait until no request to `endpoints` (default: all master endpoints) is in flight."""
+    started = time.perf_counter()
+    await track_api(page).wait_idle(endpoints or None, timeout=timeout)
+    current_stats().record(0, started)
+
+
+@asynccontextmanager
+async def expect_api(page, endpoint, timeout=10000):
+    """Wrap an action that must trigger a call to `endpoint`; waits for its response."""
+    started = time.perf_counter()
+    async with page.expect_response(lambda response: endpoint in response.url, timeout=timeout) as info:
+        yield info
+    await info.value
+    current_stats().record(0, started)
+
+
+async def wait_for_angular(page, timeout=10000):
+    """Wait for Angular to bootstrap and settle after a navigation."""
+    await page.wait_for_function(
+        """() => {
+            if (window.getAllAngularTestabilities) {
+                return window.getAllAngularTestabilities().every(t => t.isStable());
+            }
+            const root = document.querySelector('app-root');
+            return !!root && root.childElementCount > 0;
+        }""",
+        timeout=timeout,
+    )
+    # Zoneless apps have no testability hook; let pending renders flush
+    await page.evaluate("() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))")
+
+
+async def wait_for_page_ready(page, *endpoints, timeout=10000):
+    """Replacement for `goto(...); asyncio.sleep(3)`: Angular rendered and API calls settled."""
+    started = time.perf_counter()
+    track_api(page)
+    await wait_for_angular(page, timeout=timeout)
+    await track_api(page).wait_idle(endpoints or None, timeout=timeout)
+    current_stats().record(REPLACED_LOAD_MS, started)
+
+
+async def wait_actionable(locator, timeout=10000):
+    """Replacement for `page.wait_for_timeout(3000)` before a fill/click."""
+    started = time.perf_counter()
+    await expect(locator).to_be_visible(timeout=timeout)
+    await expect(locator).to_be_enabled(timeout=timeout)
+    current_stats().record(REPLACED_STEP_MS, started)
@@ -45,6 +45,8 @@ CREATE TABLE [dbo].[employeeTbl](
 	[altContactNo] [varchar](50) NULL,
 	[address] [varchar](2000) NOT NULL,
 	[designationId] [int] NOT NULL,
+	[email] [varchar](100) NOT NULL,
+	[password] [varchar](100) NOT NULL,
 	[createDate] [datetime] NULL,
 	[modifiedData] [datetime] NULL,
  CONSTRAINT [PK_employeeTbl] PRIMARY KEY CLUSTERED 
@@ -63,3 +65,51 @@ REFERENCES [dbo].[designationTbl] ([designationId])
 GO
 ALTER TABLE [dbo].[employeeTbl] CHECK CONSTRAINT [FK_employeeTbl_designationTbl]
 GO
+/****** Search indexes ******/
+-- Prefix search (LIKE 'term%') seeks on these instead of scanning employeeTbl.
+-- Non-unique nonclustered keys also carry the clustered key, so each one is
+-- effectively (column, employeeId) and serves keyset paging on that column too.
+CREATE NONCLUSTERED INDEX [IX_employeeTbl_name] ON [dbo].[employeeTbl]
+(
+	[name] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+GO
+-- Also used by the login lookup (WHERE email = @email)
+CREATE NONCLUSTERED INDEX [IX_employeeTbl_email] ON [dbo].[employeeTbl]
+(
+	[email] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+GO
+CREATE NONCLUSTERED INDEX [IX_employeeTbl_city] ON [dbo].[employeeTbl]
+(
+	[city] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+GO
+CREATE NONCLUSTERED INDEX [IX_employeeTbl_contactNo] ON [dbo].[employeeTbl]
+(
+	[contactNo] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+GO
+CREATE NONCLUSTERED INDEX [IX_departmentTbl_departmentName] ON [dbo].[departmentTbl]
+(
+	[departmentName] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+GO
+CREATE NONCLUSTERED INDEX [IX_designationTbl_designationName] ON [dbo].[designationTbl]
+(
+	[designationName] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+GO
+/****** Optional full-text index (Search:Mode = FullText) ******/
+-- Matches word prefixes anywhere in the value ("Van" finds "Nguyen Van A").
+-- Skipped when the Full-Text Search feature is not installed (e.g. LocalDB).
+IF FULLTEXTSERVICEPROPERTY('IsFullTextInstalled') = 1
+BEGIN
+	EXEC('CREATE FULLTEXT CATALOG [employeeSearchCatalog] AS DEFAULT')
+	EXEC('CREATE FULLTEXT INDEX ON [dbo].[employeeTbl] ([name], [email], [city], [contactNo])
+		KEY INDEX [PK_employeeTbl] ON [employeeSearchCatalog] WITH CHANGE_TRACKING AUTO')
+END
+GO
+/****** Further indexes ******/
+-- Foreign key, unique login email and covering list indexes are versioned
+-- separately: run database/migrations/apply_all.sql after this script.
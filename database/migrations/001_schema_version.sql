@@ -0,0 +1,23 @@
+/****** 001: schemaVersion bookkeeping table ******/
+-- Every migration in this folder is idempotent and records itself here when it
+-- finishes, so the set can be re-run safely: SELECT * FROM dbo.schemaVersion
+-- shows what a database already has. Apply in file order (see apply_all.sql).
+USE [employeeManagerDb]
+GO
+SET ANSI_NULLS ON
+GO
+SET QUOTED_IDENTIFIER ON
+GO
+IF OBJECT_ID(N'dbo.schemaVersion', N'U') IS NULL
+BEGIN
+	CREATE TABLE [dbo].[schemaVersion](
+		[version] [int] NOT NULL,
+		[description] [varchar](200) NOT NULL,
+		[appliedAt] [datetime2](0) NOT NULL CONSTRAINT [DF_schemaVersion_appliedAt] DEFAULT (SYSUTCDATETIME()),
+	 CONSTRAINT [PK_schemaVersion] PRIMARY KEY CLUSTERED ([version] ASC)
+	)
+END
+GO
+IF NOT EXISTS (SELECT 1 FROM [dbo].[schemaVersion] WHERE [version] = 1)
+	INSERT INTO [dbo].[schemaVersion] ([version], [description]) VALUES (1, 'schemaVersion table')
+GO
@@ -0,0 +1,32 @@
+/****** 002: indexes on the foreign key columns ******/
+-- SQL Server does not index foreign keys by itself. Without these, every query
+-- that starts from the parent side scans the child table:
+--   * employee list / export: designationTbl JOIN departmentTbl per row
+--   * DELETE designation / department and the delete-many "inUse" checks
+--     (WHERE designationId IN (...) / WHERE departmentId IN (...))
+--   * /api/Stats headcounts (GROUP BY designationId, join to departmentId)
+--   * the FK check SQL Server runs itself on every parent-row delete
+USE [employeeManagerDb]
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE [object_id] = OBJECT_ID(N'dbo.employeeTbl') AND [name] = N'IX_employeeTbl_designationId')
+BEGIN
+	-- Narrow on purpose: the headcount GROUP BY and the in-use checks only need the key itself
+	CREATE NONCLUSTERED INDEX [IX_employeeTbl_designationId] ON [dbo].[employeeTbl]
+	(
+		[designationId] ASC
+	)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+END
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE [object_id] = OBJECT_ID(N'dbo.designationTbl') AND [name] = N'IX_designationTbl_departmentId')
+BEGIN
+	-- designationName included so the list join and the per-department headcount never touch the clustered index
+	CREATE NONCLUSTERED INDEX [IX_designationTbl_departmentId] ON [dbo].[designationTbl]
+	(
+		[departmentId] ASC
+	)
+	INCLUDE([designationName]) WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+END
+GO
+IF NOT EXISTS (SELECT 1 FROM [dbo].[schemaVersion] WHERE [version] = 2)
+	INSERT INTO [dbo].[schemaVersion] ([version], [description]) VALUES (2, 'Foreign key indexes')
+GO
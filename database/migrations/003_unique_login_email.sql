@@ -0,0 +1,34 @@
+/****** 003: unique index for the login lookup ******/
+-- Login runs SELECT ... WHERE email = @email and expects at most one row.
+-- IX_employeeTbl_email (employeeManagerDb.sql) already lets it seek; making
+-- the index unique also guarantees the "at most one" the API relies on and
+-- lets the optimizer stop after the first match. The prefix search
+-- (LIKE 'term%') seeks this index exactly as before.
+--
+-- Existing duplicates block the migration. List them with:
+--   SELECT [email], COUNT(*) FROM [dbo].[employeeTbl] GROUP BY [email] HAVING COUNT(*) > 1
+USE [employeeManagerDb]
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE [object_id] = OBJECT_ID(N'dbo.employeeTbl') AND [name] = N'UX_employeeTbl_email')
+BEGIN
+	IF EXISTS (SELECT [email] FROM [dbo].[employeeTbl] GROUP BY [email] HAVING COUNT(*) > 1)
+	BEGIN
+		RAISERROR('003_unique_login_email: employeeTbl has duplicate emails; resolve them and re-run this script.', 16, 1)
+	END
+	ELSE
+	BEGIN
+		CREATE UNIQUE NONCLUSTERED INDEX [UX_employeeTbl_email] ON [dbo].[employeeTbl]
+		(
+			[email] ASC
+		)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, IGNORE_DUP_KEY = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+
+		-- Same key, now redundant
+		IF EXISTS (SELECT 1 FROM sys.indexes WHERE [object_id] = OBJECT_ID(N'dbo.employeeTbl') AND [name] = N'IX_employeeTbl_email')
+			DROP INDEX [IX_employeeTbl_email] ON [dbo].[employeeTbl]
+	END
+END
+GO
+IF EXISTS (SELECT 1 FROM sys.indexes WHERE [object_id] = OBJECT_ID(N'dbo.employeeTbl') AND [name] = N'UX_employeeTbl_email')
+   AND NOT EXISTS (SELECT 1 FROM [dbo].[schemaVersion] WHERE [version] = 3)
+	INSERT INTO [dbo].[schemaVersion] ([version], [description]) VALUES (3, 'Unique login email')
+GO
@@ -0,0 +1,41 @@
+/****** 004: covering indexes for the list and dashboard queries ******/
+-- GET /api/EmployeeMaster selects the EmployeeListItem columns only:
+--   employeeId, name, email, contactNo, city, state, pincode, designationId, createDate
+-- The default FE sort is by name (plus employeeId as tie-breaker), so the name
+-- index carries those columns and a page, deep OFFSET pages included, is read
+-- from the index alone with no key lookup per skipped row. address and
+-- password stay out, which keeps the index a fraction of the table's width.
+--
+-- /api/Stats counts and lists hires since a date (WHERE createDate >= @since
+-- ORDER BY createDate DESC), and keyset paging can sort by createDate.
+USE [employeeManagerDb]
+GO
+IF NOT EXISTS (SELECT 1
+               FROM sys.index_columns ic
+               JOIN sys.indexes i ON i.[object_id] = ic.[object_id] AND i.index_id = ic.index_id
+               JOIN sys.columns c ON c.[object_id] = ic.[object_id] AND c.column_id = ic.column_id
+               WHERE i.[object_id] = OBJECT_ID(N'dbo.employeeTbl') AND i.[name] = N'IX_employeeTbl_name'
+                 AND ic.is_included_column = 1 AND c.[name] = N'createDate')
+BEGIN
+	IF EXISTS (SELECT 1 FROM sys.indexes WHERE [object_id] = OBJECT_ID(N'dbo.employeeTbl') AND [name] = N'IX_employeeTbl_name')
+		DROP INDEX [IX_employeeTbl_name] ON [dbo].[employeeTbl]
+
+	CREATE NONCLUSTERED INDEX [IX_employeeTbl_name] ON [dbo].[employeeTbl]
+	(
+		[name] ASC
+	)
+	INCLUDE([email], [contactNo], [city], [state], [pincode], [designationId], [createDate]) WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+END
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE [object_id] = OBJECT_ID(N'dbo.employeeTbl') AND [name] = N'IX_employeeTbl_createDate')
+BEGIN
+	CREATE NONCLUSTERED INDEX [IX_employeeTbl_createDate] ON [dbo].[employeeTbl]
+	(
+		[createDate] DESC
+	)
+	INCLUDE([name], [designationId]) WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, SORT_IN_TEMPDB = OFF, DROP_EXISTING = OFF, ONLINE = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+END
+GO
+IF NOT EXISTS (SELECT 1 FROM [dbo].[schemaVersion] WHERE [version] = 4)
+	INSERT INTO [dbo].[schemaVersion] ([version], [description]) VALUES (4, 'Covering indexes for list and stats queries')
+GO
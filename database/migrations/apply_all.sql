@@ -0,0 +1,12 @@
+/****** Applies every migration in order ******/
+-- SQLCMD mode (SSMS: Query > SQLCMD Mode), run from this folder:
+--   sqlcmd -S <server> -E -b -i apply_all.sql
+-- -b stops at the first error (e.g. duplicate emails in 003). Each script is
+-- idempotent, so re-running after a fix only applies what is missing.
+:r 001_schema_version.sql
+:r 002_foreign_key_indexes.sql
+:r 003_unique_login_email.sql
+:r 004_list_covering_indexes.sql
+
+SELECT [version], [description], [appliedAt] FROM [employeeManagerDb].[dbo].[schemaVersion] ORDER BY [version]
+GO
@@ -0,0 +1,144 @@
+/****** Query timings and plans for the API's hot queries ******/
+-- Runs each query the controllers send (same parameterised shape as EF Core,
+-- via sp_executesql) @iterations times and stores per-query averages (elapsed,
+-- CPU, logical reads) and the cached plan in dbo.perfQueryTiming under @run.
+--
+-- Workflow on a scratch database:
+--   1. employeeManagerDb.sql, then perf/seedLargeData.sql
+--   2. this script with @run = 'before'
+--   3. migrations/apply_all.sql
+--   4. this script with @run = 'after'
+--   5. perf/indexBenchmarkReport.sql for the side-by-side numbers and plans
+-- Every query returns rows: in SSMS turn on "Discard results after execution"
+-- (Query Options > Results), or run with sqlcmd -o <file>.
+-- Reading sys.dm_exec_query_stats needs VIEW SERVER STATE. Plan-cache totals
+-- accumulate per query text, so re-running a label adds to its old numbers:
+-- pick a new label (e.g. 'after2') instead.
+USE [employeeManagerDb]
+GO
+SET NOCOUNT ON
+GO
+IF OBJECT_ID(N'dbo.perfQueryTiming', N'U') IS NULL
+BEGIN
+	CREATE TABLE [dbo].[perfQueryTiming](
+		[runLabel] [varchar](20) NOT NULL,
+		[queryName] [varchar](50) NOT NULL,
+		[executions] [bigint] NOT NULL,
+		[avgElapsedMs] [decimal](12, 3) NOT NULL,
+		[avgCpuMs] [decimal](12, 3) NOT NULL,
+		[avgLogicalReads] [bigint] NOT NULL,
+		[queryPlan] [xml] NULL,
+		[capturedAt] [datetime2](0) NOT NULL CONSTRAINT [DF_perfQueryTiming_capturedAt] DEFAULT (SYSUTCDATETIME()),
+	 CONSTRAINT [PK_perfQueryTiming] PRIMARY KEY CLUSTERED ([runLabel] ASC, [queryName] ASC)
+	)
+END
+GO
+DECLARE @run varchar(20) = 'before'
+DECLARE @iterations int = 20
+
+DELETE FROM [dbo].[perfQueryTiming] WHERE [runLabel] = @run
+
+-- Parameter values taken from the data, so the script works on any seed size
+DECLARE @email varchar(100) = (SELECT TOP (1) [email] FROM [dbo].[employeeTbl] ORDER BY [employeeId] DESC)
+DECLARE @prefix varchar(51) = 'Ng%'
+DECLARE @term varchar(50) = 'Ng'
+DECLARE @take int = 10
+DECLARE @deepSkip int = (SELECT COUNT(*) / 2 FROM [dbo].[employeeTbl])
+DECLARE @since datetime = DATEADD(DAY, -30, GETUTCDATE())
+DECLARE @lastCreateDate datetime, @lastEmployeeId int
+SELECT TOP (1) @lastCreateDate = [createDate], @lastEmployeeId = [employeeId]
+FROM [dbo].[employeeTbl] ORDER BY [createDate] DESC, [employeeId] DESC
+DECLARE @designationIds nvarchar(max) = (SELECT CONCAT('[', STRING_AGG([designationId], ','), ']')
+                                        FROM (SELECT TOP (10) [designationId] FROM [dbo].[designationTbl] ORDER BY [designationId]) d)
+DECLARE @departmentIds nvarchar(max) = (SELECT CONCAT('[', STRING_AGG([departmentId], ','), ']')
+                                       FROM (SELECT TOP (5) [departmentId] FROM [dbo].[departmentTbl] ORDER BY [departmentId]) d)
+
+DECLARE @listColumns nvarchar(max) = N'[e].[employeeId], [e].[name], [e].[email], [e].[contactNo], [e].[city], [e].[state], [e].[pincode], [e].[designationId], [d].[designationName], [d0].[departmentId], [d0].[departmentName], [e].[createDate]
+FROM [employeeTbl] AS [e]
+INNER JOIN [designationTbl] AS [d] ON [e].[designationId] = [d].[designationId]
+INNER JOIN [departmentTbl] AS [d0] ON [d].[departmentId] = [d0].[departmentId]'
+DECLARE @q nvarchar(max), @i int
+
+-- login: AuthController.Login (CompiledQueries.EmployeeByEmail)
+SET @q = REPLACE(N'/* perf:{run}:login */ SELECT TOP(1) [e].* FROM [employeeTbl] AS [e] WHERE [e].[email] = @email', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@email varchar(100)', @email = @email; SET @i += 1 END
+
+-- list_count: every OFFSET page also counts the (filtered) rows
+SET @q = REPLACE(N'/* perf:{run}:list_count */ SELECT COUNT(*) FROM [employeeTbl] AS [e]', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q; SET @i += 1 END
+
+-- list_by_id: unfiltered first page (CompiledQueries.EmployeePageById)
+SET @q = REPLACE(N'/* perf:{run}:list_by_id */ SELECT ' + @listColumns + N'
+ORDER BY [e].[employeeId] OFFSET @skip ROWS FETCH NEXT @take ROWS ONLY', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@skip int, @take int', @skip = 0, @take = @take; SET @i += 1 END
+
+-- list_by_name_deep: the FE default sort, halfway through the table (CompiledQueries.EmployeePageByName)
+SET @q = REPLACE(N'/* perf:{run}:list_by_name_deep */ SELECT ' + @listColumns + N'
+ORDER BY [e].[name], [e].[employeeId] OFFSET @skip ROWS FETCH NEXT @take ROWS ONLY', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@skip int, @take int', @skip = @deepSkip, @take = @take; SET @i += 1 END
+
+-- list_by_department: sortBy=departmentName,name (SortRegistries.Employees)
+SET @q = REPLACE(N'/* perf:{run}:list_by_department */ SELECT ' + @listColumns + N'
+ORDER BY [d0].[departmentName], [e].[name], [e].[employeeId] OFFSET @skip ROWS FETCH NEXT @take ROWS ONLY', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@skip int, @take int', @skip = 0, @take = @take; SET @i += 1 END
+
+-- list_filter: prefix search ordered by rank (SearchExtensions.Search + OrderByRank)
+SET @q = REPLACE(N'/* perf:{run}:list_filter */ SELECT ' + @listColumns + N'
+WHERE [e].[name] LIKE @prefix ESCAPE N''\'' OR [e].[email] LIKE @prefix ESCAPE N''\'' OR [e].[city] LIKE @prefix ESCAPE N''\'' OR [e].[contactNo] LIKE @prefix ESCAPE N''\''
+ORDER BY CASE WHEN [e].[name] = @term THEN 8 ELSE 0 END + CASE WHEN [e].[name] LIKE @prefix ESCAPE N''\'' THEN 4 ELSE 0 END
+       + CASE WHEN [e].[email] LIKE @prefix ESCAPE N''\'' THEN 2 ELSE 0 END
+       + CASE WHEN [e].[city] LIKE @prefix ESCAPE N''\'' OR [e].[contactNo] LIKE @prefix ESCAPE N''\'' THEN 1 ELSE 0 END DESC,
+         [e].[name], [e].[employeeId]
+OFFSET @skip ROWS FETCH NEXT @take ROWS ONLY', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@prefix varchar(51), @term varchar(50), @skip int, @take int', @prefix = @prefix, @term = @term, @skip = 0, @take = @take; SET @i += 1 END
+
+-- keyset_create_date: keyset=true&sortBy=createDate&sortOrder=desc, second page (KeysetPagination)
+SET @q = REPLACE(N'/* perf:{run}:keyset_create_date */ SELECT TOP(@take) ' + @listColumns + N'
+WHERE [e].[createDate] < @lastValue OR ([e].[createDate] = @lastValue AND [e].[employeeId] < @lastKey)
+ORDER BY [e].[createDate] DESC, [e].[employeeId] DESC', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@lastValue datetime, @lastKey int, @take int', @lastValue = @lastCreateDate, @lastKey = @lastEmployeeId, @take = 11; SET @i += 1 END
+
+-- stats_per_designation / stats_per_department: /api/Stats headcounts
+SET @q = REPLACE(N'/* perf:{run}:stats_per_designation */ SELECT [e].[designationId], COUNT(*) FROM [employeeTbl] AS [e] GROUP BY [e].[designationId]', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q; SET @i += 1 END
+
+SET @q = REPLACE(N'/* perf:{run}:stats_per_department */ SELECT [d].[departmentId], COUNT(*) FROM [employeeTbl] AS [e]
+INNER JOIN [designationTbl] AS [d] ON [e].[designationId] = [d].[designationId] GROUP BY [d].[departmentId]', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q; SET @i += 1 END
+
+-- stats_recent_hires: /api/Stats recent hire count + list
+SET @q = REPLACE(N'/* perf:{run}:stats_recent_hires */ SELECT TOP(@take) [e].[employeeId], [e].[name], [e].[designationId], [e].[createDate]
+FROM [employeeTbl] AS [e] WHERE [e].[createDate] >= @since ORDER BY [e].[createDate] DESC', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@since datetime, @take int', @since = @since, @take = @take; SET @i += 1 END
+
+-- designation_in_use / department_in_use: delete-many checks (EF Core sends the id list as JSON)
+SET @q = REPLACE(N'/* perf:{run}:designation_in_use */ SELECT DISTINCT [e].[designationId] FROM [employeeTbl] AS [e]
+WHERE [e].[designationId] IN (SELECT [f].[value] FROM OPENJSON(@found) WITH ([value] int ''$'') AS [f])', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@found nvarchar(4000)', @found = @designationIds; SET @i += 1 END
+
+SET @q = REPLACE(N'/* perf:{run}:department_in_use */ SELECT DISTINCT [d].[departmentId] FROM [designationTbl] AS [d]
+WHERE [d].[departmentId] IN (SELECT [f].[value] FROM OPENJSON(@found) WITH ([value] int ''$'') AS [f])', N'{run}', @run)
+SET @i = 0 WHILE @i < @iterations BEGIN EXEC sp_executesql @q, N'@found nvarchar(4000)', @found = @departmentIds; SET @i += 1 END
+
+-- Collect what the plan cache recorded for this run's statements
+DECLARE @marker nvarchar(40) = CONCAT(N'/* perf:', @run, N':')
+INSERT INTO [dbo].[perfQueryTiming] ([runLabel], [queryName], [executions], [avgElapsedMs], [avgCpuMs], [avgLogicalReads], [queryPlan])
+SELECT @run,
+       SUBSTRING(st.[text], CHARINDEX(@marker, st.[text]) + LEN(@marker),
+                 CHARINDEX(N' */', st.[text], CHARINDEX(@marker, st.[text])) - CHARINDEX(@marker, st.[text]) - LEN(@marker)),
+       SUM(qs.execution_count),
+       SUM(qs.total_elapsed_time) / 1000.0 / SUM(qs.execution_count),
+       SUM(qs.total_worker_time) / 1000.0 / SUM(qs.execution_count),
+       SUM(qs.total_logical_reads) / SUM(qs.execution_count),
+       MAX(CAST(qp.query_plan AS nvarchar(max)))
+FROM sys.dm_exec_query_stats qs
+CROSS APPLY sys.dm_exec_sql_text(qs.[sql_handle]) st
+CROSS APPLY sys.dm_exec_query_plan(qs.plan_handle) qp
+WHERE CHARINDEX(@marker, st.[text]) > 0
+  AND st.[text] NOT LIKE N'%dm_exec_query_stats%'
+GROUP BY SUBSTRING(st.[text], CHARINDEX(@marker, st.[text]) + LEN(@marker),
+                   CHARINDEX(N' */', st.[text], CHARINDEX(@marker, st.[text])) - CHARINDEX(@marker, st.[text]) - LEN(@marker))
+
+SELECT [queryName], [executions], [avgElapsedMs], [avgCpuMs], [avgLogicalReads]
+FROM [dbo].[perfQueryTiming] WHERE [runLabel] = @run ORDER BY [queryName]
+GO
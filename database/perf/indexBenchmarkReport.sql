@@ -0,0 +1,33 @@
+/****** Before / after comparison for indexBenchmark.sql ******/
+-- One row per query: averages for both runs and the change in logical reads
+-- and elapsed time. Click a queryPlan cell in SSMS to open the cached plan.
+USE [employeeManagerDb]
+GO
+DECLARE @before varchar(20) = 'before'
+DECLARE @after varchar(20) = 'after'
+
+SELECT COALESCE(b.[queryName], a.[queryName]) AS [queryName],
+       b.[avgLogicalReads] AS [readsBefore],
+       a.[avgLogicalReads] AS [readsAfter],
+       CAST(100.0 * (a.[avgLogicalReads] - b.[avgLogicalReads]) / NULLIF(b.[avgLogicalReads], 0) AS decimal(7, 1)) AS [readsChangePct],
+       b.[avgElapsedMs] AS [msBefore],
+       a.[avgElapsedMs] AS [msAfter],
+       b.[avgCpuMs] AS [cpuMsBefore],
+       a.[avgCpuMs] AS [cpuMsAfter],
+       b.[queryPlan] AS [planBefore],
+       a.[queryPlan] AS [planAfter]
+FROM (SELECT * FROM [dbo].[perfQueryTiming] WHERE [runLabel] = @before) b
+FULL JOIN (SELECT * FROM [dbo].[perfQueryTiming] WHERE [runLabel] = @after) a ON a.[queryName] = b.[queryName]
+ORDER BY [queryName]
+
+-- Indexes now on the three tables, with size and how often each was used since the last restart
+SELECT OBJECT_NAME(i.[object_id]) AS [tableName], i.[name] AS [indexName], i.[type_desc], i.is_unique,
+       SUM(ps.used_page_count) * 8 AS [usedKb],
+       us.user_seeks, us.user_scans, us.user_lookups, us.user_updates
+FROM sys.indexes i
+JOIN sys.dm_db_partition_stats ps ON ps.[object_id] = i.[object_id] AND ps.index_id = i.index_id
+LEFT JOIN sys.dm_db_index_usage_stats us ON us.[object_id] = i.[object_id] AND us.index_id = i.index_id AND us.database_id = DB_ID()
+WHERE i.[object_id] IN (OBJECT_ID(N'dbo.employeeTbl'), OBJECT_ID(N'dbo.designationTbl'), OBJECT_ID(N'dbo.departmentTbl'))
+GROUP BY i.[object_id], i.[name], i.[type_desc], i.is_unique, us.user_seeks, us.user_scans, us.user_lookups, us.user_updates
+ORDER BY [tableName], [indexName]
+GO
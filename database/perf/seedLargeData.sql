@@ -0,0 +1,93 @@
+/****** Synthetic data for index / query-plan measurements ******/
+-- Adds @departments departments, @designationsPerDepartment designations each,
+-- and @employees employees spread evenly over them, in batches of @batchSize
+-- rows so the transaction log stays small. Everything it creates is tagged
+-- (names start with 'Seed ', emails end with '@seed.example.com') and can be
+-- removed with the cleanup block at the end.
+--
+-- Every seeded employee can log in with password 11111111 (BCrypt, work factor 11),
+-- so the login path can be load-tested too: seed1@seed.example.com, seed2@...
+--
+-- Run on a scratch copy of employeeManagerDb, never on real data.
+USE [employeeManagerDb]
+GO
+SET NOCOUNT ON
+GO
+DECLARE @departments int = 20
+DECLARE @designationsPerDepartment int = 10
+DECLARE @employees int = 200000
+DECLARE @batchSize int = 50000
+DECLARE @passwordHash varchar(100) = '$2a$11$HO.ILzncwHmLk0Ft8ZabauPmmfbgxJQGfXFn7oOIFLFOp4fOI.cBa'
+
+IF EXISTS (SELECT 1 FROM [dbo].[employeeTbl] WHERE [email] LIKE '%@seed.example.com')
+BEGIN
+	RAISERROR('Seed data is already present; run the cleanup block first.', 16, 1)
+	RETURN
+END
+
+-- 0..n-1, enough for one batch
+;WITH digits AS (SELECT v FROM (VALUES (0),(1),(2),(3),(4),(5),(6),(7),(8),(9)) d(v))
+SELECT TOP (@batchSize) n = ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) - 1
+INTO #tally
+FROM digits a CROSS JOIN digits b CROSS JOIN digits c CROSS JOIN digits d CROSS JOIN digits e CROSS JOIN digits f
+
+INSERT INTO [dbo].[departmentTbl] ([departmentName], [isActive])
+SELECT CONCAT('Seed Department ', n + 1), CASE WHEN n % 5 = 4 THEN 0 ELSE 1 END
+FROM #tally WHERE n < @departments
+
+INSERT INTO [dbo].[designationTbl] ([departmentId], [designationName])
+SELECT d.[departmentId], CONCAT('Seed Designation ', d.[departmentId], '-', t.n + 1)
+FROM [dbo].[departmentTbl] d
+CROSS JOIN #tally t
+WHERE d.[departmentName] LIKE 'Seed Department %' AND t.n < @designationsPerDepartment
+
+SELECT [designationId], slot = ROW_NUMBER() OVER (ORDER BY [designationId]) - 1
+INTO #designations
+FROM [dbo].[designationTbl]
+WHERE [designationName] LIKE 'Seed Designation %'
+DECLARE @designationCount int = (SELECT COUNT(*) FROM #designations)
+
+DECLARE @done int = 0
+DECLARE @started datetime2 = SYSDATETIME()
+WHILE @done < @employees
+BEGIN
+	INSERT INTO [dbo].[employeeTbl] ([name], [contactNo], [city], [state], [pincode], [altContactNo], [address],
+	                                 [designationId], [email], [password], [createDate], [modifiedData])
+	SELECT CONCAT(CHOOSE(k % 10 + 1, 'Nguyen', 'Tran', 'Le', 'Pham', 'Hoang', 'Vu', 'Vo', 'Dang', 'Bui', 'Do'), ' ',
+	              CHOOSE(k / 10 % 5 + 1, 'Van', 'Thi', 'Minh', 'Duc', 'Ngoc'), ' ',
+	              CHOOSE(k / 50 % 16 + 1, 'An', 'Binh', 'Chi', 'Dung', 'Hai', 'Hung', 'Lan', 'Linh',
+	                                      'Long', 'Mai', 'Nam', 'Phuong', 'Quang', 'Son', 'Trang', 'Tuan'), ' ', k),
+	       CONCAT('09', RIGHT(CONCAT('00000000', k), 8)),
+	       CHOOSE(k % 8 + 1, N'Ha Noi', N'Ho Chi Minh', N'Da Nang', N'Hai Phong', N'Can Tho', N'Hue', N'Nha Trang', N'Vung Tau'),
+	       CHOOSE(k % 8 + 1, 'HN', 'HCM', 'DN', 'HP', 'CT', 'TTH', 'KH', 'BRVT'),
+	       RIGHT(CONCAT('000000', 100000 + k % 900000), 6),
+	       CASE WHEN k % 3 = 0 THEN CONCAT('08', RIGHT(CONCAT('00000000', k), 8)) END,
+	       CONCAT(k % 500 + 1, ' Seed Street'),
+	       des.[designationId],
+	       CONCAT('seed', k, '@seed.example.com'),
+	       @passwordHash,
+	       -- Spread over the last ~3 years so "recent hires" matches a realistic slice
+	       DATEADD(MINUTE, -CAST(CAST(k AS bigint) * 7919 % 1576800 AS int), SYSUTCDATETIME()),
+	       NULL
+	FROM (SELECT k = @done + t.n + 1 FROM #tally t WHERE t.n < @employees - @done) rows
+	JOIN #designations des ON des.slot = rows.k % @designationCount
+
+	SET @done += @batchSize
+	PRINT CONCAT(CASE WHEN @done > @employees THEN @employees ELSE @done END, ' / ', @employees, ' employees')
+END
+
+-- Fresh statistics so the first plans are not built on the empty-table estimates
+UPDATE STATISTICS [dbo].[employeeTbl] WITH FULLSCAN
+UPDATE STATISTICS [dbo].[designationTbl] WITH FULLSCAN
+UPDATE STATISTICS [dbo].[departmentTbl] WITH FULLSCAN
+
+PRINT CONCAT('Seeded in ', DATEDIFF(SECOND, @started, SYSDATETIME()), ' s')
+DROP TABLE #tally
+DROP TABLE #designations
+GO
+
+/****** Cleanup (run separately) ******
+DELETE FROM [dbo].[employeeTbl] WHERE [email] LIKE '%@seed.example.com'
+DELETE FROM [dbo].[designationTbl] WHERE [designationName] LIKE 'Seed Designation %'
+DELETE FROM [dbo].[departmentTbl] WHERE [departmentName] LIKE 'Seed Department %'
+******/
@@ -0,0 +1,46 @@
+/****** Search benchmark: LIKE '%term%' vs prefix seek vs full-text ******/
+-- Run against a database with a realistic employeeTbl (tens of thousands of rows),
+-- with "Include Actual Execution Plan" on. Compare logical reads and CPU/elapsed
+-- time in the Messages tab: the Contains path scans the whole table, the prefix
+-- path seeks the IX_employeeTbl_* indexes, the full-text path uses the catalog.
+USE [employeeManagerDb]
+GO
+SET NOCOUNT ON
+GO
+DECLARE @term varchar(50) = 'Ng'
+DECLARE @prefix varchar(51) = @term + '%'
+DECLARE @contains varchar(52) = '%' + @term + '%'
+DECLARE @fulltext varchar(60) = '"' + @term + '*"'
+
+DBCC DROPCLEANBUFFERS WITH NO_INFOMSGS
+SET STATISTICS IO, TIME ON
+
+PRINT '--- Contains (legacy): LIKE ''%term%'' ---'
+SELECT TOP (10) [employeeId], [name], [email], [city], [contactNo]
+FROM [dbo].[employeeTbl]
+WHERE [name] LIKE @contains OR [email] LIKE @contains OR [city] LIKE @contains OR [contactNo] LIKE @contains
+ORDER BY [name], [employeeId]
+
+PRINT '--- Prefix: LIKE ''term%'' ---'
+SELECT TOP (10) [employeeId], [name], [email], [city], [contactNo]
+FROM [dbo].[employeeTbl]
+WHERE [name] LIKE @prefix OR [email] LIKE @prefix OR [city] LIKE @prefix OR [contactNo] LIKE @prefix
+ORDER BY CASE WHEN [name] = @term THEN 8 ELSE 0 END
+       + CASE WHEN [name] LIKE @prefix THEN 4 ELSE 0 END
+       + CASE WHEN [email] LIKE @prefix THEN 2 ELSE 0 END
+       + CASE WHEN [city] LIKE @prefix OR [contactNo] LIKE @prefix THEN 1 ELSE 0 END DESC,
+         [name], [employeeId]
+
+IF FULLTEXTSERVICEPROPERTY('IsFullTextInstalled') = 1
+   AND OBJECTPROPERTY(OBJECT_ID('dbo.employeeTbl'), 'TableHasActiveFulltextIndex') = 1
+BEGIN
+	PRINT '--- FullText: CONTAINS(col, ''"term*"'') ---'
+	SELECT TOP (10) [employeeId], [name], [email], [city], [contactNo]
+	FROM [dbo].[employeeTbl]
+	WHERE CONTAINS([name], @fulltext) OR CONTAINS([email], @fulltext)
+	   OR CONTAINS([city], @fulltext) OR CONTAINS([contactNo], @fulltext)
+	ORDER BY [name], [employeeId]
+END
+
+SET STATISTICS IO, TIME OFF
+GO